@@ -10,22 +10,35 @@ bl_info = {
 
 import importlib
 
-from . import properties
-from .operators import import_obj, animation, camera
-from . import ui
-
-MODULES = (
-    properties,
-    import_obj,
-    animation,
-    camera,
-    ui,
-)
+try:
+    import bpy
+except ImportError:
+    # Outside Blender only the bpy-free core/ package is usable (tooling, benchmarks).
+    bpy = None
+
+if bpy is not None:
+    from . import properties
+    from .operators import import_obj, animation, camera, flight_path, live, lod
+    from . import ui
+
+    MODULES = (
+        properties,
+        import_obj,
+        animation,
+        live,
+        flight_path,
+        lod,
+        camera,
+        ui,
+    )
+else:
+    MODULES = ()
 
 # Optional root-only reload support for development.
-if "bpy" in locals():
+if "_reload_guard" in locals():
     for _module in MODULES:
         importlib.reload(_module)
+_reload_guard = True
 
 
 classes = ()
@@ -1,7 +1,25 @@
-from . import animation_utils, camera_utils, csv_utils
+from . import (
+    animation_utils,
+    attitude_utils,
+    batch_utils,
+    camera_utils,
+    csv_utils,
+    keyframe_utils,
+    lod_utils,
+    mesh_utils,
+    rig_utils,
+    trajectory_utils,
+)
 
 __all__ = [
     "csv_utils",
     "animation_utils",
     "camera_utils",
+    "keyframe_utils",
+    "trajectory_utils",
+    "batch_utils",
+    "attitude_utils",
+    "mesh_utils",
+    "lod_utils",
+    "rig_utils",
 ]
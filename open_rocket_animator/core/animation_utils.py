@@ -1,4 +1,4 @@
-import math
+import numpy as np
 
 
 def get_anim_data(id_data):
@@ -38,7 +38,7 @@ def _get_channelbag_for_slot(strip, slot):
     return None
 
 
-def iter_slot_fcurves(id_data):
+def iter_slot_channelbags(id_data):
     action, slot = get_action_and_slot(id_data)
     if not action or not slot:
         return
@@ -49,10 +49,26 @@ def iter_slot_fcurves(id_data):
             if strip_type not in {"KEYFRAME", "KEYFRAME_STRIP"}:
                 continue
             channelbag = _get_channelbag_for_slot(strip, slot)
-            if not channelbag:
-                continue
-            for fcurve in getattr(channelbag, "fcurves", []):
-                yield fcurve
+            if channelbag:
+                yield channelbag
+
+
+def iter_slot_fcurves(id_data):
+    for channelbag in iter_slot_channelbags(id_data):
+        for fcurve in getattr(channelbag, "fcurves", []):
+            yield fcurve
+
+
+def remove_slot_fcurves(id_data, data_paths):
+    removed = 0
+    for channelbag in list(iter_slot_channelbags(id_data)):
+        fcurves = getattr(channelbag, "fcurves", None)
+        if fcurves is None:
+            continue
+        for fcurve in [fcurve for fcurve in fcurves if fcurve.data_path in data_paths]:
+            fcurves.remove(fcurve)
+            removed += 1
+    return removed
 
 
 def find_or_create_slot_fcurve(id_data, data_path, index):
@@ -78,8 +94,252 @@ def find_or_create_slot_fcurve(id_data, data_path, index):
     return None
 
 
-def compute_attitude_euler(vertical_deg, lateral_deg, roll_rad=0.0):
+def compute_attitude_euler_arrays(vertical_deg, lateral_deg, roll_rad=0.0):
     # Conservative mapping for this add-on: zenith -> X tilt, azimuth -> Z heading, roll -> Y axis.
-    vertical_rad = math.radians(vertical_deg)
-    lateral_rad = math.radians(lateral_deg)
-    return (vertical_rad, roll_rad, lateral_rad)
+    vertical_rad = np.radians(vertical_deg)
+    lateral_rad = np.radians(lateral_deg)
+    return vertical_rad, np.zeros_like(vertical_rad) + roll_rad, lateral_rad
+
+
+# Enum values of FCurveKeyframePoints.interpolation / handle types as exposed to foreach_set.
+INTERPOLATION_MODES = {
+    'CONSTANT': 0,
+    'LINEAR': 1,
+    'BEZIER': 2,
+}
+HANDLE_TYPES = {
+    'FREE': 0,
+    'AUTO': 1,
+    'VECTOR': 2,
+    'ALIGNED': 3,
+    'AUTO_CLAMPED': 4,
+}
+
+
+def ensure_action_and_slot(id_data):
+    import bpy
+
+    anim_data = get_anim_data(id_data) or id_data.animation_data_create()
+    action = getattr(anim_data, "action", None)
+    if action is None:
+        action = bpy.data.actions.new(name=f"{id_data.name}Action")
+        anim_data.action = action
+
+    slot = getattr(anim_data, "action_slot", None)
+    if slot is None:
+        slots = getattr(action, "slots", None)
+        if slots is not None:
+            slot = slots.new(id_type=id_data.id_type, name=id_data.name)
+            anim_data.action_slot = slot
+    return action, slot
+
+
+def _keyframes_unchanged(keyframe_points, co, interpolations, handles_left, handles_right):
+    existing_co = np.empty(len(co), dtype=np.float32)
+    keyframe_points.foreach_get("co", existing_co)
+    if not np.array_equal(existing_co, co):
+        return False
+    existing_interpolations = np.empty(len(interpolations), dtype=np.int32)
+    keyframe_points.foreach_get("interpolation", existing_interpolations)
+    if not np.array_equal(existing_interpolations, interpolations):
+        return False
+    for attribute, handles in (("handle_left", handles_left), ("handle_right", handles_right)):
+        if handles is None:
+            continue
+        existing_handles = np.empty(len(co), dtype=np.float32)
+        keyframe_points.foreach_get(attribute, existing_handles)
+        if not np.array_equal(existing_handles, handles):
+            return False
+    return True
+
+
+def resize_keyframe_points(keyframe_points, count):
+    # Reuses the existing points; only shrinking needs a clear, as there is no bulk remove.
+    existing = len(keyframe_points)
+    if existing > count:
+        keyframe_points.clear()
+        existing = 0
+    if count > existing:
+        keyframe_points.add(count - existing)
+
+
+def write_fcurve_keyframes(
+    fcurve,
+    frames,
+    values,
+    interpolation='BEZIER',
+    handle_type='AUTO_CLAMPED',
+    handles_left=None,
+    handles_right=None,
+):
+    # Overwrites the curve's keyframes in place, keeping the F-curve, its modifiers and
+    # its group. Curves whose keys already match are left untouched.
+    count = len(frames)
+    keyframe_points = fcurve.keyframe_points
+
+    # float32/int32 buffers match the RNA storage, which lets foreach_set copy them directly.
+    co = np.empty(count * 2, dtype=np.float32)
+    co[0::2] = frames
+    co[1::2] = values
+    interpolations = np.full(count, INTERPOLATION_MODES[interpolation], dtype=np.int32)
+    if handles_left is not None and handles_right is not None:
+        handles_left = np.asarray(handles_left, dtype=np.float32).ravel()
+        handles_right = np.asarray(handles_right, dtype=np.float32).ravel()
+    else:
+        handles_left = handles_right = None
+
+    if len(keyframe_points) == count and _keyframes_unchanged(
+        keyframe_points, co, interpolations, handles_left, handles_right
+    ):
+        return count
+
+    resize_keyframe_points(keyframe_points, count)
+    if count == 0:
+        return 0
+
+    keyframe_points.foreach_set("co", co)
+    keyframe_points.foreach_set("interpolation", interpolations)
+
+    if handles_left is not None:
+        # Explicit handles (e.g. from curve fitting) must not be recalculated by update().
+        handle_type = 'FREE'
+        keyframe_points.foreach_set("handle_left", handles_left)
+        keyframe_points.foreach_set("handle_right", handles_right)
+
+    handle_types = np.full(count, HANDLE_TYPES[handle_type], dtype=np.int32)
+    keyframe_points.foreach_set("handle_left_type", handle_types)
+    keyframe_points.foreach_set("handle_right_type", handle_types)
+
+    # Sorts points and recalculates automatic handles, matching what keyframe_insert leaves behind.
+    fcurve.update()
+    return count
+
+
+def write_channel_keyframe_sets(id_data, data_path, keyframe_sets, interpolation='BEZIER'):
+    # keyframe_sets holds one (frames, values) or (frames, values, handles_left, handles_right)
+    # tuple per array index, or None to leave that index alone.
+    ensure_action_and_slot(id_data)
+    written = 0
+    for index, keyframe_set in enumerate(keyframe_sets):
+        if keyframe_set is None:
+            continue
+        fcurve = find_or_create_slot_fcurve(id_data, data_path, index)
+        if fcurve is None:
+            raise RuntimeError(f"Could not create curve {data_path}[{index}] on '{id_data.name}'.")
+        frames, values = keyframe_set[0], keyframe_set[1]
+        handles = keyframe_set[2:4] if len(keyframe_set) >= 4 else (None, None)
+        written += write_fcurve_keyframes(
+            fcurve,
+            frames,
+            values,
+            interpolation=interpolation,
+            handles_left=handles[0],
+            handles_right=handles[1],
+        )
+    return written
+
+
+def write_keyframe_plan(id_data, plan):
+    # Returns (keys written, keys sampled) over every (data_path, keyframe_sets, interpolation, sampled) entry.
+    written = 0
+    sampled = 0
+    for data_path, keyframe_sets, interpolation, entry_sampled in plan:
+        written += write_channel_keyframe_sets(id_data, data_path, keyframe_sets, interpolation=interpolation)
+        sampled += entry_sampled
+    return written, sampled
+
+
+def prepare_animation_target(obj, plan):
+    # The object's rotation mode must match the curves being written, and custom
+    # property curves need their property to exist.
+    for data_path, keyframe_sets, _interpolation, _sampled in plan:
+        if data_path == "rotation_quaternion":
+            obj.rotation_mode = 'QUATERNION'
+        elif data_path == "rotation_euler" and obj.rotation_mode in {'QUATERNION', 'AXIS_ANGLE'}:
+            obj.rotation_mode = 'XYZ'
+        elif data_path.startswith('["') and data_path.endswith('"]'):
+            property_name = data_path[2:-2]
+            if property_name not in obj.keys():
+                keyframe_set = keyframe_sets[0] if keyframe_sets else None
+                obj[property_name] = float(keyframe_set[1][0]) if keyframe_set is not None and len(keyframe_set[1]) else 0.0
+
+
+# Data paths owned by the flight animation; anything else on the action, including
+# telemetry '["prop"]' curves, is left alone.
+FLIGHT_DATA_PATHS = frozenset({"location", "rotation_euler", "rotation_quaternion"})
+
+
+def reset_flight_animation(obj, plan, incremental=True):
+    # Incremental mode keeps the action, slot, other channels and modifiers, and only
+    # drops flight curves the new plan no longer writes; otherwise start from scratch.
+    if not incremental:
+        obj.animation_data_clear()
+        return
+    planned = {data_path for data_path, _keyframe_sets, _interpolation, _sampled in plan}
+    remove_slot_fcurves(obj, FLIGHT_DATA_PATHS - planned)
+
+
+# Per-key attributes saved by backup_slot_fcurves: (name, components, dtype).
+KEYFRAME_BACKUP_ATTRIBUTES = (
+    ("co", 2, np.float32),
+    ("handle_left", 2, np.float32),
+    ("handle_right", 2, np.float32),
+    ("interpolation", 1, np.int32),
+    ("handle_left_type", 1, np.int32),
+    ("handle_right_type", 1, np.int32),
+)
+
+
+def backup_slot_fcurves(id_data, curve_keys):
+    # {(data_path, index): keyframe arrays, or None for a curve that does not exist yet},
+    # so an interrupted in-place write can be undone with restore_slot_fcurves.
+    existing = {(fcurve.data_path, fcurve.array_index): fcurve for fcurve in iter_slot_fcurves(id_data)}
+    backup = {}
+    for key in curve_keys:
+        fcurve = existing.get(key)
+        if fcurve is None:
+            backup[key] = None
+            continue
+        keyframe_points = fcurve.keyframe_points
+        arrays = {}
+        for attribute, size, dtype in KEYFRAME_BACKUP_ATTRIBUTES:
+            arrays[attribute] = np.empty(len(keyframe_points) * size, dtype=dtype)
+            keyframe_points.foreach_get(attribute, arrays[attribute])
+        backup[key] = arrays
+    return backup
+
+
+def restore_slot_fcurves(id_data, backup):
+    # Puts back the keys saved by backup_slot_fcurves and removes curves created since.
+    for channelbag in list(iter_slot_channelbags(id_data)):
+        fcurves = getattr(channelbag, "fcurves", None)
+        if fcurves is None:
+            continue
+        for fcurve in list(fcurves):
+            key = (fcurve.data_path, fcurve.array_index)
+            if key not in backup:
+                continue
+            arrays = backup[key]
+            if arrays is None:
+                fcurves.remove(fcurve)
+                continue
+            count = len(arrays["co"]) // 2
+            resize_keyframe_points(fcurve.keyframe_points, count)
+            if count:
+                for attribute, _size, _dtype in KEYFRAME_BACKUP_ATTRIBUTES:
+                    fcurve.keyframe_points.foreach_set(attribute, arrays[attribute])
+            fcurve.update()
+
+
+EVENT_MARKER_PREFIX = "ORA "
+
+
+def sync_event_markers(scene, events, fps, frame_offset=0):
+    # Replaces the add-on's timeline markers with one per (name, time) flight event;
+    # markers the user added by hand are left alone.
+    markers = scene.timeline_markers
+    for marker in [marker for marker in markers if marker.name.startswith(EVENT_MARKER_PREFIX)]:
+        markers.remove(marker)
+    for name, event_time in events:
+        markers.new(EVENT_MARKER_PREFIX + name.replace('_', ' ').title(), frame=round(event_time * fps + frame_offset))
+    return len(events)
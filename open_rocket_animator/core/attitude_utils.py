@@ -0,0 +1,79 @@
+import numpy as np
+
+
+def axis_quaternions(axis, angles):
+    # (n, 4) w-x-y-z quaternions rotating by angles (radians) about a principal axis 0/1/2.
+    angles = np.asarray(angles, dtype=np.float64)
+    quats = np.zeros((len(angles), 4))
+    quats[:, 0] = np.cos(angles * 0.5)
+    quats[:, 1 + axis] = np.sin(angles * 0.5)
+    return quats
+
+
+def multiply_quaternions(a, b):
+    aw, ax, ay, az = a[:, 0], a[:, 1], a[:, 2], a[:, 3]
+    bw, bx, by, bz = b[:, 0], b[:, 1], b[:, 2], b[:, 3]
+    return np.stack(
+        (
+            aw * bw - ax * bx - ay * by - az * bz,
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by - ax * bz + ay * bw + az * bx,
+            aw * bz + ax * by - ay * bx + az * bw,
+        ),
+        axis=1,
+    )
+
+
+def euler_to_quaternions(x, y, z):
+    # Blender 'XYZ' Euler order: X is applied first, so q = qz * qy * qx.
+    return multiply_quaternions(
+        axis_quaternions(2, z),
+        multiply_quaternions(axis_quaternions(1, y), axis_quaternions(0, x)),
+    )
+
+
+def attitude_quaternions(vertical_deg, lateral_deg, roll_rad=None):
+    # Zenith tilts about X and azimuth heads about Z, as in compute_attitude_euler_arrays; roll
+    # turns the rocket about its own long (local Z) axis instead of being added to Euler Z.
+    quats = multiply_quaternions(
+        axis_quaternions(2, np.radians(lateral_deg)),
+        axis_quaternions(0, np.radians(vertical_deg)),
+    )
+    if roll_rad is not None:
+        quats = multiply_quaternions(quats, axis_quaternions(2, roll_rad))
+    return quats
+
+
+def make_quaternions_continuous(quats):
+    # q and -q are the same rotation; flip signs so consecutive samples stay in one
+    # hemisphere and F-curves never jump between the two.
+    quats = np.array(quats, dtype=np.float64)
+    if len(quats) < 2:
+        return quats
+    dots = np.einsum('ij,ij->i', quats[1:], quats[:-1])
+    flips = np.concatenate(([1.0], np.cumprod(np.where(dots < 0.0, -1.0, 1.0))))
+    return quats * flips[:, None]
+
+
+def unwrap_finite(values):
+    # np.unwrap over the finite samples only; a single NaN would otherwise poison every
+    # later sample of the channel. NaN samples stay NaN.
+    values = np.array(values, dtype=np.float64)
+    finite = np.isfinite(values)
+    values[finite] = np.unwrap(values[finite])
+    return values
+
+
+def quaternions_to_euler(quats):
+    # Blender 'XYZ' Euler angles for each quaternion, unwrapped per channel so the
+    # curves are continuous across the +-pi seams. Samples without attitude (NaN) stay NaN.
+    w, x, y, z = quats[:, 0], quats[:, 1], quats[:, 2], quats[:, 3]
+    r00 = 1.0 - 2.0 * (y * y + z * z)
+    r10 = 2.0 * (x * y + w * z)
+    r20 = 2.0 * (x * z - w * y)
+    r21 = 2.0 * (y * z + w * x)
+    r22 = 1.0 - 2.0 * (x * x + y * y)
+    euler_x = np.arctan2(r21, r22)
+    euler_y = np.arcsin(np.clip(-r20, -1.0, 1.0))
+    euler_z = np.arctan2(r10, r00)
+    return [unwrap_finite(channel) for channel in (euler_x, euler_y, euler_z)]
@@ -0,0 +1,52 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .trajectory_utils import compute_animation_plan
+
+
+def _timed_plan(settings):
+    # Runs in a pool worker; errors are returned rather than raised so one bad file
+    # does not abort the whole batch.
+    started = time.perf_counter()
+    result = {"csv_path": settings["csv_path"], "plan": None, "max_frame": 0, "warnings": [], "error": None}
+    try:
+        result["plan"], result["max_frame"], result["warnings"] = compute_animation_plan(settings)
+    except Exception as exc:
+        result["error"] = str(exc)
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def compute_batch_plans(jobs, base_settings, max_workers=None, use_processes=False):
+    # jobs is a sequence of (csv_path, settings overrides) pairs, e.g. the target's base_euler.
+    # Returns one result dict per job, in job order.
+    job_settings = []
+    for csv_path, overrides in jobs:
+        settings = dict(base_settings)
+        settings.update(overrides or {})
+        settings["csv_path"] = csv_path
+        job_settings.append(settings)
+    if not job_settings:
+        return []
+
+    # Threads share the GIL with the line splitting in the parser, so they mostly overlap
+    # file reads. Processes use every core; they are spawned, never forked from Blender,
+    # and only import the bpy-free core.
+    max_workers = max_workers or min(len(job_settings), os.cpu_count() or 1)
+    if use_processes:
+        executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    with executor:
+        return list(executor.map(_timed_plan, job_settings))
+
+
+def format_batch_timings(results):
+    lines = []
+    for result in results:
+        name = os.path.basename(result["csv_path"])
+        status = result["error"] or f"{sum(entry[3] for entry in result['plan'])} samples"
+        lines.append(f"{name}: {result['seconds'] * 1000.0:.1f} ms ({status})")
+    return lines
@@ -1,11 +1,14 @@
-from mathutils import Vector
+import math
 
-import bpy
+import numpy as np
 
 MOUNTED_CAMERA_NAME = "Rocket_Top_Camera"
+MOUNT_POINT_PROPERTY = "ora_mount_point"
 
 
 def get_rocket_object(props):
+    import bpy
+
     if getattr(props, "rocket_object", None):
         return props.rocket_object
     rocket_name = getattr(props, "rocket_name", "")
@@ -14,17 +17,143 @@ def get_rocket_object(props):
     return None
 
 
+MOUNT_POINTS = ('TOP', 'NOSE', 'TAIL', 'MID_BODY', 'FIN_TIP')
+# Fraction of the rocket length treated as "the end" when telling nose from tail.
+END_BAND = 0.05
+
+# rocket name -> (geometry key, {mount point: local position})
+_mount_cache = {}
+# scene name -> mounted camera object from the last lookup
+_mounted_camera_cache = {}
+
+
+def _mount_sources(rocket):
+    # The rocket mesh plus mesh children (e.g. instanced fins), skipping LOD copies.
+    sources = [rocket] if rocket.type == 'MESH' else []
+    sources.extend(
+        child for child in rocket.children
+        if child.type == 'MESH' and not child.name.startswith(rocket.name + "_LOD")
+    )
+    return sources
+
+
+def _bound_box_corners(obj):
+    return np.array([tuple(corner) for corner in obj.bound_box], dtype=np.float64)
+
+
+def _mount_key(rocket, sources):
+    # Cheap facts that change with the geometry: mesh datablock, vertex count, bounding
+    # box and each child's placement relative to the rocket. No vertex data is read, so
+    # a cache hit costs a few attribute lookups.
+    key = [_bound_box_corners(rocket).tobytes()]
+    rocket_inverse = np.linalg.inv(np.array(rocket.matrix_world, dtype=np.float64))
+    for obj in sources:
+        mesh = obj.data
+        entry = (mesh.as_pointer(), len(mesh.vertices), _bound_box_corners(obj).tobytes())
+        if obj is not rocket:
+            to_rocket = rocket_inverse @ np.array(obj.matrix_world, dtype=np.float64)
+            entry += (to_rocket.round(9).tobytes(),)
+        key.append(entry)
+    return tuple(key)
+
+
+def _mount_vertices(rocket, sources):
+    # (n, 3) float64 vertices of every source in rocket local space.
+    if not sources:
+        return _bound_box_corners(rocket)
+    blocks = []
+    rocket_inverse = np.linalg.inv(np.array(rocket.matrix_world, dtype=np.float64))
+    for obj in sources:
+        mesh = obj.data
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3).astype(np.float64)
+        if obj is not rocket:
+            to_rocket = rocket_inverse @ np.array(obj.matrix_world, dtype=np.float64)
+            co = co @ to_rocket[:3, :3].T + to_rocket[:3, 3]
+        blocks.append(co)
+    vertices = np.concatenate(blocks)
+    if not len(vertices):
+        vertices = np.zeros((1, 3))
+    return vertices
+
+
+def compute_mount_points(vertices, bound_box=None):
+    # Named mount points from rocket-local vertices. The long bounding-box axis is the
+    # body axis; the end with the narrower cross section is the nose. TOP is the top
+    # center of bound_box (the rocket's own box, without children) when given.
+    mins = vertices.min(axis=0)
+    maxs = vertices.max(axis=0)
+    center = (mins + maxs) * 0.5
+    extent = maxs - mins
+    axis = int(np.argmax(extent))
+    perpendicular = [index for index in range(3) if index != axis]
+
+    axial = vertices[:, axis]
+    band = extent[axis] * END_BAND
+    low_end = vertices[axial <= mins[axis] + band][:, perpendicular]
+    high_end = vertices[axial >= maxs[axis] - band][:, perpendicular]
+    nose_high = np.ptp(high_end, axis=0).max() <= np.ptp(low_end, axis=0).max()
+    # The nose cone is axisymmetric and finless, so its tip band locates the body axis.
+    nose_band = high_end if nose_high else low_end
+    center[perpendicular] = (nose_band.min(axis=0) + nose_band.max(axis=0)) * 0.5
+    radial = np.linalg.norm(vertices[:, perpendicular] - center[perpendicular], axis=1)
+
+    def on_axis(axial_value, radius=0.0):
+        point = center.copy()
+        point[axis] = axial_value
+        point[perpendicular[0]] += radius
+        return tuple(float(value) for value in point)
+
+    middle = np.abs(axial - center[axis]) <= extent[axis] * 0.25
+    body_radius = float(np.median(radial[middle])) if middle.any() else float(np.median(radial))
+    box = vertices if bound_box is None else bound_box
+    top = (box.min(axis=0) + box.max(axis=0)) * 0.5
+    top[2] = box[:, 2].max()
+    return {
+        'TOP': tuple(float(value) for value in top),
+        'NOSE': on_axis(maxs[axis] if nose_high else mins[axis]),
+        'TAIL': on_axis(mins[axis] if nose_high else maxs[axis]),
+        'MID_BODY': on_axis(center[axis], body_radius),
+        'FIN_TIP': tuple(float(value) for value in vertices[int(np.argmax(radial))]),
+    }
+
+
+def get_mount_points(rocket):
+    # Cached per rocket; vertices are only read when the geometry key changes. Edits that
+    # keep the vertex count and bounding box need clear_mount_cache(rocket).
+    sources = _mount_sources(rocket)
+    key = _mount_key(rocket, sources)
+    cached = _mount_cache.get(rocket.name)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    points = compute_mount_points(_mount_vertices(rocket, sources), _bound_box_corners(rocket))
+    _mount_cache[rocket.name] = (key, points)
+    return points
+
+
+def clear_mount_cache(rocket=None):
+    if rocket is None:
+        _mount_cache.clear()
+    else:
+        _mount_cache.pop(rocket.name, None)
+
+
 def compute_local_bbox_mount(rocket):
-    bbox_corners = [Vector(corner) for corner in rocket.bound_box]
-    min_x = min(v.x for v in bbox_corners)
-    max_x = max(v.x for v in bbox_corners)
-    min_y = min(v.y for v in bbox_corners)
-    max_y = max(v.y for v in bbox_corners)
-    max_z = max(v.z for v in bbox_corners)
-    return ((min_x + max_x) * 0.5, (min_y + max_y) * 0.5, max_z)
+    return get_mount_points(rocket)['TOP']
+
+
+def find_mounted_rocket_cameras(scene, rocket=None):
+    # Every camera placed by rebuild_rocket_camera_mount, optionally only on rocket.
+    return [
+        obj for obj in scene.objects
+        if obj.type == 'CAMERA' and MOUNT_POINT_PROPERTY in obj and (rocket is None or obj.parent == rocket)
+    ]
 
 
 def find_mounted_rocket_camera(scene):
+    import bpy
+
     cam_obj = scene.objects.get(MOUNTED_CAMERA_NAME)
     if cam_obj and cam_obj.type == 'CAMERA':
         return cam_obj
@@ -34,27 +163,53 @@ def find_mounted_rocket_camera(scene):
     return None
 
 
+def get_cached_mounted_camera(scene):
+    # find_mounted_rocket_camera without the name lookups while the camera lives.
+    camera_obj = _mounted_camera_cache.get(scene.name)
+    if camera_obj is not None:
+        try:
+            if camera_obj.type == 'CAMERA' and camera_obj.name in scene.objects:
+                return camera_obj
+        except ReferenceError:
+            # Freed by deletion or undo.
+            pass
+    camera_obj = find_mounted_rocket_camera(scene)
+    if camera_obj is None:
+        _mounted_camera_cache.pop(scene.name, None)
+    else:
+        _mounted_camera_cache[scene.name] = camera_obj
+    return camera_obj
+
+
 def apply_live_camera_offsets(camera_obj, props):
-    camera_obj.delta_location.x = props.offset_x_camera
-    camera_obj.delta_location.y = props.offset_y_camera
-    camera_obj.delta_location.z = props.offset_z_camera
+    # Each attribute is written at most once and only when it changes, so repeated calls
+    # with the same values do not tag the depsgraph.
+    location = (props.offset_x_camera, props.offset_y_camera, props.offset_z_camera)
+    if tuple(camera_obj.delta_location) != location:
+        camera_obj.delta_location = location
     if camera_obj.rotation_mode == 'QUATERNION' or camera_obj.rotation_mode == 'AXIS_ANGLE':
         camera_obj.rotation_mode = 'XYZ'
-    camera_obj.delta_rotation_euler.z = props.rotation_z_camera
+    if camera_obj.delta_rotation_euler.z != props.rotation_z_camera:
+        camera_obj.delta_rotation_euler.z = props.rotation_z_camera
 
     if props.adjust_clip_start:
         clip_start = max(abs(props.offset_z_camera), 0.001)
-        camera_obj.data.clip_start = clip_start
     else:
-        camera_obj.data.clip_start = 0.1
+        clip_start = 0.1
+    # clip_start is stored as float32, so an exact comparison would never match.
+    if not math.isclose(camera_obj.data.clip_start, clip_start, rel_tol=1e-6):
+        camera_obj.data.clip_start = clip_start
 
 
-def rebuild_rocket_camera_mount(camera_obj, rocket, props):
-    base_x, base_y, top_z = compute_local_bbox_mount(rocket)
+def rebuild_rocket_camera_mount(camera_obj, rocket, props, mount_point=None):
+    # The mount point is remembered on the camera so later rebuilds keep it.
+    mount_point = mount_point or camera_obj.get(MOUNT_POINT_PROPERTY) or getattr(props, "camera_mount_point", 'TOP')
+    camera_obj[MOUNT_POINT_PROPERTY] = mount_point
+    mount_x, mount_y, mount_z = get_mount_points(rocket)[mount_point]
     camera_obj.parent = rocket
-    camera_obj.location.x = base_x
-    camera_obj.location.y = base_y
-    camera_obj.location.z = top_z
+    camera_obj.location.x = mount_x
+    camera_obj.location.y = mount_y
+    camera_obj.location.z = mount_z
     camera_obj.rotation_euler = (0.0, 0.0, 0.0)
     camera_obj.delta_location = (0.0, 0.0, 0.0)
     camera_obj.delta_rotation_euler = (0.0, 0.0, 0.0)
@@ -1,5 +1,15 @@
 import csv
+import hashlib
+import json
 import math
+import os
+import re
+import tempfile
+import threading
+import unicodedata
+from collections import OrderedDict
+
+import numpy as np
 
 
 def read_openrocket_csv_lines(csv_path):
@@ -28,6 +38,31 @@ def detect_header_and_data_start(lines):
     return header, data_start
 
 
+# "# Event APOGEE occurred at t=12.345 seconds"
+EVENT_PATTERN = re.compile(r'^#\s*Event\s+(\w+)\s+occurred\s+at\s+t\s*=\s*([-+0-9.eE]+)', re.IGNORECASE)
+
+
+def parse_event_line(line):
+    # Returns (event name, time in seconds) for an OpenRocket event comment, else None.
+    match = EVENT_PATTERN.match(line.strip())
+    if match is None:
+        return None
+    event_time = safe_float(match.group(2))
+    if event_time is None:
+        return None
+    return match.group(1).upper(), event_time
+
+
+def find_flight_events(lines):
+    events = []
+    for line in lines:
+        if line.lstrip().startswith('#'):
+            event = parse_event_line(line)
+            if event is not None:
+                events.append(event)
+    return events
+
+
 def find_header_index(header, substring):
     lowered = substring.lower()
     for idx, col_name in enumerate(header):
@@ -56,3 +91,667 @@ def find_orientation_indices(header):
         "lateral": find_header_index(header, "Lateral orientation (azimuth)"),
         "roll_rate": find_header_index(header, "Roll rate"),
     }
+
+
+# Canonical flight channels: (unit the pipeline works in, normalized name aliases).
+# Aliases cover the English OpenRocket labels plus common localized exports; matching
+# ignores case, accents and the trailing "(unit)" suffix.
+CANONICAL_COLUMNS = {
+    "time": ('s', ("time", "tiempo", "zeit", "temps", "tempo")),
+    "x": ('m', ("position east of launch", "position east", "posicion este", "position ost", "position est")),
+    "y": ('m', ("position north of launch", "position north", "posicion norte", "position nord")),
+    "z": ('m', ("altitude", "altitud", "hohe", "altitudine")),
+    "vertical": ('deg', ("vertical orientation (zenith)", "vertical orientation", "orientacion vertical", "vertikale ausrichtung")),
+    "lateral": ('deg', ("lateral orientation (azimuth)", "lateral orientation", "orientacion lateral", "laterale ausrichtung")),
+    "roll_rate": ('deg/s', ("roll rate", "velocidad de alabeo", "tasa de alabeo", "rollrate", "taux de roulis")),
+    "velocity": ('m/s', ("total velocity", "velocidad total", "gesamtgeschwindigkeit", "vitesse totale")),
+}
+
+# Factor from each recognized unit to the canonical unit of its dimension.
+UNIT_FACTORS = {
+    's': ('s', 1.0),
+    'ms': ('s', 0.001),
+    'min': ('s', 60.0),
+    'm': ('m', 1.0),
+    'cm': ('m', 0.01),
+    'mm': ('m', 0.001),
+    'km': ('m', 1000.0),
+    'ft': ('m', 0.3048),
+    'in': ('m', 0.0254),
+    'yd': ('m', 0.9144),
+    'mi': ('m', 1609.344),
+    'nmi': ('m', 1852.0),
+    'deg': ('deg', 1.0),
+    '\u00b0': ('deg', 1.0),
+    'rad': ('deg', 180.0 / math.pi),
+    'arcmin': ('deg', 1.0 / 60.0),
+    'deg/s': ('deg/s', 1.0),
+    '\u00b0/s': ('deg/s', 1.0),
+    'rad/s': ('deg/s', 180.0 / math.pi),
+    'rpm': ('deg/s', 6.0),
+    'r/s': ('deg/s', 360.0),
+    'm/s': ('m/s', 1.0),
+    'km/h': ('m/s', 1.0 / 3.6),
+    'ft/s': ('m/s', 0.3048),
+    'mph': ('m/s', 0.44704),
+    'kt': ('m/s', 1852.0 / 3600.0),
+}
+
+
+def _normalize_label(text):
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(stripped.lower().split())
+
+
+def split_column_unit(col_name):
+    # "Altitude (ft)" -> ("Altitude", "ft"); the unit is the last parenthesized group.
+    name = col_name.strip()
+    if name.endswith(')') and '(' in name:
+        start = name.rfind('(')
+        unit = name[start + 1:-1].strip()
+        # UTF-8 exports decoded as latin-1 prefix the degree sign with a stray "A circumflex".
+        unit = unit.replace('\u00c2', '')
+        return name[:start].strip(), unit
+    return name, ''
+
+
+def unit_factor(unit, canonical_unit):
+    # Multiplier converting values in unit to canonical_unit; 1.0 when unknown.
+    known = UNIT_FACTORS.get(unit.lower()) or UNIT_FACTORS.get(unit)
+    if known is None or known[0] != canonical_unit:
+        return 1.0
+    return known[1]
+
+
+class HeaderIndex:
+    # One-time index of a CSV header: canonical channel -> (column index, header name,
+    # unit, factor to canonical unit). Lookups are dictionary hits.
+
+    def __init__(self, header):
+        self.header = list(header)
+        self.units = []
+        self.labels = []
+        for col_name in self.header:
+            base, unit = split_column_unit(col_name)
+            self.labels.append((_normalize_label(base), _normalize_label(col_name)))
+            self.units.append(unit)
+
+        self.channels = {}
+        for canonical, (canonical_unit, aliases) in CANONICAL_COLUMNS.items():
+            idx, _rank = self._match(self.labels, aliases)
+            if idx >= 0:
+                unit = self.units[idx]
+                self.channels[canonical] = (idx, self.header[idx], unit, unit_factor(unit, canonical_unit))
+
+    @staticmethod
+    def _match(labels, aliases):
+        # Exact label match beats a prefix match, which beats a substring match, so
+        # "Time" no longer resolves to the first column that merely contains "time".
+        # Returns (column index, rank), or (-1, None) when nothing matches.
+        best_idx = -1
+        best_rank = None
+        for idx, (base, full) in enumerate(labels):
+            for alias_rank, alias in enumerate(aliases):
+                if alias in (base, full):
+                    rank = (0, alias_rank)
+                elif base.startswith(alias):
+                    rank = (1, alias_rank)
+                elif alias in base:
+                    rank = (2, alias_rank)
+                else:
+                    continue
+                if best_rank is None or rank < best_rank:
+                    best_idx = idx
+                    best_rank = rank
+        return best_idx, best_rank
+
+    def find(self, query):
+        # Column index for a free-form query such as a telemetry column, or -1. A column
+        # whose label is exactly the query wins; then a query naming a canonical channel
+        # ("velocity", "altitud") takes that channel's column; then prefix, then
+        # substring matches. "velocity" therefore picks Total, not Vertical, velocity.
+        label = _normalize_label(query)
+        idx, rank = self._match(self.labels, (label,))
+        if rank is not None and rank[0] == 0:
+            return idx
+        for canonical, (_canonical_unit, aliases) in CANONICAL_COLUMNS.items():
+            if canonical in self.channels and (label == canonical or label in aliases):
+                return self.channels[canonical][0]
+        return idx
+
+    def index(self, canonical):
+        channel = self.channels.get(canonical)
+        return channel[0] if channel else -1
+
+    def name(self, canonical):
+        channel = self.channels.get(canonical)
+        return channel[1] if channel else None
+
+    def factor(self, canonical):
+        channel = self.channels.get(canonical)
+        return channel[3] if channel else 1.0
+
+
+_header_indices = {}
+# Batch plans resolve headers from worker threads.
+_header_indices_lock = threading.Lock()
+
+
+def build_header_index(header):
+    key = tuple(header)
+    with _header_indices_lock:
+        index = _header_indices.get(key)
+        if index is None:
+            if len(_header_indices) >= 32:
+                _header_indices.clear()
+            index = _header_indices[key] = HeaderIndex(header)
+        return index
+
+
+def find_flight_columns(header, animate_roll=False, animate_attitude=False):
+    # Maps flight roles to header names; missing columns map to None.
+    header_index = build_header_index(header)
+    roles = ["time", "x", "y", "z"]
+    if animate_roll:
+        roles.append("roll_rate")
+    if animate_attitude:
+        roles.extend(("vertical", "lateral"))
+    return {role: header_index.name(role) for role in roles}
+
+
+def _is_data_line(line):
+    stripped = line.strip()
+    return bool(stripped) and not stripped.startswith('#')
+
+
+def resolve_column_indices(header, column_names=None):
+    if column_names is None:
+        return {name: idx for idx, name in enumerate(header)}
+    resolved = {}
+    for name in column_names:
+        if name in header:
+            resolved[name] = header.index(name)
+    return resolved
+
+
+def _parse_data_lines(data_lines, indices):
+    names = list(indices)
+    usecols = [indices[name] for name in names]
+    if not data_lines or not usecols:
+        return {name: np.empty(0, dtype=np.float64) for name in names}
+
+    try:
+        # Fast path: the C parser handles well-formed exports in a single pass.
+        table = np.loadtxt(
+            data_lines,
+            delimiter=',',
+            comments='#',
+            usecols=usecols,
+            dtype=np.float64,
+            ndmin=2,
+        )
+        return {name: np.ascontiguousarray(table[:, pos]) for pos, name in enumerate(names)}
+    except ValueError:
+        pass
+
+    # Tolerant path for blank cells, ragged rows or stray text: split once, convert per column.
+    rows = [line.split(',') for line in data_lines]
+    columns = {}
+    for name, col_idx in zip(names, usecols):
+        cells = [row[col_idx].strip() if col_idx < len(row) else '' for row in rows]
+        try:
+            columns[name] = np.array([cell or 'nan' for cell in cells]).astype(np.float64)
+        except ValueError:
+            columns[name] = np.array([_float_or_nan(cell) for cell in cells], dtype=np.float64)
+    return columns
+
+
+def _float_or_nan(value):
+    number = safe_float(value)
+    return math.nan if number is None else number
+
+
+def parse_openrocket_columns(lines, header, data_start, column_names=None):
+    # Columns are keyed by header name; comment/event lines are skipped and unreadable
+    # cells become NaN. Each column is a float64 NumPy array.
+    indices = resolve_column_indices(header, column_names)
+    if data_start is None:
+        data_lines = []
+    else:
+        data_lines = [line for line in lines[data_start:] if _is_data_line(line)]
+
+    return _parse_data_lines(data_lines, indices)
+
+
+def valid_mask(*columns):
+    mask = np.ones(len(columns[0]), dtype=bool)
+    for column in columns:
+        mask &= ~np.isnan(column)
+    return mask
+
+
+DEFAULT_CHUNK_ROWS = 65536
+
+
+def open_openrocket_csv(csv_path):
+    return open(csv_path, 'r', encoding='latin-1')
+
+
+def scan_openrocket_header(handle, events=None):
+    # Streaming counterpart of detect_header_and_data_start: consumes the handle up to and
+    # including the first data line, which is returned so the caller can parse it.
+    # Event comments seen on the way are appended to events when a list is given.
+    header = None
+    for line in handle:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith('#'):
+            event = parse_event_line(stripped)
+            if event is not None:
+                if events is not None:
+                    events.append(event)
+            elif ',' in stripped:
+                header = [item.strip() for item in stripped.lstrip('#').strip().split(',')]
+            continue
+        if header is not None:
+            return header, line
+    return header, None
+
+
+def read_openrocket_header(csv_path):
+    with open_openrocket_csv(csv_path) as handle:
+        header, _first_line = scan_openrocket_header(handle)
+    return header
+
+
+def iter_openrocket_chunks(csv_path, column_names=None, chunk_rows=DEFAULT_CHUNK_ROWS, events=None):
+    # Yields (header, columns) per chunk of at most chunk_rows data rows, so only one
+    # chunk of text is ever held in memory regardless of the file size. Flight events
+    # are collected into events (when given) during the same pass.
+    with open_openrocket_csv(csv_path) as handle:
+        header, first_line = scan_openrocket_header(handle, events)
+        if header is None or first_line is None:
+            return
+        indices = resolve_column_indices(header, column_names)
+
+        batch = [first_line]
+        for line in handle:
+            if not _is_data_line(line):
+                if events is not None and line.lstrip().startswith('#'):
+                    event = parse_event_line(line)
+                    if event is not None:
+                        events.append(event)
+                continue
+            batch.append(line)
+            if len(batch) >= chunk_rows:
+                yield header, _parse_data_lines(batch, indices)
+                batch = []
+        if batch:
+            yield header, _parse_data_lines(batch, indices)
+
+
+def read_openrocket_events(csv_path):
+    # Comment-only scan for files whose columns are already cached; no float parsing.
+    with open_openrocket_csv(csv_path) as handle:
+        return find_flight_events(handle)
+
+
+def count_openrocket_lines(csv_path, block_size=1 << 20):
+    # Upper bound on the data rows: every line of the file, comments and header included.
+    # Counts newlines in binary blocks, so no text is decoded or kept.
+    count = 0
+    last = b'\n'
+    with open(csv_path, 'rb') as handle:
+        while True:
+            block = handle.read(block_size)
+            if not block:
+                break
+            count += block.count(b'\n')
+            last = block[-1:]
+    return count + (last != b'\n')
+
+
+def read_openrocket_columns(csv_path, column_names=None, chunk_rows=DEFAULT_CHUNK_ROWS, events=None):
+    # Chunks are copied into columns preallocated from the file's line count, so peak
+    # memory is the returned columns plus one chunk, never a second copy of the columns.
+    header = None
+    columns = None
+    filled = 0
+    for header, chunk in iter_openrocket_chunks(csv_path, column_names, chunk_rows, events):
+        rows = len(next(iter(chunk.values()))) if chunk else 0
+        if columns is None:
+            capacity = max(count_openrocket_lines(csv_path), rows)
+            columns = {name: np.empty(capacity, dtype=np.float64) for name in chunk}
+        elif columns and filled + rows > len(next(iter(columns.values()))):
+            # Only lone-CR line endings are undercounted; grow geometrically.
+            capacity = max(2 * (filled + rows), chunk_rows)
+            columns = {
+                name: np.concatenate((values[:filled], np.empty(capacity - filled)))
+                for name, values in columns.items()
+            }
+        for name, values in chunk.items():
+            columns[name][filled:filled + rows] = values
+        filled += rows
+
+    if header is None:
+        header = read_openrocket_header(csv_path)
+        if header is None:
+            return None, {}
+    if not columns:
+        return header, _parse_data_lines([], resolve_column_indices(header, column_names))
+    return header, {name: values[:filled] for name, values in columns.items()}
+
+
+def file_signature(csv_path):
+    stat = os.stat(csv_path)
+    return (os.path.abspath(csv_path), stat.st_size, stat.st_mtime_ns)
+
+
+def _freeze_columns(columns):
+    for values in columns.values():
+        values.flags.writeable = False
+    return columns
+
+
+class ParsedColumnCache:
+    # LRU cache of parsed columns keyed by (abspath, size, mtime_ns, column set).
+    # Cached arrays are shared between callers and are marked read-only. Safe to share
+    # between the threads of a batch; two threads missing on one file both parse it.
+
+    def __init__(self, max_entries=8, max_bytes=512 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._headers = OrderedDict()
+        self._events = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def make_key(signature, column_names):
+        names = None if column_names is None else tuple(sorted(set(column_names)))
+        return signature + (names,)
+
+    def get_header(self, signature):
+        with self._lock:
+            header = self._headers.get(signature)
+            if header is not None:
+                self._headers.move_to_end(signature)
+            return header
+
+    def put_header(self, signature, header):
+        with self._lock:
+            self._headers[signature] = header
+            self._headers.move_to_end(signature)
+            while len(self._headers) > max(self.max_entries, 1):
+                self._headers.popitem(last=False)
+
+    def get_events(self, signature):
+        with self._lock:
+            events = self._events.get(signature)
+            if events is not None:
+                self._events.move_to_end(signature)
+            return events
+
+    def put_events(self, signature, events):
+        with self._lock:
+            self._events[signature] = tuple(events)
+            self._events.move_to_end(signature)
+            while len(self._events) > max(self.max_entries, 1):
+                self._events.popitem(last=False)
+
+    def get(self, signature, column_names):
+        key = self.make_key(signature, column_names)
+        with self._lock:
+            if key not in self._entries and column_names is not None:
+                key = self._find_superset(signature, key[-1])
+            if key is None or key not in self._entries:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            header, columns, _nbytes = self._entries[key]
+        if column_names is not None:
+            columns = {name: columns[name] for name in column_names if name in columns}
+        return header, columns
+
+    def _find_superset(self, signature, names):
+        wanted = set(names)
+        for key, (header, _columns, _nbytes) in reversed(self._entries.items()):
+            if key[:-1] != signature:
+                continue
+            cached_names = key[-1]
+            if cached_names is None:
+                cached_names = header
+            if wanted.issubset(cached_names):
+                return key
+        return None
+
+    def put(self, signature, column_names, header, columns):
+        key = self.make_key(signature, column_names)
+        nbytes = sum(values.nbytes for values in columns.values())
+        if nbytes > self.max_bytes:
+            return
+        columns = _freeze_columns(columns)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (header, columns, nbytes)
+            self._nbytes += nbytes
+            self.put_header(signature, header)
+            while self._entries and (len(self._entries) > self.max_entries or self._nbytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self.evictions += 1
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[2]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._headers.clear()
+            self._events.clear()
+            self._nbytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._nbytes,
+            }
+
+
+PARSE_CACHE = ParsedColumnCache()
+
+
+SIDECAR_VERSION = 2
+SIDECAR_SUFFIX = ".ora-cache"
+
+
+def sidecar_cache_dir():
+    return os.path.join(tempfile.gettempdir(), "open_rocket_animator")
+
+
+def _sidecar_candidates(csv_path):
+    abspath = os.path.abspath(csv_path)
+    digest = hashlib.sha1(abspath.encode('utf-8', 'surrogateescape')).hexdigest()[:16]
+    fallback_name = f"{os.path.basename(abspath)}.{digest}{SIDECAR_SUFFIX}"
+    return (
+        abspath + SIDECAR_SUFFIX,
+        os.path.join(sidecar_cache_dir(), fallback_name),
+    )
+
+
+def _read_sidecar_meta(base_path):
+    try:
+        with open(base_path + ".json", 'r', encoding='utf-8') as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def _sidecar_matches(meta, signature):
+    return (
+        meta is not None
+        and meta.get("version") == SIDECAR_VERSION
+        and meta.get("source_size") == signature[1]
+        and meta.get("source_mtime_ns") == signature[2]
+    )
+
+
+def find_sidecar(csv_path, signature=None):
+    signature = signature or file_signature(csv_path)
+    for base_path in _sidecar_candidates(csv_path):
+        meta = _read_sidecar_meta(base_path)
+        if _sidecar_matches(meta, signature) and os.path.exists(base_path + ".npy"):
+            return base_path, meta
+    return None, None
+
+
+def read_sidecar(csv_path, column_names=None, signature=None):
+    # Memory-maps the column-major float64 block, so loads cost page faults, not parsing.
+    base_path, meta = find_sidecar(csv_path, signature)
+    if base_path is None:
+        return None
+
+    stored = meta["columns"]
+    if column_names is None:
+        # "All columns" may only be served by a sidecar that holds every one of them.
+        if not set(meta["header"]).issubset(stored):
+            return None
+    elif not set(column_names).issubset(stored):
+        return None
+    try:
+        block = np.load(base_path + ".npy", mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    if block.ndim != 2 or block.shape[0] != len(stored):
+        return None
+
+    wanted = stored if column_names is None else [name for name in column_names if name in stored]
+    positions = {name: pos for pos, name in enumerate(stored)}
+    return meta["header"], {name: block[positions[name]] for name in wanted}
+
+
+def write_sidecar(csv_path, header, columns, signature=None, events=()):
+    if not columns:
+        return None
+    signature = signature or file_signature(csv_path)
+    names = list(columns)
+    block = np.vstack([np.asarray(columns[name], dtype=np.float64) for name in names])
+    meta = {
+        "version": SIDECAR_VERSION,
+        "source_size": signature[1],
+        "source_mtime_ns": signature[2],
+        "header": header,
+        "columns": names,
+        "rows": int(block.shape[1]),
+        "events": [list(event) for event in events],
+    }
+
+    # Temporary names are unique per process and thread, so concurrent writers of one
+    # sidecar never interleave; the last os.replace wins with a complete file.
+    tmp_suffix = f".{os.getpid()}-{threading.get_ident()}.tmp"
+    for base_path in _sidecar_candidates(csv_path):
+        tmp_paths = (base_path + ".npy" + tmp_suffix, base_path + ".json" + tmp_suffix)
+        try:
+            os.makedirs(os.path.dirname(base_path), exist_ok=True)
+            # Write to temporary names first so readers never see a half-written sidecar.
+            with open(tmp_paths[0], 'wb') as handle:
+                np.save(handle, block)
+            with open(tmp_paths[1], 'w', encoding='utf-8') as handle:
+                json.dump(meta, handle)
+            os.replace(tmp_paths[0], base_path + ".npy")
+            os.replace(tmp_paths[1], base_path + ".json")
+            return base_path
+        except OSError:
+            for tmp_path in tmp_paths:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            continue
+    return None
+
+
+def load_openrocket_header(csv_path, cache=PARSE_CACHE, use_sidecar=True):
+    signature = file_signature(csv_path)
+    header = cache.get_header(signature)
+    if header is None and use_sidecar:
+        _base_path, meta = find_sidecar(csv_path, signature)
+        if meta is not None:
+            header = meta["header"]
+    if header is None:
+        header = read_openrocket_header(csv_path)
+    if header is not None:
+        cache.put_header(signature, header)
+    return header
+
+
+def load_openrocket_columns(csv_path, column_names=None, cache=PARSE_CACHE, use_sidecar=True):
+    # Lookup order: in-process cache, on-disk sidecar, then a full streaming parse.
+    signature = file_signature(csv_path)
+    cached = cache.get(signature, column_names)
+    if cached is not None:
+        return cached
+
+    if use_sidecar:
+        loaded = read_sidecar(csv_path, column_names, signature)
+        if loaded is not None:
+            cache.put(signature, column_names, *loaded)
+            return loaded
+
+    parse_names = column_names
+    if use_sidecar and column_names is not None:
+        # Widen the parse to the columns a valid sidecar already holds, so one
+        # sidecar keeps serving every column set seen for this file.
+        _base_path, meta = find_sidecar(csv_path, signature)
+        if meta is not None:
+            parse_names = list(dict.fromkeys(list(meta["columns"]) + list(column_names)))
+
+    events = []
+    header, columns = read_openrocket_columns(csv_path, parse_names, events=events)
+    if header is None:
+        return header, columns
+    if use_sidecar:
+        write_sidecar(csv_path, header, columns, signature, events)
+    cache.put(signature, parse_names, header, columns)
+    cache.put_events(signature, events)
+    if parse_names is not column_names:
+        columns = {name: columns[name] for name in column_names if name in columns}
+    return header, columns
+
+
+def load_openrocket_events(csv_path, cache=PARSE_CACHE, use_sidecar=True):
+    # Returns a tuple of (event name, time) sorted by time. Free after a column load,
+    # which records the events it streamed past.
+    signature = file_signature(csv_path)
+    events = cache.get_events(signature)
+    if events is None and use_sidecar:
+        _base_path, meta = find_sidecar(csv_path, signature)
+        if meta is not None:
+            events = [(name, float(event_time)) for name, event_time in meta.get("events", ())]
+    if events is None:
+        events = read_openrocket_events(csv_path)
+    events = tuple(sorted(events, key=lambda event: event[1]))
+    cache.put_events(signature, events)
+    return events
+
+
+def parse_cache_stats():
+    return PARSE_CACHE.stats()
+
+
+def clear_parse_cache():
+    PARSE_CACHE.clear()
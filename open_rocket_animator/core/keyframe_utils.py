@@ -0,0 +1,300 @@
+import numpy as np
+
+
+def _tolerance_slice(tolerance, start, end):
+    # Tolerance is a scalar or one value per sample (tighter around flight events).
+    if np.ndim(tolerance):
+        return tolerance[start + 1:end]
+    return tolerance
+
+
+def _segment_stack(count, anchors):
+    # Initial segments between forced keys; the ends are always kept.
+    bounds = [0, count - 1]
+    if anchors is not None:
+        bounds.extend(int(index) for index in anchors if 0 < index < count - 1)
+    bounds = sorted(set(bounds))
+    return bounds, list(zip(bounds[:-1], bounds[1:]))
+
+
+def decimate_indices(frames, values, tolerance, anchors=None):
+    # Ramer-Douglas-Peucker on the vertical (value) error of linear interpolation
+    # between kept keys. Uses an explicit stack so long flights cannot hit recursion limits.
+    # anchors are sample indices that always keep a key.
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    count = len(frames)
+    if count <= 2:
+        return np.arange(count)
+
+    keep = np.zeros(count, dtype=bool)
+    bounds, stack = _segment_stack(count, anchors)
+    keep[bounds] = True
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        inner_frames = frames[start + 1:end]
+        span = frames[end] - frames[start]
+        if span == 0.0:
+            factor = np.zeros_like(inner_frames)
+        else:
+            factor = (inner_frames - frames[start]) / span
+        expected = values[start] + (values[end] - values[start]) * factor
+        excess = np.abs(values[start + 1:end] - expected) - _tolerance_slice(tolerance, start, end)
+
+        worst = int(np.argmax(excess))
+        if excess[worst] > 0.0:
+            split = start + 1 + worst
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+
+    return np.flatnonzero(keep)
+
+
+def decimate_channel(frames, values, tolerance, anchors=None):
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    indices = decimate_indices(frames, values, tolerance, anchors)
+    return frames[indices], values[indices]
+
+
+def decimate_channels(frames, channels, tolerance, anchors=None):
+    # Channels are simplified independently, so a flat channel collapses to two keys
+    # even when its siblings need dense keys.
+    return [None if values is None else decimate_channel(frames, values, tolerance, anchors) for values in channels]
+
+
+def count_keys(keyframe_sets):
+    return sum(len(keyframe_set[0]) for keyframe_set in keyframe_sets if keyframe_set is not None)
+
+
+def _bezier_segment_fit(frames, values, start, end):
+    # With handles placed at the thirds of the segment, frame is linear in the Bezier
+    # parameter, so the inner handle values follow from a 2x2 linear least-squares fit.
+    f0, f1 = frames[start], frames[end]
+    v0, v1 = values[start], values[end]
+    span = f1 - f0
+    linear_c1 = v0 + (v1 - v0) / 3.0
+    linear_c2 = v0 + (v1 - v0) * 2.0 / 3.0
+
+    t = (frames[start + 1:end] - f0) / span if span else np.zeros(end - start - 1)
+    u = 1.0 - t
+    b1 = 3.0 * u * u * t
+    b2 = 3.0 * u * t * t
+    base = u * u * u * v0 + t * t * t * v1 + b1 * linear_c1 + b2 * linear_c2
+    residual = values[start + 1:end] - base
+
+    if not len(t):
+        return linear_c1, linear_c2, residual
+
+    basis = np.stack((b1, b2), axis=1)
+    # lstsq returns the minimum-norm correction, so 1-2 inner samples stay well posed.
+    correction, *_ = np.linalg.lstsq(basis, residual, rcond=None)
+    error = np.abs(residual - basis @ correction)
+    return linear_c1 + correction[0], linear_c2 + correction[1], error
+
+
+def fit_bezier_channel(frames, values, tolerance, anchors=None):
+    # Returns (frames, values, handles_left, handles_right) with one cubic Bezier segment
+    # per key interval, splitting at the worst sample until every segment fits.
+    # Segments never span an anchor, so event discontinuities stay sharp.
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    count = len(frames)
+    if count == 0:
+        empty = np.empty((0, 2))
+        return frames, values, empty, empty
+    if count == 1:
+        point = np.array([[frames[0], values[0]]])
+        return frames, values, point.copy(), point.copy()
+
+    segments = {}
+    _bounds, stack = _segment_stack(count, anchors)
+    while stack:
+        start, end = stack.pop()
+        c1, c2, error = _bezier_segment_fit(frames, values, start, end)
+        excess = error - _tolerance_slice(tolerance, start, end)
+        if len(excess) and excess.max() > 0.0:
+            # Split where the fitted curve misses the data the most.
+            split = start + 1 + int(np.argmax(excess))
+            stack.append((start, split))
+            stack.append((split, end))
+            continue
+        segments[start] = (end, c1, c2)
+
+    key_indices = []
+    index = 0
+    while index < count - 1:
+        key_indices.append(index)
+        index = segments[index][0]
+    key_indices.append(count - 1)
+
+    key_frames = frames[key_indices]
+    key_values = values[key_indices]
+    handles_left = np.empty((len(key_indices), 2))
+    handles_right = np.empty((len(key_indices), 2))
+    for pos, key_index in enumerate(key_indices[:-1]):
+        end, c1, c2 = segments[key_index]
+        third = (frames[end] - frames[key_index]) / 3.0
+        handles_right[pos] = (frames[key_index] + third, c1)
+        handles_left[pos + 1] = (frames[end] - third, c2)
+
+    # Outer handles mirror their inner counterparts so the ends stay smooth.
+    handles_left[0] = 2.0 * np.array((key_frames[0], key_values[0])) - handles_right[0]
+    handles_right[-1] = 2.0 * np.array((key_frames[-1], key_values[-1])) - handles_left[-1]
+    return key_frames, key_values, handles_left, handles_right
+
+
+def fit_bezier_channels(frames, channels, tolerance, anchors=None):
+    return [None if values is None else fit_bezier_channel(frames, values, tolerance, anchors) for values in channels]
+
+
+def select_step(count, step):
+    keep = np.zeros(count, dtype=bool)
+    keep[::max(int(step), 1)] = True
+    return keep
+
+
+def build_keyframe_sets(frames, channels, keyed, keyframe_mode='STEP', tolerance=0.0, anchors=None):
+    # Returns (keyframe_sets, interpolation, sampled key count). Samples that are NaN in
+    # any channel (outside a column's time range) are left unkeyed. tolerance may be a
+    # per-sample array and anchors a per-sample mask of forced keys.
+    keyed = keyed & ~np.any(np.isnan(np.vstack(channels)), axis=0)
+    frames = frames[keyed]
+    channels = [values[keyed] for values in channels]
+    sampled = len(frames) * len(channels)
+    if not len(frames):
+        return [None] * len(channels), 'BEZIER', 0
+
+    if np.ndim(tolerance):
+        tolerance = tolerance[keyed]
+    if anchors is not None:
+        anchors = np.flatnonzero(anchors[keyed])
+    if keyframe_mode == 'ADAPTIVE':
+        # Decimation bounds the error of straight segments, so keys must interpolate linearly.
+        return decimate_channels(frames, channels, tolerance, anchors), 'LINEAR', sampled
+    if keyframe_mode == 'BEZIER_FIT':
+        return fit_bezier_channels(frames, channels, tolerance, anchors), 'BEZIER', sampled
+    return [(frames, values) for values in channels], 'BEZIER', sampled
+
+
+# Reduction tolerance inside an event window, relative to the coast tolerance.
+EVENT_TOLERANCE_SCALE = 0.25
+
+
+def event_window_mask(frames, event_frames, window):
+    # Samples within window frames of any event.
+    frames = np.asarray(frames, dtype=np.float64)
+    event_frames = np.sort(np.asarray(event_frames, dtype=np.float64))
+    if not len(event_frames) or window <= 0.0:
+        return np.zeros(len(frames), dtype=bool)
+    right = np.clip(np.searchsorted(event_frames, frames), 0, len(event_frames) - 1)
+    left = np.clip(right - 1, 0, len(event_frames) - 1)
+    nearest = np.minimum(np.abs(frames - event_frames[left]), np.abs(frames - event_frames[right]))
+    return nearest <= window
+
+
+def event_anchor_mask(frames, event_frames):
+    # The sample closest to each event inside the sampled range.
+    frames = np.asarray(frames, dtype=np.float64)
+    anchors = np.zeros(len(frames), dtype=bool)
+    event_frames = np.asarray(event_frames, dtype=np.float64)
+    if not len(frames):
+        return anchors
+    event_frames = event_frames[(event_frames >= frames[0]) & (event_frames <= frames[-1])]
+    if not len(event_frames) or len(frames) < 2:
+        return anchors
+    right = np.clip(np.searchsorted(frames, event_frames), 1, len(frames) - 1)
+    left = right - 1
+    closer_left = np.abs(frames[left] - event_frames) <= np.abs(frames[right] - event_frames)
+    anchors[np.where(closer_left, left, right)] = True
+    return anchors
+
+
+def telemetry_data_path(property_name):
+    return f'["{property_name}"]'
+
+
+def plan_flight_keyframes(
+    samples,
+    keyframe_mode='STEP',
+    keyframe_step=1,
+    location_tolerance=0.0,
+    rotation_tolerance=0.0,
+    telemetry_tolerances=None,
+    event_frames=(),
+    event_window=0.0,
+):
+    # One entry per animated data path: (data_path, keyframe_sets, interpolation, sampled).
+    # Flight events (frame numbers) get a key of their own; within event_window frames of
+    # one, STEP keys every sample and the reducing modes tighten their tolerance, so the
+    # key budget goes to ignition, burnout and deployment rather than the coast.
+    frames = samples["frames"]
+    keyed = select_step(len(frames), keyframe_step if keyframe_mode == 'STEP' else 1)
+    anchors = None
+    scale = 1.0
+    if len(event_frames):
+        anchors = event_anchor_mask(frames, event_frames)
+        near_event = event_window_mask(frames, event_frames, event_window)
+        keyed = keyed | anchors
+        if keyframe_mode == 'STEP':
+            keyed = keyed | near_event
+        elif near_event.any():
+            scale = np.where(near_event, EVENT_TOLERANCE_SCALE, 1.0)
+
+    def keyframe_sets(channels, tolerance):
+        return build_keyframe_sets(frames, channels, keyed, keyframe_mode, tolerance * scale, anchors)
+
+    plan = [("location", *keyframe_sets(samples["location"], location_tolerance))]
+    if samples["rotation"] is not None:
+        rotation_path = samples.get("rotation_path", "rotation_euler")
+        if rotation_path == "rotation_quaternion":
+            # A quaternion component moves by at most half the rotation angle.
+            rotation_tolerance *= 0.5
+        plan.append((rotation_path, *keyframe_sets(samples["rotation"], rotation_tolerance)))
+
+    telemetry_tolerances = telemetry_tolerances or {}
+    for property_name, values in samples.get("telemetry", {}).items():
+        tolerance = telemetry_tolerances.get(property_name, 0.0)
+        plan.append((telemetry_data_path(property_name), *keyframe_sets([values], tolerance)))
+    return plan
+
+
+def decimate_polyline_indices(points, tolerance):
+    # Ramer-Douglas-Peucker on the perpendicular 3D distance to each chord; used for
+    # path geometry, where every axis shares the same tolerance.
+    points = np.asarray(points, dtype=np.float64)
+    count = len(points)
+    if count <= 2 or tolerance <= 0.0:
+        return np.arange(count)
+
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = True
+    keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        chord = points[end] - points[start]
+        length_sq = float(chord @ chord)
+        offsets = points[start + 1:end] - points[start]
+        if length_sq == 0.0:
+            distance_sq = np.einsum('ij,ij->i', offsets, offsets)
+        else:
+            factor = np.clip(offsets @ chord / length_sq, 0.0, 1.0)
+            residual = offsets - factor[:, None] * chord
+            distance_sq = np.einsum('ij,ij->i', residual, residual)
+
+        worst = int(np.argmax(distance_sq))
+        if distance_sq[worst] > tolerance * tolerance:
+            split = start + 1 + worst
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+
+    return np.flatnonzero(keep)
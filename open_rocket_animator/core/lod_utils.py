@@ -0,0 +1,113 @@
+import numpy as np
+
+from .animation_utils import iter_slot_fcurves, write_channel_keyframe_sets
+from .mesh_utils import decimate_mesh_data
+
+LOD_SUFFIX = "_LOD"
+# Fraction of the full model's faces kept by LOD1, LOD2, ...
+LOD_RATIOS = (0.25, 0.05)
+# Each level switches in at this multiple of the previous level's distance.
+LOD_DISTANCE_STEP = 4.0
+VISIBILITY_PATHS = ("hide_viewport", "hide_render")
+
+
+def lod_object_name(base_name, level):
+    return f"{base_name}{LOD_SUFFIX}{level}"
+
+
+def find_lod_objects(obj):
+    # [LOD0 (obj itself), LOD1, ...] following the naming convention of create_lod_objects.
+    lods = [obj]
+    children = {child.name: child for child in obj.children}
+    level = 1
+    while lod_object_name(obj.name, level) in children:
+        lods.append(children[lod_object_name(obj.name, level)])
+        level += 1
+    return lods
+
+
+def create_lod_objects(obj, levels, depsgraph):
+    # Adds decimated copies of obj.data as children sitting exactly on obj. Existing
+    # LOD children are replaced, so re-running with a different level count is safe.
+    import bpy
+
+    for old in find_lod_objects(obj)[1:]:
+        mesh = old.data
+        bpy.data.objects.remove(old)
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+    lods = []
+    for level, ratio in enumerate(LOD_RATIOS[:levels], start=1):
+        name = lod_object_name(obj.name, level)
+        lod = bpy.data.objects.new(name, obj.data.copy())
+        lod.data.name = name
+        for collection in obj.users_collection:
+            collection.objects.link(lod)
+        lod.parent = obj
+        lod.matrix_parent_inverse.identity()
+        lod.hide_select = True
+        # Hidden until keyed, so the levels never draw on top of each other.
+        lod.hide_viewport = True
+        lod.hide_render = True
+        decimate_mesh_data(lod, ratio, depsgraph)
+        lods.append(lod)
+    return lods
+
+
+def scale_lod_objects(obj, factor):
+    # Fix Scale companion: LOD children are hidden and unselectable, so transform_apply
+    # skips them. Scales their meshes like obj's and puts them back exactly on obj.
+    from mathutils import Matrix
+
+    for lod in find_lod_objects(obj)[1:]:
+        lod.data.transform(Matrix.Diagonal((factor, factor, factor, 1.0)))
+        lod.matrix_parent_inverse.identity()
+
+
+def lod_switch_distances(base_distance, lod_count):
+    # Camera distance at which each level beyond LOD0 takes over.
+    return base_distance * LOD_DISTANCE_STEP ** np.arange(max(lod_count - 1, 0), dtype=np.float64)
+
+
+def select_lod_levels(distances, switch_distances):
+    return np.searchsorted(switch_distances, distances, side='right')
+
+
+def camera_world_positions(camera, frames):
+    # World-space camera position per frame. Location curves are evaluated directly;
+    # otherwise the current world position is used for every frame.
+    positions = np.tile(np.asarray(camera.matrix_world.translation, dtype=np.float64), (len(frames), 1))
+    if camera.parent is not None or camera.animation_data is None:
+        return positions
+    for fcurve in iter_slot_fcurves(camera):
+        if fcurve.data_path == "location" and 0 <= fcurve.array_index < 3:
+            positions[:, fcurve.array_index] = [fcurve.evaluate(frame) for frame in frames]
+    return positions
+
+
+def camera_distances(rocket, camera, frames, rocket_positions):
+    if camera.parent is not None and camera.parent in find_lod_objects(rocket):
+        # Onboard camera: the distance never changes.
+        offset = np.linalg.norm(np.asarray(camera.matrix_local.translation, dtype=np.float64))
+        return np.full(len(frames), offset)
+    delta = rocket_positions - camera_world_positions(camera, frames)
+    return np.sqrt(np.einsum('ij,ij->i', delta, delta))
+
+
+def visibility_keyframes(frames, levels, level):
+    # One CONSTANT key per visibility change (1.0 hides the level), plus the first frame.
+    hidden = (levels != level).astype(np.float64)
+    changes = np.flatnonzero(np.diff(hidden)) + 1
+    keys = np.concatenate(([0], changes))
+    return frames[keys], hidden[keys]
+
+
+def key_lod_visibility(lods, frames, levels):
+    # Bulk-writes hide_viewport/hide_render for every level. Returns the key count.
+    written = 0
+    for level, lod in enumerate(lods):
+        keyframe_set = visibility_keyframes(frames, levels, level)
+        for data_path in VISIBILITY_PATHS:
+            written += write_channel_keyframe_sets(lod, data_path, [keyframe_set], interpolation='CONSTANT')
+    return written
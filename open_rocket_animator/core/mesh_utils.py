@@ -0,0 +1,204 @@
+import hashlib
+import time
+
+import numpy as np
+
+# Largest vertex distance (in mesh units, after scaling) for two parts to count as copies.
+INSTANCE_TOLERANCE = 1e-5
+
+
+def mesh_vertex_array(mesh):
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3).astype(np.float64)
+
+
+def mesh_topology_key(mesh):
+    # Parts can only share data when vertex count and face connectivity match exactly.
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    digest = hashlib.sha1(loop_totals.tobytes())
+    digest.update(loop_vertices.tobytes())
+    return len(mesh.vertices), len(mesh.polygons), digest.hexdigest()
+
+
+def count_mesh_vertices(objects, unique_data=False):
+    meshes = [obj.data for obj in objects if obj.type == 'MESH']
+    if unique_data:
+        meshes = list({mesh.name: mesh for mesh in meshes}.values())
+    return sum(len(mesh.vertices) for mesh in meshes)
+
+
+def rigid_fit(source, target):
+    # Kabsch: rotation and translation mapping source onto target (same vertex order),
+    # plus the largest remaining vertex distance.
+    source_center = source.mean(axis=0)
+    target_center = target.mean(axis=0)
+    covariance = (source - source_center).T @ (target - target_center)
+    u, _s, vt = np.linalg.svd(covariance)
+    sign = np.sign(np.linalg.det(vt.T @ u.T)) or 1.0
+    rotation = vt.T @ np.diag((1.0, 1.0, sign)) @ u.T
+    translation = target_center - rotation @ source_center
+    residual = target - (source @ rotation.T + translation)
+    return rotation, translation, float(np.sqrt(np.einsum('ij,ij->i', residual, residual).max()))
+
+
+def find_instance_groups(objects, tolerance=INSTANCE_TOLERANCE):
+    # Returns [(reference, [(duplicate, 4x4 local transform), ...]), ...] for parts whose
+    # geometry is a rigid copy of another part, such as fins rotated around the body.
+    buckets = {}
+    for obj in objects:
+        if obj.type == 'MESH' and len(obj.data.vertices) >= 3:
+            buckets.setdefault(mesh_topology_key(obj.data), []).append(obj)
+
+    groups = []
+    for candidates in buckets.values():
+        while len(candidates) > 1:
+            reference = candidates.pop(0)
+            reference_co = mesh_vertex_array(reference.data)
+            duplicates = []
+            remaining = []
+            for obj in candidates:
+                rotation, translation, error = rigid_fit(reference_co, mesh_vertex_array(obj.data))
+                if error > tolerance:
+                    remaining.append(obj)
+                    continue
+                transform = np.identity(4)
+                transform[:3, :3] = rotation
+                transform[:3, 3] = translation
+                duplicates.append((obj, transform))
+            if duplicates:
+                groups.append((reference, duplicates))
+            candidates = remaining
+    return groups
+
+
+def link_instances(groups):
+    # Points every duplicate at its reference mesh and moves the rigid offset into the
+    # object transform, so the viewport draws one mesh several times.
+    import bpy
+    from mathutils import Matrix
+
+    linked = 0
+    for reference, duplicates in groups:
+        for obj, transform in duplicates:
+            old_mesh = obj.data
+            obj.data = reference.data
+            obj.matrix_world = obj.matrix_world @ Matrix(transform.tolist())
+            if old_mesh.users == 0:
+                bpy.data.meshes.remove(old_mesh)
+            linked += 1
+    return linked
+
+
+def apply_object_scale(obj):
+    # Data-level equivalent of transform_apply(scale=True) for an unparented object.
+    from mathutils import Matrix
+
+    scale = tuple(obj.scale)
+    if scale == (1.0, 1.0, 1.0):
+        return
+    obj.data.transform(Matrix.Diagonal((*scale, 1.0)))
+    obj.scale = (1.0, 1.0, 1.0)
+
+
+def decimate_mesh_data(obj, ratio, depsgraph):
+    # Collapses obj.data to ratio of its faces through an evaluated Decimate modifier,
+    # without the operator stack. Every object sharing the mesh picks up the result.
+    import bpy
+
+    if ratio >= 1.0 or obj.type != 'MESH':
+        return obj.data
+    modifier = obj.modifiers.new(name="ORA_Decimate", type='DECIMATE')
+    modifier.ratio = ratio
+    modifier.use_collapse_triangulate = True
+    depsgraph.update()
+    decimated = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+    obj.modifiers.remove(modifier)
+
+    old_mesh = obj.data
+    decimated.name = old_mesh.name
+    old_mesh.user_remap(decimated)
+    bpy.data.meshes.remove(old_mesh)
+    return decimated
+
+
+def join_objects(scene, objects):
+    # join() merges into the active object's mesh in place, so the target must not share
+    # its mesh with instances: prefer a single-user part, else give it its own copy.
+    import bpy
+
+    if len(objects) < 2:
+        return objects[0]
+    target = next((obj for obj in objects if obj.data.users == 1), objects[0])
+    if target.data.users > 1:
+        target.data = target.data.copy()
+    with bpy.context.temp_override(
+        active_object=target,
+        selected_editable_objects=objects,
+        scene=scene,
+    ):
+        bpy.ops.object.join()
+    return target
+
+
+def parent_keep_transform(child, parent):
+    child.parent = parent
+    child.matrix_parent_inverse = parent.matrix_world.inverted()
+
+
+def import_rocket_model(scene, obj_path, scale=1.0, merge_parts=False, instance_parts=False, decimate_ratio=1.0):
+    # Imports an OBJ with scale applied by the importer and baked into the mesh data.
+    # Returns (main object, parts, report) where report holds vertex counts and timing.
+    import bpy
+
+    started = time.perf_counter()
+    before = set(bpy.data.objects)
+    bpy.ops.wm.obj_import(filepath=obj_path, global_scale=scale)
+    parts = [obj for obj in bpy.data.objects if obj not in before and obj.type == 'MESH']
+    if not parts:
+        raise RuntimeError(f"No mesh was imported from {obj_path}")
+    for part in parts:
+        apply_object_scale(part)
+    vertices_before = count_mesh_vertices(parts)
+
+    instanced = []
+    if instance_parts:
+        groups = find_instance_groups(parts)
+        link_instances(groups)
+        instanced = [obj for _reference, duplicates in groups for obj, _transform in duplicates]
+
+    if decimate_ratio < 1.0:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        # Shared meshes are decimated once through their first user.
+        for mesh_owner in {obj.data.name: obj for obj in parts}.values():
+            decimate_mesh_data(mesh_owner, decimate_ratio, depsgraph)
+
+    main = parts[0]
+    if merge_parts:
+        # Instances stay separate objects (joining would copy their data back) and
+        # ride along as children of the merged body.
+        body = [obj for obj in parts if obj not in instanced]
+        main = join_objects(scene, body)
+        parts = [main] + instanced
+        for obj in instanced:
+            parent_keep_transform(obj, main)
+
+    report = {
+        "parts": len(parts),
+        "instanced": len(instanced),
+        "vertices_before": vertices_before,
+        "vertices_after": count_mesh_vertices(parts, unique_data=True),
+        "seconds": time.perf_counter() - started,
+    }
+    return main, parts, report
+
+
+def format_import_report(report):
+    return (
+        f"Imported {report['parts']} part(s) in {report['seconds'] * 1000.0:.0f} ms: "
+        f"{report['vertices_before']} -> {report['vertices_after']} vertices"
+        f", {report['instanced']} instanced."
+    )
@@ -0,0 +1,142 @@
+import numpy as np
+
+from .animation_utils import remove_slot_fcurves, write_keyframe_plan
+from .camera_utils import MOUNTED_CAMERA_NAME
+from .keyframe_utils import build_keyframe_sets
+
+RIG_TYPES = ('GROUND', 'PAD', 'CHASE', 'ONBOARD')
+# Default object names per rig type; more cameras of a type get Blender's .001 suffixes.
+RIG_CAMERA_NAMES = {
+    'GROUND': "Ground_Camera",
+    'PAD': "Pad_Camera",
+    'CHASE': "Chase_Camera",
+    'ONBOARD': MOUNTED_CAMERA_NAME,
+}
+WORLD_UP = np.array((0.0, 0.0, 1.0))
+# Chase heading when the rocket never moves: level, so the camera stays above ground.
+DEFAULT_CHASE_HEADING = np.array((0.0, 1.0, 0.0))
+# Lens range used when zooming to hold the rocket at a constant size in frame.
+MIN_LENS = 12.0
+MAX_LENS = 2000.0
+
+
+def _normalize_rows(vectors):
+    lengths = np.linalg.norm(vectors, axis=1)
+    return vectors / np.where(lengths > 1e-12, lengths, 1.0)[:, None], lengths
+
+
+def look_at_euler(camera_positions, target_positions):
+    # XYZ Euler angles (radians, unwrapped over time) that aim a Blender camera (-Z
+    # forward, +Y up) from each camera position at its target, keeping the horizon level.
+    forward, _distance = _normalize_rows(np.asarray(target_positions) - np.asarray(camera_positions))
+    right, right_length = _normalize_rows(np.cross(forward, WORLD_UP))
+    # Looking straight up or down leaves the heading undefined; fall back to world +X.
+    right[right_length <= 1e-9] = (1.0, 0.0, 0.0)
+    up = np.cross(right, forward)
+
+    # Rotation matrix columns are (right, up, -forward); decompose R = Rz @ Ry @ Rx.
+    rot_x = np.arctan2(up[:, 2], -forward[:, 2])
+    rot_y = np.arcsin(np.clip(-right[:, 2], -1.0, 1.0))
+    rot_z = np.arctan2(right[:, 1], right[:, 0])
+    return np.stack([np.unwrap(angle) for angle in (rot_x, rot_y, rot_z)], axis=1)
+
+
+def framing_lens(distances, object_size, framing, sensor_width):
+    # Focal length (mm) that makes object_size span framing of the sensor width.
+    lens = framing * sensor_width * np.asarray(distances, dtype=np.float64) / max(object_size, 1e-6)
+    return np.clip(lens, MIN_LENS, MAX_LENS)
+
+
+def chase_positions(rocket_positions, distance, height):
+    # Trails the rocket along its direction of travel, offset up by height.
+    heading = np.gradient(rocket_positions, axis=0) if len(rocket_positions) > 1 else np.zeros_like(rocket_positions)
+    heading, speed = _normalize_rows(heading)
+    moving = speed > 1e-9
+    if not moving.any():
+        heading[:] = DEFAULT_CHASE_HEADING
+    else:
+        # Stationary frames hold the latest heading; on the pad (before any motion)
+        # that is the first valid one, so the camera already trails the launch.
+        first = int(np.argmax(moving))
+        source = np.maximum.accumulate(np.where(moving, np.arange(len(heading)), first))
+        heading = heading[source]
+    return rocket_positions - heading * distance + WORLD_UP * height
+
+
+def compute_rig_camera_path(
+    rig_type,
+    rocket_positions,
+    location=(0.0, 0.0, 0.0),
+    distance=20.0,
+    height=2.0,
+    lens=50.0,
+    framing=0.0,
+    object_size=1.0,
+    sensor_width=36.0,
+):
+    # Returns {"location": (n, 3), "rotation": (n, 3), "lens": (n,)} for a baked rig
+    # camera. framing > 0 zooms to hold the rocket at that fraction of the frame width.
+    count = len(rocket_positions)
+    if rig_type == 'CHASE':
+        positions = chase_positions(rocket_positions, distance, height)
+    else:
+        positions = np.tile(np.asarray(location, dtype=np.float64), (count, 1))
+
+    rotation = look_at_euler(positions, rocket_positions)
+    if framing > 0.0:
+        distances = np.linalg.norm(rocket_positions - positions, axis=1)
+        lenses = framing_lens(distances, object_size, framing, sensor_width)
+    else:
+        lenses = np.full(count, float(lens))
+    return {"location": positions, "rotation": rotation, "lens": lenses}
+
+
+def plan_rig_camera_keyframes(
+    frames,
+    path,
+    keyframe_mode='STEP',
+    location_tolerance=0.0,
+    rotation_tolerance=0.0,
+    lens_tolerance=0.01,
+):
+    # (object plan, camera data plan) in the keyframe plan format. Channels that never
+    # change are left out and returned as constants to assign directly.
+    keyed = np.ones(len(frames), dtype=bool)
+    object_plan = []
+    data_plan = []
+    constants = {}
+    channels = (
+        (object_plan, "location", path["location"], location_tolerance),
+        (object_plan, "rotation_euler", path["rotation"], rotation_tolerance),
+        (data_plan, "lens", path["lens"][:, None], lens_tolerance),
+    )
+    for plan, data_path, values, tolerance in channels:
+        if np.all(values == values[0]):
+            constants[data_path] = tuple(float(value) for value in values[0])
+            continue
+        columns = [values[:, axis] for axis in range(values.shape[1])]
+        plan.append((data_path, *build_keyframe_sets(frames, columns, keyed, keyframe_mode, tolerance)))
+    return object_plan, data_plan, constants
+
+
+def bake_rig_camera(camera_obj, object_plan, data_plan, constants):
+    # Replaces tracking constraints and earlier rig curves with the baked plan.
+    for constraint in list(camera_obj.constraints):
+        if constraint.type in {'TRACK_TO', 'DAMPED_TRACK', 'LOCKED_TRACK'}:
+            camera_obj.constraints.remove(constraint)
+    camera_obj.parent = None
+    if camera_obj.rotation_mode in {'QUATERNION', 'AXIS_ANGLE'}:
+        camera_obj.rotation_mode = 'XYZ'
+
+    remove_slot_fcurves(camera_obj, {"location", "rotation_euler"})
+    remove_slot_fcurves(camera_obj.data, {"lens"})
+    if "location" in constants:
+        camera_obj.location = constants["location"]
+    if "rotation_euler" in constants:
+        camera_obj.rotation_euler = constants["rotation_euler"]
+    if "lens" in constants:
+        camera_obj.data.lens = constants["lens"][0]
+
+    written, _sampled = write_keyframe_plan(camera_obj, object_plan)
+    data_written, _sampled = write_keyframe_plan(camera_obj.data, data_plan)
+    return written + data_written
@@ -0,0 +1,294 @@
+import math
+
+import numpy as np
+
+from .animation_utils import compute_attitude_euler_arrays
+from .attitude_utils import (
+    attitude_quaternions,
+    euler_to_quaternions,
+    make_quaternions_continuous,
+    quaternions_to_euler,
+)
+from .csv_utils import (
+    build_header_index,
+    find_flight_columns,
+    load_openrocket_columns,
+    load_openrocket_events,
+    load_openrocket_header,
+    valid_mask,
+)
+from .keyframe_utils import decimate_polyline_indices, plan_flight_keyframes
+
+
+def strictly_increasing(times):
+    # OpenRocket repeats timestamps around flight events; keep the last sample of each
+    # run, as the legacy keyframe_insert loop did when it overwrote a frame.
+    times = np.asarray(times, dtype=np.float64)
+    if len(times) < 2:
+        return np.ones(len(times), dtype=bool)
+    keep = np.empty(len(times), dtype=bool)
+    keep[:-1] = np.diff(times) > 0.0
+    keep[-1] = True
+    return keep
+
+
+def frame_grid(t_start, t_end, fps, frame_offset=0, subframes=1):
+    # Every output frame (or sub-frame) covered by [t_start, t_end], as frame numbers and
+    # the simulation times they sample.
+    subframes = max(int(subframes), 1)
+    rate = fps * subframes
+    first = math.ceil(t_start * rate - 1e-9)
+    last = math.floor(t_end * rate + 1e-9)
+    if last < first:
+        return np.empty(0), np.empty(0)
+    ticks = np.arange(first, last + 1, dtype=np.float64)
+    return ticks / subframes + frame_offset, ticks / rate
+
+
+def resample_channel(times, values, sample_times, period=None):
+    # Linear interpolation of one channel onto sample_times, ignoring NaN samples.
+    # Angles (period given) are unwrapped first so interpolation never crosses the seam.
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~(np.isnan(times) | np.isnan(values))
+    times = times[valid]
+    values = values[valid]
+    keep = strictly_increasing(times)
+    times = times[keep]
+    values = values[keep]
+    if not len(times):
+        return np.full(len(sample_times), np.nan)
+    if period is not None:
+        values = np.unwrap(values, period=period)
+    return np.interp(sample_times, times, values, left=np.nan, right=np.nan)
+
+
+def integrate_roll(times, roll_rate_deg):
+    # Cumulative trapezoidal integration of roll rate (deg/s) into an angle in radians,
+    # over every valid full-rate sample, so the result does not depend on which frames
+    # are keyed afterwards.
+    times = np.asarray(times, dtype=np.float64)
+    rates = np.radians(np.asarray(roll_rate_deg, dtype=np.float64))
+    angle = np.zeros(len(times))
+    if len(times) > 1:
+        np.cumsum(0.5 * (rates[1:] + rates[:-1]) * np.diff(times), out=angle[1:])
+    return angle
+
+
+TELEMETRY_PREFIX = "telemetry:"
+
+
+def load_flight_data(csv_path, animate_roll=False, animate_attitude=False, use_sidecar=True, telemetry=()):
+    # Returns ({role: float64 column}, warnings). Raises ValueError when the file
+    # cannot drive an animation at all. telemetry is a sequence of (column query,
+    # property name) pairs; each found column is loaded under "telemetry:<property>".
+    header = load_openrocket_header(csv_path, use_sidecar=use_sidecar)
+    if not header:
+        raise ValueError("CSV header was not found.")
+
+    names = find_flight_columns(header, animate_roll, animate_attitude)
+    if any(names[role] is None for role in ("time", "x", "y", "z")):
+        raise ValueError("Required position columns were not found in the CSV file.")
+
+    warnings = []
+    if animate_attitude and (names["vertical"] is None or names["lateral"] is None):
+        warnings.append("Attitude columns not found. Continuing without attitude animation.")
+        names.pop("vertical")
+        names.pop("lateral")
+    if animate_roll and names["roll_rate"] is None:
+        names.pop("roll_rate")
+
+    header_index = build_header_index(header)
+    for column_query, property_name in telemetry:
+        idx = header_index.find(column_query)
+        if idx < 0:
+            warnings.append(f"Telemetry column '{column_query}' not found. Skipping '{property_name}'.")
+            continue
+        names[TELEMETRY_PREFIX + property_name] = header[idx]
+
+    _header, columns = load_openrocket_columns(csv_path, list(set(names.values())), use_sidecar=use_sidecar)
+    if not len(columns.get(names["time"], ())):
+        raise ValueError("No data rows were found in the CSV file.")
+
+    # Imperial or radian exports are scaled to meters, degrees and seconds here, so the
+    # cached and sidecar columns stay exactly as they appear in the file.
+    flight = {}
+    for role, name in names.items():
+        column = np.asarray(columns[name], dtype=np.float64)
+        factor = header_index.factor(role)
+        flight[role] = column * factor if factor != 1.0 else column
+    return flight, warnings
+
+
+def event_frames(events, fps, frame_offset=0):
+    # Frame number of each (name, time) event on the same grid frame_grid uses.
+    return np.array([event_time * fps + frame_offset for _name, event_time in events], dtype=np.float64)
+
+
+def sample_flight(flight, fps, frame_offset=0, subframes=1, base_euler=(0.0, 0.0, 0.0), rotation_mode='EULER'):
+    # Interpolates every channel onto the exact frame grid, so each output frame gets
+    # exactly one deterministic sample before anything is keyed.
+    # rotation_mode: 'EULER' (legacy mapping), 'QUATERNION' or 'EULER_UNWRAPPED' (Euler
+    # angles derived from the quaternion pipeline, continuous across wraps).
+    times = flight["time"]
+    position_valid = valid_mask(times, flight["x"], flight["y"], flight["z"])
+    if not position_valid.any():
+        raise ValueError("No valid position rows were found in the CSV file.")
+
+    valid_times = times[position_valid]
+    frames, sample_times = frame_grid(valid_times[0], valid_times[-1], fps, frame_offset, subframes)
+    if not len(frames):
+        raise ValueError("The CSV time range does not cover a single frame.")
+
+    location = [
+        resample_channel(valid_times, flight[role][position_valid], sample_times)
+        for role in ("x", "y", "z")
+    ]
+
+    roll = None
+    if "roll_rate" in flight:
+        roll_valid = valid_mask(times, flight["roll_rate"])
+        if roll_valid.any():
+            roll_times = times[roll_valid]
+            roll = resample_channel(roll_times, integrate_roll(roll_times, flight["roll_rate"][roll_valid]), sample_times)
+
+    rotation = None
+    attitude = "vertical" in flight and "lateral" in flight
+    if attitude:
+        vertical = resample_channel(times, flight["vertical"], sample_times, period=360.0)
+        lateral = resample_channel(times, flight["lateral"], sample_times, period=360.0)
+
+    if rotation_mode != 'EULER' and (attitude or roll is not None):
+        if attitude:
+            quats = attitude_quaternions(vertical, lateral, None if roll is None else np.nan_to_num(roll))
+        else:
+            count = len(frames)
+            quats = euler_to_quaternions(np.full(count, base_euler[0]), np.full(count, base_euler[1]), roll)
+        quats = make_quaternions_continuous(quats)
+        if rotation_mode == 'QUATERNION':
+            rotation = [quats[:, axis] for axis in range(4)]
+        else:
+            rotation = quaternions_to_euler(quats)
+    elif attitude:
+        rotation = list(compute_attitude_euler_arrays(vertical, lateral))
+        if roll is not None:
+            # Keep legacy roll axis behavior: roll is applied to Euler Z.
+            rotation[2] = rotation[2] + np.nan_to_num(roll)
+    elif roll is not None:
+        rotation = [np.full(len(frames), base_euler[0]), np.full(len(frames), base_euler[1]), roll]
+
+    # Extra telemetry channels share the frame grid, so they key through the same writer.
+    telemetry = {
+        role[len(TELEMETRY_PREFIX):]: resample_channel(times, values, sample_times)
+        for role, values in flight.items()
+        if role.startswith(TELEMETRY_PREFIX)
+    }
+
+    return {
+        "frames": frames,
+        "sample_times": sample_times,
+        "location": location,
+        "rotation": rotation,
+        "telemetry": telemetry,
+        "rotation_path": "rotation_quaternion" if rotation_mode == 'QUATERNION' else "rotation_euler",
+    }
+
+
+def compute_animation_plan(settings):
+    # Parse, resample and reduce one CSV. Returns (plan, max_frame, warnings).
+    flight, warnings = load_flight_data(
+        settings["csv_path"],
+        settings["animate_roll"],
+        settings["animate_attitude"],
+        settings["use_sidecar"],
+        [(channel["column"], channel["property"]) for channel in settings.get("telemetry", ())],
+    )
+    samples = sample_flight(
+        flight,
+        settings["fps"],
+        settings["frame_offset"],
+        settings["subframes"],
+        settings["base_euler"],
+        settings["rotation_mode"],
+    )
+    plan = plan_flight_keyframes(
+        samples,
+        settings["keyframe_mode"],
+        settings["keyframe_step"],
+        settings["location_tolerance"],
+        settings["rotation_tolerance"],
+        {channel["property"]: channel["tolerance"] for channel in settings.get("telemetry", ())},
+        *settings_event_frames(settings),
+    )
+    return plan, math.ceil(samples["frames"][-1]), warnings
+
+
+def settings_event_frames(settings):
+    # (event frame numbers, event window in frames) for plan_flight_keyframes. The window
+    # setting is in seconds; 0 keeps the uniform key density and skips the event lookup.
+    event_window = settings.get("event_window", 0.0)
+    events = ()
+    if event_window > 0.0:
+        events = load_openrocket_events(settings["csv_path"], use_sidecar=settings["use_sidecar"])
+    return event_frames(events, settings["fps"], settings["frame_offset"]), event_window * settings["fps"]
+
+
+def pack_samples(samples):
+    # Stacks the sampled channels into one (channels, frames) float64 block for fast
+    # per-frame evaluation: 3 location rows, then the rotation rows if any.
+    rows = list(samples["location"])
+    if samples["rotation"] is not None:
+        rows.extend(samples["rotation"])
+    return np.ascontiguousarray(samples["frames"], dtype=np.float64), np.vstack(rows)
+
+
+def evaluate_packed_samples(frames, block, frame):
+    # Binary search for the bracketing samples, then one linear blend over all channels.
+    # Frames outside the sampled range hold the first/last sample.
+    if frame <= frames[0]:
+        return block[:, 0]
+    if frame >= frames[-1]:
+        return block[:, -1]
+    upper = int(np.searchsorted(frames, frame, side='right'))
+    lower = upper - 1
+    factor = (frame - frames[lower]) / (frames[upper] - frames[lower])
+    return block[:, lower] + (block[:, upper] - block[:, lower]) * factor
+
+
+def build_flight_path(csv_path, tolerance=0.0, use_sidecar=True):
+    # Returns {"points": (n, 3) float32, attribute name: (n,) float32} for every valid
+    # position row, optionally simplified to within tolerance meters.
+    header = load_openrocket_header(csv_path, use_sidecar=use_sidecar)
+    if not header:
+        raise ValueError("CSV header was not found.")
+    names = find_flight_columns(header)
+    if any(name is None for name in names.values()):
+        raise ValueError("Required position columns were not found in the CSV file.")
+
+    header_index = build_header_index(header)
+    attribute_names = {"time": names["time"], "altitude": names["z"]}
+    attribute_roles = {"time": "time", "altitude": "z", "velocity": "velocity"}
+    if header_index.name("velocity") is not None:
+        attribute_names["velocity"] = header_index.name("velocity")
+
+    wanted = set(names.values()) | set(attribute_names.values())
+    _header, columns = load_openrocket_columns(csv_path, list(wanted), use_sidecar=use_sidecar)
+    position_columns = [
+        np.asarray(columns[names[role]], dtype=np.float64) * header_index.factor(role) for role in ("x", "y", "z")
+    ]
+    valid = valid_mask(np.asarray(columns[names["time"]], dtype=np.float64), *position_columns)
+    points = np.stack([column[valid] for column in position_columns], axis=1)
+
+    indices = decimate_polyline_indices(points, tolerance)
+    path = {"points": points[indices].astype(np.float32)}
+    for attribute, name in attribute_names.items():
+        column = np.asarray(columns[name], dtype=np.float64)[valid][indices]
+        path[attribute] = (column * header_index.factor(attribute_roles[attribute])).astype(np.float32)
+    return path
+
+
+def sample_flight_positions(csv_path, fps, frame_offset=0, use_sidecar=True):
+    # Whole-frame grid and (n, 3) world positions, matching the location keys.
+    flight, _warnings = load_flight_data(csv_path, use_sidecar=use_sidecar)
+    samples = sample_flight(flight, fps, frame_offset)
+    return samples["frames"], np.stack(samples["location"], axis=1)
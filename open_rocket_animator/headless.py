@@ -0,0 +1,211 @@
+# Scriptable CSV -> animated .blend pipeline for background/render-farm use:
+#
+#   blender -b --python-expr "import sys; from open_rocket_animator import headless; sys.exit(headless.main())" -- \
+#       --obj rocket.obj --csv flight.csv --output shot.blend
+#
+# or, equivalently, run the package as __main__ through runpy with the same arguments.
+# main() returns the exit status (1 on failure); --python-expr discards return values,
+# so it is passed to sys.exit for Blender to exit with it.
+#
+# It drives core/ directly and never touches scene.ora_props or the active object.
+
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import bpy
+
+from .core.animation_utils import prepare_animation_target, sync_event_markers, write_keyframe_plan
+from .core.camera_utils import MOUNTED_CAMERA_NAME, rebuild_rocket_camera_mount
+from .core.csv_utils import load_openrocket_events
+from .core.mesh_utils import format_import_report, import_rocket_model
+from .core.rig_utils import RIG_CAMERA_NAMES, bake_rig_camera, compute_rig_camera_path, plan_rig_camera_keyframes
+from .core.trajectory_utils import compute_animation_plan, sample_flight_positions
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog="open_rocket_animator",
+        description="Import an OpenRocket OBJ, animate it from a CSV and save a .blend.",
+    )
+    parser.add_argument("--csv", required=True, help="OpenRocket CSV simulation export")
+    parser.add_argument("--output", required=True, help="Path of the .blend file to write")
+    parser.add_argument("--obj", help="OpenRocket OBJ export; an Empty is animated when omitted")
+    parser.add_argument("--empty-scene", action="store_true", help="Start from an empty scene")
+    parser.add_argument("--scale", type=float, default=0.001, help="Scale applied to the imported mesh")
+    parser.add_argument("--instance-parts", action="store_true", help="Share one mesh between identical parts")
+    parser.add_argument("--decimate", type=float, default=1.0, help="Fraction of faces kept on import")
+    parser.add_argument("--fps", type=int, help="Scene frame rate (defaults to the scene's)")
+    parser.add_argument("--frame-offset", type=int, default=0)
+    parser.add_argument("--samples-per-frame", type=int, default=1)
+    parser.add_argument("--keyframe-mode", choices=("STEP", "ADAPTIVE", "BEZIER_FIT"), default='STEP')
+    parser.add_argument("--keyframe-step", type=int, default=1)
+    parser.add_argument("--location-tolerance", type=float, default=0.01)
+    parser.add_argument("--rotation-tolerance", type=float, default=0.0017453292519943296)
+    parser.add_argument("--event-window", type=float, default=0.5, help="Seconds keyed densely around flight events")
+    parser.add_argument("--no-event-markers", action="store_true", help="Do not add timeline markers for flight events")
+    parser.add_argument("--roll", action="store_true", help="Animate roll from the roll rate column")
+    parser.add_argument("--attitude", action="store_true", help="Animate attitude from the orientation columns")
+    parser.add_argument(
+        "--telemetry",
+        nargs=2,
+        action="append",
+        default=[],
+        metavar=("COLUMN", "PROPERTY"),
+        help="Animate a CSV column onto a custom property (repeatable)",
+    )
+    parser.add_argument("--rotation-output", choices=("EULER", "EULER_UNWRAPPED", "QUATERNION"), default='EULER')
+    parser.add_argument("--no-sidecar", action="store_true", help="Do not read or write the parsed CSV sidecar")
+    parser.add_argument("--camera", choices=("none", "onboard", "track", "chase"), default="none")
+    parser.add_argument("--camera-offset", type=float, nargs=3, default=(-0.05, 0.0, 0.05), metavar=("X", "Y", "Z"))
+    parser.add_argument("--track-location", type=float, nargs=3, default=(-50.0, -50.0, 2.0), metavar=("X", "Y", "Z"))
+    return parser
+
+
+def _script_argv():
+    # Blender passes script arguments after a bare "--".
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return sys.argv[1:]
+
+
+def import_rocket(scene, obj_path, scale, instance_parts=False, decimate_ratio=1.0):
+    # Parts are always merged so a single object carries the animation; instanced parts
+    # are parented to it.
+    rocket, _parts, report = import_rocket_model(
+        scene,
+        obj_path,
+        scale=scale,
+        merge_parts=True,
+        instance_parts=instance_parts,
+        decimate_ratio=decimate_ratio,
+    )
+    print(f"OpenRocket Animator: {format_import_report(report)}")
+    return rocket
+
+
+def create_target_empty(scene, name="Rocket"):
+    obj = bpy.data.objects.new(name, None)
+    scene.collection.objects.link(obj)
+    return obj
+
+
+def add_onboard_camera(scene, rocket, offset):
+    cam_data = bpy.data.cameras.new(name=MOUNTED_CAMERA_NAME)
+    camera_obj = bpy.data.objects.new(MOUNTED_CAMERA_NAME, cam_data)
+    scene.collection.objects.link(camera_obj)
+    mount_props = SimpleNamespace(
+        offset_x_camera=offset[0],
+        offset_y_camera=offset[1],
+        offset_z_camera=offset[2],
+        rotation_z_camera=0.0,
+        adjust_clip_start=True,
+    )
+    rebuild_rocket_camera_mount(camera_obj, rocket, mount_props)
+    scene.camera = camera_obj
+    return camera_obj
+
+
+def add_baked_camera(scene, settings, rig_type, location=(0.0, 0.0, 0.0)):
+    # Aim (and for chase, move) is baked to keyframes, so farm renders never evaluate
+    # a tracking constraint.
+    name = RIG_CAMERA_NAMES[rig_type]
+    camera_obj = bpy.data.objects.new(name, bpy.data.cameras.new(name=name))
+    scene.collection.objects.link(camera_obj)
+    frames, positions = sample_flight_positions(
+        settings["csv_path"],
+        settings["fps"],
+        settings["frame_offset"],
+        settings["use_sidecar"],
+    )
+    path = compute_rig_camera_path(rig_type, positions, location=location)
+    plans = plan_rig_camera_keyframes(
+        frames,
+        path,
+        settings["keyframe_mode"],
+        settings["location_tolerance"],
+        settings["rotation_tolerance"],
+    )
+    bake_rig_camera(camera_obj, *plans)
+    scene.camera = camera_obj
+    return camera_obj
+
+
+def run(args):
+    if args.empty_scene:
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+    scene = bpy.context.scene
+    if args.fps:
+        scene.render.fps = args.fps
+
+    timings = {}
+    started = time.perf_counter()
+    if args.obj:
+        rocket = import_rocket(scene, os.path.abspath(args.obj), args.scale, args.instance_parts, args.decimate)
+    else:
+        rocket = create_target_empty(scene)
+    timings["import"] = time.perf_counter() - started
+
+    settings = {
+        "csv_path": os.path.abspath(args.csv),
+        "animate_roll": args.roll,
+        "animate_attitude": args.attitude,
+        "use_sidecar": not args.no_sidecar,
+        "fps": scene.render.fps,
+        "frame_offset": args.frame_offset,
+        "subframes": args.samples_per_frame,
+        "keyframe_mode": args.keyframe_mode,
+        "keyframe_step": args.keyframe_step,
+        "location_tolerance": args.location_tolerance,
+        "rotation_tolerance": args.rotation_tolerance,
+        "base_euler": tuple(rocket.rotation_euler),
+        "rotation_mode": args.rotation_output,
+        "event_window": args.event_window,
+        "telemetry": [
+            {"column": column, "property": property_name, "tolerance": 0.0}
+            for column, property_name in args.telemetry
+        ],
+    }
+    started = time.perf_counter()
+    plan, max_frame, warnings = compute_animation_plan(settings)
+    timings["parse"] = time.perf_counter() - started
+    for warning in warnings:
+        print(f"OpenRocket Animator: {warning}")
+
+    started = time.perf_counter()
+    rocket.animation_data_clear()
+    prepare_animation_target(rocket, plan)
+    written, _sampled = write_keyframe_plan(rocket, plan)
+    scene.frame_start = 0
+    scene.frame_end = max_frame
+    if not args.no_event_markers:
+        events = load_openrocket_events(settings["csv_path"], use_sidecar=settings["use_sidecar"])
+        sync_event_markers(scene, events, settings["fps"], settings["frame_offset"])
+    timings["keyframes"] = time.perf_counter() - started
+
+    if args.camera == "onboard":
+        add_onboard_camera(scene, rocket, args.camera_offset)
+    elif args.camera == "track":
+        add_baked_camera(scene, settings, 'GROUND', args.track_location)
+    elif args.camera == "chase":
+        add_baked_camera(scene, settings, 'CHASE')
+
+    output = os.path.abspath(args.output)
+    bpy.ops.wm.save_as_mainfile(filepath=output)
+
+    summary = ", ".join(f"{stage} {seconds:.2f} s" for stage, seconds in timings.items())
+    print(f"OpenRocket Animator: wrote {written} keyframes up to frame {max_frame} to {output} ({summary})")
+    return output
+
+
+def main(argv=None):
+    # Returns the process exit status: 0 on success, 1 when the pipeline failed.
+    args = build_arg_parser().parse_args(_script_argv() if argv is None else argv)
+    try:
+        run(args)
+    except Exception as exc:
+        print(f"OpenRocket Animator: {exc}", file=sys.stderr)
+        return 1
+    return 0
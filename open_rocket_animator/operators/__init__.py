@@ -1,7 +1,10 @@
-from . import animation, camera, import_obj
+from . import animation, camera, flight_path, import_obj, live, lod
 
 __all__ = [
     "import_obj",
     "animation",
+    "live",
+    "flight_path",
+    "lod",
     "camera",
 ]
@@ -1,16 +1,83 @@
 import os
+import threading
+import time
 
 import bpy
 
-from ..core.animation_utils import compute_attitude_euler, iter_slot_fcurves
-from ..core.csv_utils import (
-    detect_header_and_data_start,
-    find_header_index,
-    find_orientation_indices,
-    iter_csv_rows,
-    read_openrocket_csv_lines,
-    safe_float,
+from ..core.animation_utils import (
+    backup_slot_fcurves,
+    ensure_action_and_slot,
+    find_or_create_slot_fcurve,
+    iter_slot_fcurves,
+    prepare_animation_target,
+    reset_flight_animation,
+    restore_slot_fcurves,
+    sync_event_markers,
+    write_fcurve_keyframes,
+    write_keyframe_plan,
 )
+from ..core.batch_utils import compute_batch_plans, format_batch_timings
+from ..core.csv_utils import load_openrocket_events
+from ..core.trajectory_utils import compute_animation_plan
+
+# Seconds of keyframe writing per modal timer tick.
+MODAL_TICK_BUDGET = 0.02
+
+
+def read_animation_settings(scene, props, obj):
+    # Plain snapshot of everything the pipeline needs, safe to hand to a worker thread.
+    return {
+        "csv_path": bpy.path.abspath(props.csv_filepath),
+        "animate_roll": props.animate_rotation,
+        "animate_attitude": props.animate_attitude,
+        "use_sidecar": props.use_csv_sidecar,
+        "fps": scene.render.fps,
+        "frame_offset": props.frame_offset,
+        "subframes": props.samples_per_frame,
+        "keyframe_mode": props.keyframe_mode,
+        "keyframe_step": props.keyframe_step,
+        "location_tolerance": props.location_tolerance,
+        "rotation_tolerance": props.rotation_tolerance,
+        "base_euler": tuple(obj.rotation_euler),
+        "rotation_mode": props.rotation_output,
+        "event_window": props.event_window,
+        "event_markers": props.create_event_markers,
+        "telemetry": [
+            {"column": channel.column, "property": channel.property_name, "tolerance": channel.tolerance}
+            for channel in props.telemetry_channels
+            if channel.enabled and channel.column and channel.property_name
+        ],
+    }
+
+
+def add_event_markers(scene, settings):
+    # Events were recorded while the CSV was parsed, so this is a cache lookup.
+    if not settings.get("event_markers"):
+        return
+    events = load_openrocket_events(settings["csv_path"], use_sidecar=settings["use_sidecar"])
+    sync_event_markers(scene, events, settings["fps"], settings["frame_offset"])
+
+
+def format_animation_report(settings, max_frame, written, sampled):
+    message = f"Animation generated up to frame {max_frame}."
+    if settings["keyframe_mode"] != 'STEP':
+        message += f" {written} keyframes written, {sampled - written} saved."
+    return message
+
+
+def validate_animation_target(operator, context):
+    props = context.scene.ora_props
+    csv_path = bpy.path.abspath(props.csv_filepath)
+
+    if not os.path.exists(csv_path):
+        operator.report({'ERROR'}, f"CSV file not found: {csv_path}")
+        return None
+
+    obj = context.view_layer.objects.active
+    if not obj or obj.type not in {'MESH', 'EMPTY'}:
+        operator.report({'ERROR'}, "Select a MESH or EMPTY object to animate.")
+        return None
+    return obj
 
 
 class ORA_OT_AnimateFromCSV(bpy.types.Operator):
@@ -18,121 +85,337 @@ class ORA_OT_AnimateFromCSV(bpy.types.Operator):
     bl_label = "Animate from CSV"
 
     def execute(self, context):
-        props = context.scene.ora_props
-        csv_path = bpy.path.abspath(props.csv_filepath)
+        obj = validate_animation_target(self, context)
+        if obj is None:
+            return {'CANCELLED'}
 
-        if not os.path.exists(csv_path):
-            self.report({'ERROR'}, f"CSV file not found: {csv_path}")
+        scene = context.scene
+        settings = read_animation_settings(scene, scene.ora_props, obj)
+        try:
+            plan, max_frame, warnings = compute_animation_plan(settings)
+        except ValueError as exc:
+            self.report({'ERROR'}, str(exc))
+            return {'CANCELLED'}
+        except Exception as exc:
+            self.report({'ERROR'}, f"Error reading CSV: {exc}")
             return {'CANCELLED'}
 
-        obj = context.view_layer.objects.active
-        if not obj or obj.type not in {'MESH', 'EMPTY'}:
-            self.report({'ERROR'}, "Select a MESH or EMPTY object to animate.")
+        for warning in warnings:
+            self.report({'WARNING'}, warning)
+
+        reset_flight_animation(obj, plan, scene.ora_props.update_existing_curves)
+        prepare_animation_target(obj, plan)
+        written, sampled = write_keyframe_plan(obj, plan)
+
+        scene.frame_start = 0
+        scene.frame_end = max_frame
+        add_event_markers(scene, settings)
+        self.report({'INFO'}, format_animation_report(settings, max_frame, written, sampled))
+        return {'FINISHED'}
+
+
+class ORA_OT_AnimateFromCSVModal(bpy.types.Operator):
+    bl_idname = "object.ora_animate_csv_modal"
+    bl_label = "Animate from CSV (Background)"
+    bl_description = "Parse the CSV on a worker thread and write keyframes without blocking the UI. ESC cancels"
+
+    _timer = None
+    _thread = None
+
+    def invoke(self, context, event):
+        obj = validate_animation_target(self, context)
+        if obj is None:
             return {'CANCELLED'}
 
+        self._object_name = obj.name
+        self._settings = read_animation_settings(context.scene, context.scene.ora_props, obj)
+        self._update_existing = context.scene.ora_props.update_existing_curves
+        self._result = None
+        self._error = None
+        self._pending = []
+        self._written = 0
+        self._sampled = 0
+        self._previous_action = None
+        self._previous_slot = None
+        self._previous_rotation_mode = obj.rotation_mode
+        self._new_action = None
+        self._curve_backup = None
+
+        self._thread = threading.Thread(target=self._compute, daemon=True)
+        self._thread.start()
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.05, window=context.window)
+        wm.progress_begin(0, 100)
+        wm.modal_handler_add(self)
+        self._set_status(context, "Parsing CSV...")
+        return {'RUNNING_MODAL'}
+
+    def _compute(self):
         try:
-            lines = read_openrocket_csv_lines(csv_path)
-            header, data_start = detect_header_and_data_start(lines)
-            if not header:
-                self.report({'ERROR'}, "CSV header was not found.")
+            self._result = compute_animation_plan(self._settings)
+        except Exception as exc:
+            self._error = exc
+
+    def _set_status(self, context, text):
+        if context.workspace is not None:
+            context.workspace.status_text_set(text)
+        if context.area is not None:
+            context.area.header_text_set(text)
+
+    def _finish(self, context):
+        wm = context.window_manager
+        if self._timer is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        if context.workspace is not None:
+            context.workspace.status_text_set(None)
+        if context.area is not None:
+            context.area.header_text_set(None)
+
+    def _begin_writing(self, obj):
+        plan, _max_frame, _warnings = self._result
+        for data_path, keyframe_sets, interpolation, sampled in plan:
+            self._sampled += sampled
+            for index, keyframe_set in enumerate(keyframe_sets):
+                if keyframe_set is not None:
+                    self._pending.append((data_path, index, keyframe_set, interpolation))
+        self._total_batches = max(len(self._pending), 1)
+
+        anim_data = obj.animation_data
+        previous_action = anim_data.action if anim_data is not None else None
+        if self._update_existing and previous_action is not None:
+            # Write into the existing action, backing up the curves about to change so
+            # cancelling can put their keys back.
+            ensure_action_and_slot(obj)
+            curve_keys = [(data_path, index) for data_path, index, _keyframe_set, _interpolation in self._pending]
+            self._curve_backup = backup_slot_fcurves(obj, curve_keys)
+        else:
+            # Detach the current action instead of clearing it, so cancelling can restore it.
+            if anim_data is not None:
+                self._previous_action = previous_action
+                self._previous_slot = getattr(anim_data, "action_slot", None)
+                anim_data.action = None
+            self._new_action, _slot = ensure_action_and_slot(obj)
+        prepare_animation_target(obj, plan)
+
+    def _commit(self, obj):
+        if self._curve_backup is not None:
+            # Flight curves the new plan no longer writes go only once the write succeeded.
+            reset_flight_animation(obj, self._result[0], incremental=True)
+        elif self._previous_action is not None and self._previous_action.users == 0:
+            # Clear mode replaces the action; drop the old one instead of leaving an orphan.
+            bpy.data.actions.remove(self._previous_action)
+        self._previous_action = None
+        self._curve_backup = None
+        self._new_action = None
+
+    def _rollback(self, obj):
+        if obj is None:
+            return
+        if self._curve_backup is not None:
+            restore_slot_fcurves(obj, self._curve_backup)
+            self._curve_backup = None
+        elif self._new_action is not None:
+            anim_data = obj.animation_data
+            if anim_data is not None:
+                anim_data.action = self._previous_action
+                if self._previous_action is not None and self._previous_slot is not None:
+                    anim_data.action_slot = self._previous_slot
+            bpy.data.actions.remove(self._new_action)
+            self._new_action = None
+        obj.rotation_mode = self._previous_rotation_mode
+
+    def cancel(self, context):
+        self._rollback(bpy.data.objects.get(self._object_name))
+        self._finish(context)
+
+    def modal(self, context, event):
+        obj = bpy.data.objects.get(self._object_name)
+        if event.type == 'ESC' or obj is None:
+            self.cancel(context)
+            self.report({'WARNING'}, "CSV animation cancelled.")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        wm = context.window_manager
+        if self._thread is not None:
+            if self._thread.is_alive():
+                return {'PASS_THROUGH'}
+            self._thread = None
+            if self._error is not None:
+                self._finish(context)
+                if isinstance(self._error, ValueError):
+                    self.report({'ERROR'}, str(self._error))
+                else:
+                    self.report({'ERROR'}, f"Error reading CSV: {self._error}")
                 return {'CANCELLED'}
-            if data_start is None:
-                self.report({'ERROR'}, "No data rows were found in the CSV file.")
+            for warning in self._result[2]:
+                self.report({'WARNING'}, warning)
+            self._begin_writing(obj)
+
+        # Time-sliced writing: each tick fills at least one F-curve, then as many more as
+        # fit in the budget.
+        deadline = time.perf_counter() + MODAL_TICK_BUDGET
+        while self._pending:
+            data_path, index, keyframe_set, interpolation = self._pending.pop(0)
+            fcurve = find_or_create_slot_fcurve(obj, data_path, index)
+            if fcurve is None:
+                self.cancel(context)
+                self.report({'ERROR'}, f"Could not create curve {data_path}[{index}] on '{obj.name}'.")
                 return {'CANCELLED'}
+            frames, values = keyframe_set[0], keyframe_set[1]
+            handles = keyframe_set[2:4] if len(keyframe_set) >= 4 else (None, None)
+            self._written += write_fcurve_keyframes(
+                fcurve,
+                frames,
+                values,
+                interpolation=interpolation,
+                handles_left=handles[0],
+                handles_right=handles[1],
+            )
+            if time.perf_counter() >= deadline:
+                break
+
+        done = self._total_batches - len(self._pending)
+        wm.progress_update(int(100 * done / self._total_batches))
+        self._set_status(context, f"Writing keyframes... {done}/{self._total_batches} curves (ESC to cancel)")
+        if self._pending:
+            return {'RUNNING_MODAL'}
+
+        self._commit(obj)
+        max_frame = self._result[1]
+        context.scene.frame_start = 0
+        context.scene.frame_end = max_frame
+        add_event_markers(context.scene, self._settings)
+        self._finish(context)
+        self.report({'INFO'}, format_animation_report(self._settings, max_frame, self._written, self._sampled))
+        return {'FINISHED'}
 
-            time_idx = find_header_index(header, "Time")
-            x_idx = find_header_index(header, "Position East")
-            y_idx = find_header_index(header, "Position North")
-            z_idx = find_header_index(header, "Altitude")
 
-            if min(time_idx, x_idx, y_idx, z_idx) < 0:
-                self.report({'ERROR'}, "Required position columns were not found in the CSV file.")
-                return {'CANCELLED'}
+class ORA_OT_BatchAddItem(bpy.types.Operator):
+    bl_idname = "object.ora_batch_add_item"
+    bl_label = "Add Selected"
+    bl_description = "Add one batch entry per selected MESH or EMPTY object"
 
-            ori_indices = find_orientation_indices(header)
-            roll_idx = ori_indices["roll_rate"] if props.animate_rotation else -1
-            vertical_idx = ori_indices["vertical"] if props.animate_attitude else -1
-            lateral_idx = ori_indices["lateral"] if props.animate_attitude else -1
+    def execute(self, context):
+        props = context.scene.ora_props
+        existing = {item.target_object for item in props.batch_items if item.target_object}
+        added = 0
+        for obj in context.selected_objects:
+            if obj.type not in {'MESH', 'EMPTY'} or obj in existing:
+                continue
+            item = props.batch_items.add()
+            item.target_object = obj
+            item.csv_filepath = props.csv_filepath
+            added += 1
+
+        if not added:
+            self.report({'WARNING'}, "No new MESH or EMPTY objects selected.")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"{added} batch entries added.")
+        return {'FINISHED'}
 
-            if props.animate_attitude and (vertical_idx < 0 or lateral_idx < 0):
-                self.report({'WARNING'}, "Attitude columns not found. Continuing without attitude animation.")
-                vertical_idx = -1
-                lateral_idx = -1
 
-            obj.animation_data_clear()
+class ORA_OT_BatchRemoveItem(bpy.types.Operator):
+    bl_idname = "object.ora_batch_remove_item"
+    bl_label = "Remove Batch Entry"
 
-            scene = context.scene
-            scene.frame_start = 0
-            frame_offset = props.frame_offset
-            step = props.keyframe_step
-            max_frame = 0
-
-            prev_time_for_roll = None
-            roll_angle = 0.0
-            first_frame_written = False
-
-            for row in iter_csv_rows(lines, data_start):
-                if not row:
-                    continue
-                if row[0].strip().startswith('#'):
-                    continue
-
-                try:
-                    t = safe_float(row[time_idx])
-                    x = safe_float(row[x_idx])
-                    y = safe_float(row[y_idx])
-                    z = safe_float(row[z_idx])
-                except Exception:
-                    continue
-
-                if None in (t, x, y, z):
-                    continue
-
-                frame = round(t * scene.render.fps) + frame_offset
-                if first_frame_written and frame % step != 0:
-                    continue
-
-                obj.location = (x, y, z)
-                obj.keyframe_insert(data_path="location", frame=frame)
-
-                roll_for_frame = None
-                if roll_idx >= 0 and roll_idx < len(row):
-                    roll_rate = safe_float(row[roll_idx])
-                    if roll_rate is not None:
-                        if prev_time_for_roll is None:
-                            prev_time_for_roll = t
-                        dt = t - prev_time_for_roll
-                        roll_angle += (roll_rate * dt) * 0.017453292519943295
-                        prev_time_for_roll = t
-                        roll_for_frame = roll_angle
-
-                attitude_euler = None
-                if vertical_idx >= 0 and lateral_idx >= 0 and vertical_idx < len(row) and lateral_idx < len(row):
-                    vertical = safe_float(row[vertical_idx])
-                    lateral = safe_float(row[lateral_idx])
-                    if vertical is not None and lateral is not None:
-                        attitude_euler = compute_attitude_euler(vertical, lateral, 0.0)
-
-                if attitude_euler is not None or roll_for_frame is not None:
-                    current_euler = list(obj.rotation_euler)
-                    if attitude_euler is not None:
-                        current_euler = [attitude_euler[0], attitude_euler[1], attitude_euler[2]]
-                    if roll_for_frame is not None:
-                        # Keep legacy roll axis behavior: roll is applied to Euler Z.
-                        current_euler[2] = current_euler[2] + roll_for_frame if attitude_euler is not None else roll_for_frame
-                    obj.rotation_euler = tuple(current_euler)
-                    obj.keyframe_insert(data_path="rotation_euler", frame=frame)
-
-                max_frame = max(max_frame, frame)
-                first_frame_written = True
+    index: bpy.props.IntProperty(default=-1)
 
+    def execute(self, context):
+        props = context.scene.ora_props
+        if not 0 <= self.index < len(props.batch_items):
+            return {'CANCELLED'}
+        props.batch_items.remove(self.index)
+        return {'FINISHED'}
+
+
+class ORA_OT_BatchAnimate(bpy.types.Operator):
+    bl_idname = "object.ora_batch_animate"
+    bl_label = "Batch Animate"
+    bl_description = "Parse every batch CSV in parallel, then animate all target objects in one pass"
+
+    def execute(self, context):
+        scene = context.scene
+        props = scene.ora_props
+
+        targets = []
+        jobs = []
+        for item in props.batch_items:
+            obj = item.target_object
+            csv_path = bpy.path.abspath(item.csv_filepath)
+            if obj is None or obj.type not in {'MESH', 'EMPTY'}:
+                continue
+            if not os.path.exists(csv_path):
+                self.report({'WARNING'}, f"CSV file not found: {csv_path}")
+                continue
+            targets.append(obj)
+            jobs.append((csv_path, {"base_euler": tuple(obj.rotation_euler)}))
+
+        if not jobs:
+            self.report({'ERROR'}, "No valid batch entries to animate.")
+            return {'CANCELLED'}
+
+        settings = read_animation_settings(scene, props, targets[0])
+        started = time.perf_counter()
+        results = compute_batch_plans(jobs, settings, use_processes=props.batch_use_processes)
+        parse_seconds = time.perf_counter() - started
+
+        max_frame = 0
+        animated = 0
+        for obj, result in zip(targets, results):
+            if result["error"] is not None:
+                continue
+            reset_flight_animation(obj, result["plan"], props.update_existing_curves)
+            prepare_animation_target(obj, result["plan"])
+            write_keyframe_plan(obj, result["plan"])
+            max_frame = max(max_frame, result["max_frame"])
+            animated += 1
+        total_seconds = time.perf_counter() - started
+
+        for line in format_batch_timings(results):
+            self.report({'INFO'}, line)
+
+        if animated:
+            scene.frame_start = 0
             scene.frame_end = max_frame
-            self.report({'INFO'}, f"Animation generated up to frame {max_frame}.")
-            return {'FINISHED'}
+        self.report(
+            {'INFO'} if animated == len(jobs) else {'WARNING'},
+            f"Batch animated {animated}/{len(jobs)} objects "
+            f"(parse {parse_seconds:.2f} s, total {total_seconds:.2f} s).",
+        )
+        return {'FINISHED'} if animated else {'CANCELLED'}
 
-        except Exception as exc:
-            self.report({'ERROR'}, f"Error reading CSV: {exc}")
+
+class ORA_OT_TelemetryAddChannel(bpy.types.Operator):
+    bl_idname = "object.ora_telemetry_add_channel"
+    bl_label = "Add Telemetry Channel"
+    bl_description = "Animate another CSV column onto a custom property of the rocket"
+
+    def execute(self, context):
+        props = context.scene.ora_props
+        channel = props.telemetry_channels.add()
+        channel.column = "Total velocity"
+        channel.property_name = f"ora_channel_{len(props.telemetry_channels)}"
+        return {'FINISHED'}
+
+
+class ORA_OT_TelemetryRemoveChannel(bpy.types.Operator):
+    bl_idname = "object.ora_telemetry_remove_channel"
+    bl_label = "Remove Telemetry Channel"
+
+    index: bpy.props.IntProperty(default=-1)
+
+    def execute(self, context):
+        props = context.scene.ora_props
+        if not 0 <= self.index < len(props.telemetry_channels):
             return {'CANCELLED'}
+        props.telemetry_channels.remove(self.index)
+        return {'FINISHED'}
 
 
 class ORA_OT_ConvertToLinear(bpy.types.Operator):
@@ -161,6 +444,12 @@ class ORA_OT_ConvertToLinear(bpy.types.Operator):
 
 classes = (
     ORA_OT_AnimateFromCSV,
+    ORA_OT_AnimateFromCSVModal,
+    ORA_OT_BatchAddItem,
+    ORA_OT_BatchRemoveItem,
+    ORA_OT_BatchAnimate,
+    ORA_OT_TelemetryAddChannel,
+    ORA_OT_TelemetryRemoveChannel,
     ORA_OT_ConvertToLinear,
 )
 
@@ -1,13 +1,23 @@
+import os
+
 import bpy
 
 from ..core.animation_utils import find_or_create_slot_fcurve
 from ..core.camera_utils import (
     MOUNTED_CAMERA_NAME,
-    apply_live_camera_offsets,
+    clear_mount_cache,
     find_mounted_rocket_camera,
+    find_mounted_rocket_cameras,
     get_rocket_object,
     rebuild_rocket_camera_mount,
 )
+from ..core.rig_utils import (
+    RIG_CAMERA_NAMES,
+    bake_rig_camera,
+    compute_rig_camera_path,
+    plan_rig_camera_keyframes,
+)
+from ..core.trajectory_utils import sample_flight_positions
 
 
 class ORA_OT_TrackRocket(bpy.types.Operator):
@@ -54,7 +64,7 @@ class ORA_OT_AddRocketCamera(bpy.types.Operator):
         camera_obj = bpy.data.objects.new(MOUNTED_CAMERA_NAME, cam_data)
         context.collection.objects.link(camera_obj)
 
-        rebuild_rocket_camera_mount(camera_obj, rocket, props)
+        rebuild_rocket_camera_mount(camera_obj, rocket, props, props.camera_mount_point)
 
         for constraint in list(camera_obj.constraints):
             if constraint.type == 'TRACK_TO':
@@ -76,23 +86,29 @@ class ORA_OT_UpdateRocketCamera(bpy.types.Operator):
 
     def execute(self, context):
         props = context.scene.ora_props
-        camera_obj = find_mounted_rocket_camera(context.scene)
-        if not camera_obj:
-            self.report({'ERROR'}, f"Camera '{MOUNTED_CAMERA_NAME}' was not found. Create it first.")
-            return {'CANCELLED'}
-
         rocket = get_rocket_object(props)
         if not rocket:
             self.report({'ERROR'}, "No valid rocket object selected.")
             return {'CANCELLED'}
 
-        rebuild_rocket_camera_mount(camera_obj, rocket, props)
+        # Every onboard camera keeps its own mount point; the geometry is analysed once.
+        cameras = find_mounted_rocket_cameras(context.scene, rocket)
+        legacy_camera = find_mounted_rocket_camera(context.scene)
+        if legacy_camera and legacy_camera not in cameras:
+            cameras.append(legacy_camera)
+        if not cameras:
+            self.report({'ERROR'}, f"Camera '{MOUNTED_CAMERA_NAME}' was not found. Create it first.")
+            return {'CANCELLED'}
 
-        for constraint in list(camera_obj.constraints):
-            if constraint.type == 'TRACK_TO':
-                camera_obj.constraints.remove(constraint)
+        # An explicit update re-reads the mesh, catching edits the cached key cannot see.
+        clear_mount_cache(rocket)
+        for camera_obj in cameras:
+            rebuild_rocket_camera_mount(camera_obj, rocket, props)
+            for constraint in list(camera_obj.constraints):
+                if constraint.type == 'TRACK_TO':
+                    camera_obj.constraints.remove(constraint)
 
-        self.report({'INFO'}, "Rocket camera base mount rebuilt.")
+        self.report({'INFO'}, f"{len(cameras)} rocket camera mount(s) rebuilt.")
         return {'FINISHED'}
 
 
@@ -143,11 +159,131 @@ class ORA_OT_AddCameraNoise(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class ORA_OT_RigAddCamera(bpy.types.Operator):
+    bl_idname = "object.ora_rig_add_camera"
+    bl_label = "Add Rig Camera"
+    bl_description = "Add a camera to the rig; it is created or updated on Bake Rig"
+
+    rig_type: bpy.props.EnumProperty(
+        name="Type",
+        items=[
+            ('GROUND', "Ground Tracker", ""),
+            ('PAD', "Pad", ""),
+            ('CHASE', "Chase", ""),
+            ('ONBOARD', "Onboard", ""),
+        ],
+        default='GROUND',
+    )
+
+    def execute(self, context):
+        item = context.scene.ora_props.camera_rig.add()
+        item.rig_type = self.rig_type
+        if self.rig_type == 'PAD':
+            item.location = (8.0, -8.0, 1.5)
+            item.lens = 24.0
+        elif self.rig_type == 'GROUND':
+            item.framing = 0.1
+        return {'FINISHED'}
+
+
+class ORA_OT_RigRemoveCamera(bpy.types.Operator):
+    bl_idname = "object.ora_rig_remove_camera"
+    bl_label = "Remove Rig Camera"
+
+    index: bpy.props.IntProperty(default=-1)
+
+    def execute(self, context):
+        props = context.scene.ora_props
+        if not 0 <= self.index < len(props.camera_rig):
+            return {'CANCELLED'}
+        props.camera_rig.remove(self.index)
+        return {'FINISHED'}
+
+
+class ORA_OT_BakeCameraRig(bpy.types.Operator):
+    bl_idname = "object.ora_bake_camera_rig"
+    bl_label = "Bake Rig"
+    bl_description = "Aim, zoom and move every rig camera from the CSV trajectory and bake the result to keyframes"
+
+    def execute(self, context):
+        scene = context.scene
+        props = scene.ora_props
+        if not len(props.camera_rig):
+            self.report({'ERROR'}, "The camera rig is empty.")
+            return {'CANCELLED'}
+        rocket = get_rocket_object(props)
+        if not rocket:
+            self.report({'ERROR'}, "No valid rocket object selected.")
+            return {'CANCELLED'}
+
+        csv_path = bpy.path.abspath(props.csv_filepath)
+        if not os.path.exists(csv_path):
+            self.report({'ERROR'}, f"CSV file not found: {csv_path}")
+            return {'CANCELLED'}
+        try:
+            frames, positions = sample_flight_positions(
+                csv_path,
+                scene.render.fps,
+                props.frame_offset,
+                props.use_csv_sidecar,
+            )
+        except ValueError as exc:
+            self.report({'ERROR'}, str(exc))
+            return {'CANCELLED'}
+        except Exception as exc:
+            self.report({'ERROR'}, f"Error reading CSV: {exc}")
+            return {'CANCELLED'}
+
+        # One trajectory pass feeds every camera; nothing is left to constraints.
+        object_size = max(rocket.dimensions) or 1.0
+        written = 0
+        for item in props.camera_rig:
+            camera_obj = item.camera_object
+            if camera_obj is None:
+                name = RIG_CAMERA_NAMES[item.rig_type]
+                camera_obj = bpy.data.objects.new(name, bpy.data.cameras.new(name=name))
+                context.collection.objects.link(camera_obj)
+                item.camera_object = camera_obj
+
+            if item.rig_type == 'ONBOARD':
+                rebuild_rocket_camera_mount(camera_obj, rocket, props, item.mount_point)
+                camera_obj.data.lens = item.lens
+                continue
+
+            path = compute_rig_camera_path(
+                item.rig_type,
+                positions,
+                location=tuple(item.location),
+                distance=item.distance,
+                height=item.height,
+                lens=item.lens,
+                framing=item.framing,
+                object_size=object_size,
+                sensor_width=camera_obj.data.sensor_width,
+            )
+            plans = plan_rig_camera_keyframes(
+                frames,
+                path,
+                props.keyframe_mode,
+                props.location_tolerance,
+                props.rotation_tolerance,
+            )
+            written += bake_rig_camera(camera_obj, *plans)
+
+        if scene.camera is None:
+            scene.camera = props.camera_rig[0].camera_object
+        self.report({'INFO'}, f"Camera rig baked: {len(props.camera_rig)} camera(s), {written} keyframes.")
+        return {'FINISHED'}
+
+
 classes = (
     ORA_OT_TrackRocket,
     ORA_OT_AddRocketCamera,
     ORA_OT_UpdateRocketCamera,
     ORA_OT_AddCameraNoise,
+    ORA_OT_RigAddCamera,
+    ORA_OT_RigRemoveCamera,
+    ORA_OT_BakeCameraRig,
 )
 
 
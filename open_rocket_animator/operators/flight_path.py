@@ -0,0 +1,94 @@
+import os
+
+import bpy
+import numpy as np
+
+from ..core.trajectory_utils import build_flight_path
+
+FLIGHT_PATH_NAME = "Flight_Path"
+
+
+def build_path_mesh(name, path):
+    points = path["points"]
+    count = len(points)
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(count)
+    mesh.vertices.foreach_set("co", points.ravel())
+    if count > 1:
+        edges = np.empty((count - 1, 2), dtype=np.int32)
+        edges[:, 0] = np.arange(count - 1)
+        edges[:, 1] = edges[:, 0] + 1
+        mesh.edges.add(count - 1)
+        mesh.edges.foreach_set("vertices", edges.ravel())
+
+    for attribute, values in path.items():
+        if attribute == "points":
+            continue
+        layer = mesh.attributes.new(name=attribute, type='FLOAT', domain='POINT')
+        layer.data.foreach_set("value", values)
+
+    mesh.update()
+    return mesh
+
+
+def build_path_curve(name, path):
+    points = path["points"]
+    curve = bpy.data.curves.new(name, type='CURVE')
+    curve.dimensions = '3D'
+    spline = curve.splines.new('POLY')
+    spline.points.add(len(points) - 1)
+    co = np.ones((len(points), 4), dtype=np.float32)
+    co[:, :3] = points
+    spline.points.foreach_set("co", co.ravel())
+    return curve
+
+
+class ORA_OT_CreateFlightPath(bpy.types.Operator):
+    bl_idname = "object.ora_create_flight_path"
+    bl_label = "Create Flight Path"
+    bl_description = "Build the CSV trajectory as a single poly curve or edge mesh"
+
+    def execute(self, context):
+        props = context.scene.ora_props
+        csv_path = bpy.path.abspath(props.csv_filepath)
+        if not os.path.exists(csv_path):
+            self.report({'ERROR'}, f"CSV file not found: {csv_path}")
+            return {'CANCELLED'}
+
+        try:
+            path = build_flight_path(csv_path, props.flight_path_tolerance, props.use_csv_sidecar)
+        except ValueError as exc:
+            self.report({'ERROR'}, str(exc))
+            return {'CANCELLED'}
+        except Exception as exc:
+            self.report({'ERROR'}, f"Error reading CSV: {exc}")
+            return {'CANCELLED'}
+
+        if not len(path["points"]):
+            self.report({'ERROR'}, "No valid position rows were found in the CSV file.")
+            return {'CANCELLED'}
+
+        if props.flight_path_type == 'CURVE':
+            data = build_path_curve(FLIGHT_PATH_NAME, path)
+        else:
+            data = build_path_mesh(FLIGHT_PATH_NAME, path)
+        path_obj = bpy.data.objects.new(FLIGHT_PATH_NAME, data)
+        context.collection.objects.link(path_obj)
+
+        self.report({'INFO'}, f"Flight path '{path_obj.name}' created with {len(path['points'])} points.")
+        return {'FINISHED'}
+
+
+classes = (
+    ORA_OT_CreateFlightPath,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -2,6 +2,9 @@ import os
 
 import bpy
 
+from ..core.lod_utils import create_lod_objects, scale_lod_objects
+from ..core.mesh_utils import format_import_report, import_rocket_model
+
 
 class ORA_OT_ImportOBJ(bpy.types.Operator):
     bl_idname = "object.ora_import_obj"
@@ -13,15 +16,34 @@ class ORA_OT_ImportOBJ(bpy.types.Operator):
             self.report({'ERROR'}, f"File not found: {path}")
             return {'CANCELLED'}
 
+        props = context.scene.ora_props
         try:
-            bpy.ops.wm.obj_import(filepath=path)
-            obj = context.view_layer.objects.active
-            if obj:
-                self.report({'INFO'}, "OBJ model imported. Use Fix Scale if needed.")
+            main, parts, report = import_rocket_model(
+                context.scene,
+                path,
+                scale=props.default_scale_factor if props.import_apply_scale else 1.0,
+                merge_parts=props.import_merge_parts,
+                instance_parts=props.import_instance_parts,
+                decimate_ratio=props.import_decimate_ratio,
+            )
         except Exception as exc:
             self.report({'ERROR'}, f"Error importing OBJ: {exc}")
             return {'CANCELLED'}
 
+        for obj in context.view_layer.objects:
+            obj.select_set(obj in parts)
+        context.view_layer.objects.active = main
+
+        message = format_import_report(report)
+        if props.lod_levels and len(parts) > 1 and not props.import_merge_parts:
+            # LOD levels replace one mesh; on loose parts only the first would switch.
+            self.report({'WARNING'}, "LODs skipped: enable Merge Parts so the whole rocket switches level.")
+        elif props.lod_levels:
+            lods = create_lod_objects(main, props.lod_levels, context.evaluated_depsgraph_get())
+            message += f" {len(lods)} LOD level(s) created."
+        if not props.import_apply_scale:
+            message += " Use Fix Scale if needed."
+        self.report({'INFO'}, message)
         return {'FINISHED'}
 
 
@@ -38,6 +60,7 @@ class ORA_OT_FixScale(bpy.types.Operator):
         factor = context.scene.ora_props.default_scale_factor
         obj.scale = (factor, factor, factor)
         bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+        scale_lod_objects(obj, factor)
 
         self.report({'INFO'}, f"Scale fixed and applied with factor {factor}.")
         return {'FINISHED'}
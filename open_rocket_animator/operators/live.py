@@ -0,0 +1,279 @@
+import bpy
+import numpy as np
+
+from ..core.animation_utils import (
+    FLIGHT_DATA_PATHS,
+    iter_slot_fcurves,
+    prepare_animation_target,
+    reset_flight_animation,
+    write_keyframe_plan,
+)
+from ..core.keyframe_utils import plan_flight_keyframes
+from ..core.trajectory_utils import (
+    evaluate_packed_samples,
+    load_flight_data,
+    pack_samples,
+    sample_flight,
+    settings_event_frames,
+)
+from .animation import add_event_markers, format_animation_report, read_animation_settings, validate_animation_target
+
+# obj.as_pointer() -> live track. Tracks live only in memory and belong to the open
+# file; load_pre drops them, and muted curves are never written to disk muted.
+_live_tracks = {}
+
+
+def _track_object(objects, key, track):
+    # Name lookup first; a renamed object is found again by its pointer.
+    obj = objects.get(track["name"])
+    if obj is None or obj.as_pointer() != key:
+        obj = next((candidate for candidate in objects if candidate.as_pointer() == key), None)
+        if obj is not None:
+            track["name"] = obj.name
+    return obj
+
+
+def _apply_live_tracks(scene):
+    frame = scene.frame_current + scene.frame_subframe
+    for key, track in list(_live_tracks.items()):
+        obj = _track_object(scene.objects, key, track)
+        if obj is None:
+            continue
+        values = evaluate_packed_samples(track["frames"], track["block"], frame)
+        if np.isnan(values[:3]).any():
+            continue
+        obj.location = values[:3]
+        rotation = values[3:]
+        if not len(rotation) or np.isnan(rotation).any():
+            continue
+        if track["rotation_path"] == "rotation_quaternion":
+            obj.rotation_quaternion = rotation / np.linalg.norm(rotation)
+        else:
+            obj.rotation_euler = rotation
+
+
+def ora_live_playback_handler(scene, depsgraph=None):
+    if _live_tracks:
+        _apply_live_tracks(scene)
+
+
+def _ensure_handler():
+    handlers = bpy.app.handlers.frame_change_pre
+    if ora_live_playback_handler not in handlers:
+        handlers.append(ora_live_playback_handler)
+
+
+def _remove_handler():
+    handlers = bpy.app.handlers.frame_change_pre
+    if ora_live_playback_handler in handlers:
+        handlers.remove(ora_live_playback_handler)
+
+
+def _mute_flight_curves(obj, data_paths):
+    # Animation is evaluated after frame_change_pre, so existing flight curves would
+    # overwrite the live values. Mutes them and returns the ones this call muted.
+    muted = []
+    for fcurve in iter_slot_fcurves(obj):
+        if fcurve.data_path in data_paths and not fcurve.mute:
+            fcurve.mute = True
+            muted.append((fcurve.data_path, fcurve.array_index))
+    return muted
+
+
+def _set_curves_mute(obj, curves, mute):
+    curves = set(curves)
+    for fcurve in iter_slot_fcurves(obj):
+        if (fcurve.data_path, fcurve.array_index) in curves:
+            fcurve.mute = mute
+
+
+def _stop_live_track(key, restore_rotation_mode=True):
+    # Drops the track and gives the object its curves (and rotation mode) back.
+    track = _live_tracks.pop(key, None)
+    if not _live_tracks:
+        _remove_handler()
+    obj = _track_object(bpy.data.objects, key, track) if track is not None else None
+    if obj is None:
+        return track
+    _set_curves_mute(obj, track["muted_curves"], False)
+    if restore_rotation_mode:
+        obj.rotation_mode = track["rotation_mode"]
+    return track
+
+
+@bpy.app.handlers.persistent
+def ora_live_load_pre_handler(filepath="", *args):
+    # Previews never outlive their file: unmute the curves and drop every track.
+    for key in list(_live_tracks):
+        _stop_live_track(key)
+
+
+@bpy.app.handlers.persistent
+def ora_live_save_pre_handler(filepath="", *args):
+    # Save the curves unmuted; save_post mutes them again for the running preview.
+    for key, track in _live_tracks.items():
+        obj = _track_object(bpy.data.objects, key, track)
+        if obj is not None:
+            _set_curves_mute(obj, track["muted_curves"], False)
+
+
+@bpy.app.handlers.persistent
+def ora_live_save_post_handler(filepath="", *args):
+    for key, track in _live_tracks.items():
+        obj = _track_object(bpy.data.objects, key, track)
+        if obj is not None:
+            _set_curves_mute(obj, track["muted_curves"], True)
+
+
+FILE_HANDLERS = (
+    ("load_pre", ora_live_load_pre_handler),
+    ("save_pre", ora_live_save_pre_handler),
+    ("save_post", ora_live_save_post_handler),
+)
+
+
+class ORA_OT_LivePlaybackStart(bpy.types.Operator):
+    bl_idname = "object.ora_live_playback_start"
+    bl_label = "Live Preview"
+    bl_description = "Drive the active object from the CSV on every frame change without writing keyframes"
+
+    def execute(self, context):
+        obj = validate_animation_target(self, context)
+        if obj is None:
+            return {'CANCELLED'}
+
+        scene = context.scene
+        settings = read_animation_settings(scene, scene.ora_props, obj)
+        try:
+            flight, warnings = load_flight_data(
+                settings["csv_path"],
+                settings["animate_roll"],
+                settings["animate_attitude"],
+                settings["use_sidecar"],
+                [(channel["column"], channel["property"]) for channel in settings["telemetry"]],
+            )
+            samples = sample_flight(
+                flight,
+                settings["fps"],
+                settings["frame_offset"],
+                settings["subframes"],
+                settings["base_euler"],
+                settings["rotation_mode"],
+            )
+        except ValueError as exc:
+            self.report({'ERROR'}, str(exc))
+            return {'CANCELLED'}
+        except Exception as exc:
+            self.report({'ERROR'}, f"Error reading CSV: {exc}")
+            return {'CANCELLED'}
+
+        for warning in warnings:
+            self.report({'WARNING'}, warning)
+
+        # Restarting on the same object first hands back the curves the old track muted.
+        key = obj.as_pointer()
+        _stop_live_track(key)
+        driven_paths = {"location"}
+        if samples["rotation"] is not None:
+            driven_paths |= FLIGHT_DATA_PATHS
+        frames, block = pack_samples(samples)
+        _live_tracks[key] = {
+            "name": obj.name,
+            "frames": frames,
+            "block": block,
+            "samples": samples,
+            "settings": settings,
+            "rotation_path": samples["rotation_path"] if samples["rotation"] is not None else None,
+            "rotation_mode": obj.rotation_mode,
+            "muted_curves": _mute_flight_curves(obj, driven_paths),
+        }
+        if samples["rotation"] is not None:
+            obj.rotation_mode = 'QUATERNION' if samples["rotation_path"] == "rotation_quaternion" else 'XYZ'
+        _ensure_handler()
+        _apply_live_tracks(scene)
+
+        scene.frame_start = 0
+        scene.frame_end = int(np.ceil(frames[-1]))
+        self.report({'INFO'}, f"Live preview active on '{obj.name}' ({len(frames)} samples, no keyframes).")
+        return {'FINISHED'}
+
+
+class ORA_OT_LivePlaybackStop(bpy.types.Operator):
+    bl_idname = "object.ora_live_playback_stop"
+    bl_label = "Stop Live Preview"
+
+    def execute(self, context):
+        obj = context.view_layer.objects.active
+        if obj is not None and obj.as_pointer() in _live_tracks:
+            _stop_live_track(obj.as_pointer())
+        else:
+            for key in list(_live_tracks):
+                _stop_live_track(key)
+        self.report({'INFO'}, "Live preview stopped.")
+        return {'FINISHED'}
+
+
+class ORA_OT_LivePlaybackBake(bpy.types.Operator):
+    bl_idname = "object.ora_live_playback_bake"
+    bl_label = "Bake Live Preview"
+    bl_description = "Write the live preview of the active object as keyframes with the bulk writer"
+
+    def execute(self, context):
+        obj = context.view_layer.objects.active
+        track = _live_tracks.get(obj.as_pointer()) if obj else None
+        if track is None:
+            self.report({'ERROR'}, "The active object has no live preview to bake.")
+            return {'CANCELLED'}
+
+        settings = track["settings"]
+        # Same event handling as Animate from CSV, so both produce identical keys.
+        plan = plan_flight_keyframes(
+            track["samples"],
+            settings["keyframe_mode"],
+            settings["keyframe_step"],
+            settings["location_tolerance"],
+            settings["rotation_tolerance"],
+            {channel["property"]: channel["tolerance"] for channel in settings["telemetry"]},
+            *settings_event_frames(settings),
+        )
+        # The baked curves replace the live values, so unmute before writing.
+        _stop_live_track(obj.as_pointer(), restore_rotation_mode=False)
+        scene = context.scene
+        reset_flight_animation(obj, plan, scene.ora_props.update_existing_curves)
+        prepare_animation_target(obj, plan)
+        written, sampled = write_keyframe_plan(obj, plan)
+
+        max_frame = int(np.ceil(track["frames"][-1]))
+        scene.frame_start = 0
+        scene.frame_end = max_frame
+        add_event_markers(scene, settings)
+        self.report({'INFO'}, format_animation_report(settings, max_frame, written, sampled))
+        return {'FINISHED'}
+
+
+classes = (
+    ORA_OT_LivePlaybackStart,
+    ORA_OT_LivePlaybackStop,
+    ORA_OT_LivePlaybackBake,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    for event, handler in FILE_HANDLERS:
+        handlers = getattr(bpy.app.handlers, event)
+        if handler not in handlers:
+            handlers.append(handler)
+
+
+def unregister():
+    for key in list(_live_tracks):
+        _stop_live_track(key)
+    _remove_handler()
+    for event, handler in FILE_HANDLERS:
+        handlers = getattr(bpy.app.handlers, event)
+        if handler in handlers:
+            handlers.remove(handler)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
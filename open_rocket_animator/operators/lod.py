@@ -0,0 +1,95 @@
+import os
+
+import bpy
+
+from ..core.lod_utils import (
+    camera_distances,
+    create_lod_objects,
+    find_lod_objects,
+    key_lod_visibility,
+    lod_switch_distances,
+    select_lod_levels,
+)
+from ..core.mesh_utils import count_mesh_vertices
+from ..core.trajectory_utils import sample_flight_positions
+
+
+class ORA_OT_GenerateLODs(bpy.types.Operator):
+    bl_idname = "object.ora_generate_lods"
+    bl_label = "Generate LODs"
+    bl_description = "Add decimated level-of-detail copies of the active mesh as hidden children"
+
+    def execute(self, context):
+        obj = context.view_layer.objects.active
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Select the rocket mesh to generate LODs for.")
+            return {'CANCELLED'}
+
+        levels = context.scene.ora_props.lod_levels
+        lods = create_lod_objects(obj, levels, context.evaluated_depsgraph_get())
+        counts = " / ".join(str(count_mesh_vertices([lod])) for lod in [obj] + lods)
+        self.report({'INFO'}, f"{len(lods)} LOD level(s) created ({counts} vertices).")
+        return {'FINISHED'}
+
+
+class ORA_OT_KeyLODSwitching(bpy.types.Operator):
+    bl_idname = "object.ora_key_lod_switching"
+    bl_label = "Key LOD Switching"
+    bl_description = "Key which LOD is visible on every frame from the camera distance along the CSV trajectory"
+
+    def execute(self, context):
+        scene = context.scene
+        props = scene.ora_props
+        obj = context.view_layer.objects.active
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Select the animated rocket mesh.")
+            return {'CANCELLED'}
+        lods = find_lod_objects(obj)
+        if len(lods) < 2:
+            self.report({'ERROR'}, "The rocket has no LODs. Use Generate LODs first.")
+            return {'CANCELLED'}
+        if scene.camera is None:
+            self.report({'ERROR'}, "The scene has no active camera.")
+            return {'CANCELLED'}
+
+        csv_path = bpy.path.abspath(props.csv_filepath)
+        if not os.path.exists(csv_path):
+            self.report({'ERROR'}, f"CSV file not found: {csv_path}")
+            return {'CANCELLED'}
+        try:
+            frames, positions = sample_flight_positions(
+                csv_path,
+                scene.render.fps,
+                props.frame_offset,
+                props.use_csv_sidecar,
+            )
+        except ValueError as exc:
+            self.report({'ERROR'}, str(exc))
+            return {'CANCELLED'}
+        except Exception as exc:
+            self.report({'ERROR'}, f"Error reading CSV: {exc}")
+            return {'CANCELLED'}
+
+        distances = camera_distances(obj, scene.camera, frames, positions)
+        levels = select_lod_levels(distances, lod_switch_distances(props.lod_distance, len(lods)))
+        written = key_lod_visibility(lods, frames, levels)
+
+        used = ", ".join(f"LOD{level}: {int((levels == level).sum())}" for level in range(len(lods)))
+        self.report({'INFO'}, f"LOD switching keyed with {written} keys ({used} frames).")
+        return {'FINISHED'}
+
+
+classes = (
+    ORA_OT_GenerateLODs,
+    ORA_OT_KeyLODSwitching,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
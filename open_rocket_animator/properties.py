@@ -1,16 +1,133 @@
 import bpy
 
-from .core.camera_utils import apply_live_camera_offsets, find_mounted_rocket_camera
+from .core.camera_utils import apply_live_camera_offsets, get_cached_mounted_camera
+
+# Slider drags fire an update per step; they are coalesced into one write per tick.
+LIVE_CAMERA_UPDATE_INTERVAL = 1.0 / 60.0
+_pending_camera_scenes = set()
+
+
+def _flush_mounted_camera_updates():
+    for scene_name in list(_pending_camera_scenes):
+        scene = bpy.data.scenes.get(scene_name)
+        if scene is None:
+            continue
+        camera_obj = get_cached_mounted_camera(scene)
+        if camera_obj is not None:
+            apply_live_camera_offsets(camera_obj, scene.ora_props)
+    _pending_camera_scenes.clear()
+    return None
 
 
 def _update_mounted_camera_from_props(self, context):
     scene = context.scene if context else None
     if scene is None:
         return
-    camera_obj = find_mounted_rocket_camera(scene)
-    if camera_obj is None:
-        return
-    apply_live_camera_offsets(camera_obj, self)
+    _pending_camera_scenes.add(scene.name)
+    if not bpy.app.timers.is_registered(_flush_mounted_camera_updates):
+        bpy.app.timers.register(_flush_mounted_camera_updates, first_interval=LIVE_CAMERA_UPDATE_INTERVAL)
+
+
+MOUNT_POINT_ITEMS = [
+    ('TOP', "Top", "Center of the bounding box top (legacy placement)"),
+    ('NOSE', "Nose", "Tip of the nose cone on the body axis"),
+    ('TAIL', "Tail", "Aft end of the body on the body axis"),
+    ('MID_BODY', "Mid Body", "Body surface halfway along the rocket"),
+    ('FIN_TIP', "Fin Tip", "Outermost vertex, normally a fin tip"),
+]
+
+
+class ORABatchItem(bpy.types.PropertyGroup):
+    csv_filepath: bpy.props.StringProperty(
+        name="CSV File",
+        description="OpenRocket CSV simulation driving this object",
+        subtype='FILE_PATH',
+    )
+    target_object: bpy.props.PointerProperty(
+        name="Object",
+        type=bpy.types.Object,
+        description="Object animated from this CSV",
+    )
+
+
+class ORATelemetryChannel(bpy.types.PropertyGroup):
+    enabled: bpy.props.BoolProperty(
+        name="Enabled",
+        default=True,
+    )
+    column: bpy.props.StringProperty(
+        name="Column",
+        description="CSV column to animate: a header name, a flight channel such as velocity, or part of a header name (case-insensitive)",
+    )
+    property_name: bpy.props.StringProperty(
+        name="Property",
+        description="Custom property on the rocket that receives the column values",
+    )
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Maximum error allowed when dropping keyframes in Adaptive and Bezier Fit modes",
+        default=0.0,
+        min=0.0,
+    )
+
+
+class ORACameraRigItem(bpy.types.PropertyGroup):
+    camera_object: bpy.props.PointerProperty(
+        name="Camera",
+        type=bpy.types.Object,
+        description="Camera driven by this rig entry; created on bake when empty",
+        poll=lambda _self, obj: obj.type == 'CAMERA',
+    )
+    rig_type: bpy.props.EnumProperty(
+        name="Type",
+        items=[
+            ('GROUND', "Ground Tracker", "Fixed camera far from the pad that follows and zooms on the rocket"),
+            ('PAD', "Pad", "Fixed camera next to the pad aimed at the rocket"),
+            ('CHASE', "Chase", "Camera trailing the rocket along its direction of travel"),
+            ('ONBOARD', "Onboard", "Camera mounted on the rocket"),
+        ],
+        default='GROUND',
+    )
+    location: bpy.props.FloatVectorProperty(
+        name="Location",
+        description="Camera position for Ground Tracker and Pad cameras",
+        default=(-150.0, -150.0, 2.0),
+        subtype='TRANSLATION',
+        unit='LENGTH',
+    )
+    distance: bpy.props.FloatProperty(
+        name="Distance",
+        description="How far the chase camera trails the rocket",
+        default=15.0,
+        min=0.0,
+        unit='LENGTH',
+    )
+    height: bpy.props.FloatProperty(
+        name="Height",
+        description="Vertical offset of the chase camera",
+        default=2.0,
+        unit='LENGTH',
+    )
+    lens: bpy.props.FloatProperty(
+        name="Focal Length",
+        description="Fixed focal length in millimeters when Framing is 0",
+        default=50.0,
+        min=1.0,
+    )
+    framing: bpy.props.FloatProperty(
+        name="Framing",
+        description="Zoom to keep the rocket at this fraction of the frame width; 0 keeps the focal length fixed",
+        default=0.0,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR',
+    )
+    mount_point: bpy.props.EnumProperty(
+        name="Mount Point",
+        description="Where the onboard camera is attached",
+        items=MOUNT_POINT_ITEMS,
+        default='FIN_TIP',
+    )
 
 
 class OpenRocketAnimProps(bpy.types.PropertyGroup):
@@ -24,6 +141,11 @@ class OpenRocketAnimProps(bpy.types.PropertyGroup):
         description="Path to the OpenRocket CSV simulation file",
         subtype='FILE_PATH',
     )
+    use_csv_sidecar: bpy.props.BoolProperty(
+        name="Cache Parsed CSV",
+        description="Store parsed CSV columns in a binary sidecar file and reuse it while the CSV is unchanged",
+        default=True,
+    )
     animate_rotation: bpy.props.BoolProperty(
         name="Animate Roll",
         description="Animate rocket roll from CSV roll rate",
@@ -34,6 +156,16 @@ class OpenRocketAnimProps(bpy.types.PropertyGroup):
         description="Animate rocket attitude from CSV orientation columns",
         default=False,
     )
+    rotation_output: bpy.props.EnumProperty(
+        name="Rotation Output",
+        description="How rocket rotation is written to the F-curves",
+        items=(
+            ('EULER', "Euler (Legacy)", "Zenith on X, azimuth plus roll on Euler Z"),
+            ('EULER_UNWRAPPED', "Euler (Continuous)", "Euler angles from the quaternion attitude, unwrapped to avoid flips"),
+            ('QUATERNION', "Quaternion", "Write rotation_quaternion curves from the quaternion attitude"),
+        ),
+        default='EULER',
+    )
     frame_offset: bpy.props.IntProperty(
         name="Start Offset (Frames)",
         default=0,
@@ -46,6 +178,65 @@ class OpenRocketAnimProps(bpy.types.PropertyGroup):
         min=0.0001,
         max=10.0,
     )
+    import_apply_scale: bpy.props.BoolProperty(
+        name="Scale on Import",
+        description="Apply the scale factor while importing, so Fix Scale is not needed",
+        default=True,
+    )
+    import_merge_parts: bpy.props.BoolProperty(
+        name="Merge Parts",
+        description="Join the imported parts into one object; instanced parts are parented to it",
+        default=False,
+    )
+    import_instance_parts: bpy.props.BoolProperty(
+        name="Instance Identical Parts",
+        description="Share one mesh between identical parts such as fins, placing each copy by its transform",
+        default=True,
+    )
+    import_decimate_ratio: bpy.props.FloatProperty(
+        name="Decimate Ratio",
+        description="Fraction of faces kept on import; 1 keeps the full model",
+        default=1.0,
+        min=0.01,
+        max=1.0,
+        subtype='FACTOR',
+    )
+    lod_levels: bpy.props.IntProperty(
+        name="LOD Levels",
+        description="Decimated copies generated for distant shots; 0 disables level of detail. Imports build them only with Merge Parts",
+        default=0,
+        min=0,
+        max=2,
+    )
+    lod_distance: bpy.props.FloatProperty(
+        name="LOD Distance",
+        description="Camera distance where LOD1 takes over; each further level switches in at 4x the previous distance",
+        default=150.0,
+        min=0.1,
+        unit='LENGTH',
+    )
+    update_existing_curves: bpy.props.BoolProperty(
+        name="Update Existing Curves",
+        description="Overwrite the existing location/rotation curves in place instead of clearing all animation",
+        default=True,
+    )
+    samples_per_frame: bpy.props.IntProperty(
+        name="Samples per Frame",
+        description="Resample the simulation onto this many evenly spaced samples per frame",
+        default=1,
+        min=1,
+        max=16,
+    )
+    keyframe_mode: bpy.props.EnumProperty(
+        name="Keyframe Mode",
+        description="How sampled frames are reduced to keyframes",
+        items=(
+            ('STEP', "Fixed Step", "Insert one keyframe every N sampled frames"),
+            ('ADAPTIVE', "Adaptive", "Keep only the keyframes needed to stay within the tolerances"),
+            ('BEZIER_FIT', "Bezier Fit", "Fit each channel with as few Bezier keyframes as the tolerances allow"),
+        ),
+        default='STEP',
+    )
     keyframe_step: bpy.props.IntProperty(
         name="Keyframe Frequency",
         description="Insert one keyframe every N sampled frames",
@@ -53,6 +244,68 @@ class OpenRocketAnimProps(bpy.types.PropertyGroup):
         min=1,
         max=100,
     )
+    location_tolerance: bpy.props.FloatProperty(
+        name="Location Tolerance",
+        description="Maximum location error allowed when dropping keyframes",
+        default=0.01,
+        min=0.0,
+        unit='LENGTH',
+    )
+    rotation_tolerance: bpy.props.FloatProperty(
+        name="Rotation Tolerance",
+        description="Maximum rotation error allowed when dropping keyframes",
+        default=0.0017453292519943296,
+        min=0.0,
+        unit='ROTATION',
+        subtype='ANGLE',
+    )
+    event_window: bpy.props.FloatProperty(
+        name="Event Window",
+        description="Seconds around each flight event (ignition, burnout, apogee, deployment) keyed densely; 0 keys uniformly",
+        default=0.5,
+        min=0.0,
+        soft_max=5.0,
+        unit='TIME_ABSOLUTE',
+    )
+    create_event_markers: bpy.props.BoolProperty(
+        name="Event Markers",
+        description="Add a timeline marker for every flight event in the CSV",
+        default=True,
+    )
+
+    flight_path_type: bpy.props.EnumProperty(
+        name="Path Type",
+        description="Geometry used for the flight path",
+        items=(
+            ('MESH', "Mesh", "Edge mesh with time, altitude and velocity point attributes"),
+            ('CURVE', "Curve", "Poly curve"),
+        ),
+        default='MESH',
+    )
+    flight_path_tolerance: bpy.props.FloatProperty(
+        name="Path Tolerance",
+        description="Drop path points that deviate less than this from the simplified line (0 keeps every point)",
+        default=0.0,
+        min=0.0,
+        unit='LENGTH',
+    )
+    telemetry_channels: bpy.props.CollectionProperty(
+        name="Telemetry Channels",
+        type=ORATelemetryChannel,
+    )
+    batch_items: bpy.props.CollectionProperty(
+        name="Batch Simulations",
+        type=ORABatchItem,
+    )
+    batch_use_processes: bpy.props.BoolProperty(
+        name="Use Processes",
+        description="Parse batch CSVs in separate processes to use every CPU core; threads only overlap file reads",
+        default=False,
+    )
+    camera_rig: bpy.props.CollectionProperty(
+        name="Camera Rig",
+        type=ORACameraRigItem,
+    )
 
     rocket_object: bpy.props.PointerProperty(
         name="Rocket Object",
@@ -99,6 +352,12 @@ class OpenRocketAnimProps(bpy.types.PropertyGroup):
         default=True,
         update=_update_mounted_camera_from_props,
     )
+    camera_mount_point: bpy.props.EnumProperty(
+        name="Mount Point",
+        description="Where new rocket cameras are attached",
+        items=MOUNT_POINT_ITEMS,
+        default='TOP',
+    )
     set_top_camera_active: bpy.props.BoolProperty(
         name="Set as Active Camera",
         description="Set the mounted rocket camera as the active scene camera when created",
@@ -130,6 +389,9 @@ class OpenRocketAnimProps(bpy.types.PropertyGroup):
 
 
 classes = (
+    ORABatchItem,
+    ORATelemetryChannel,
+    ORACameraRigItem,
     OpenRocketAnimProps,
 )
 
@@ -141,6 +403,9 @@ def register():
 
 
 def unregister():
+    if bpy.app.timers.is_registered(_flush_mounted_camera_updates):
+        bpy.app.timers.unregister(_flush_mounted_camera_updates)
+    _pending_camera_scenes.clear()
     if hasattr(bpy.types.Scene, "ora_props"):
         del bpy.types.Scene.ora_props
     for cls in reversed(classes):
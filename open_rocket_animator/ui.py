@@ -15,8 +15,12 @@ class ORA_PT_Panel(bpy.types.Panel):
         box1 = layout.box()
         box1.label(text="1. Import OBJ")
         box1.prop(props, "obj_filepath", text="OBJ File")
-        box1.operator("object.ora_import_obj", text="Import OBJ")
         box1.prop(props, "default_scale_factor")
+        box1.prop(props, "import_apply_scale")
+        box1.prop(props, "import_merge_parts")
+        box1.prop(props, "import_instance_parts")
+        box1.prop(props, "import_decimate_ratio")
+        box1.operator("object.ora_import_obj", text="Import OBJ")
 
         row_fix = box1.row(align=True)
         row_fix.operator("object.ora_fix_scale", text="Fix Scale")
@@ -25,16 +29,70 @@ class ORA_PT_Panel(bpy.types.Panel):
         box2 = layout.box()
         box2.label(text="2. Load CSV Simulation")
         box2.prop(props, "csv_filepath", text="CSV File")
+        box2.prop(props, "use_csv_sidecar")
 
         box3 = layout.box()
         box3.label(text="3. Animation Options")
         box3.prop(props, "animate_rotation")
         #box3.prop(props, "animate_attitude")
+        box3.prop(props, "rotation_output")
         box3.prop(props, "frame_offset")
-        box3.prop(props, "keyframe_step")
+        box3.prop(props, "update_existing_curves")
+        box3.prop(props, "samples_per_frame")
+        box3.prop(props, "keyframe_mode")
+        if props.keyframe_mode in {'ADAPTIVE', 'BEZIER_FIT'}:
+            box3.prop(props, "location_tolerance")
+            box3.prop(props, "rotation_tolerance")
+        else:
+            box3.prop(props, "keyframe_step")
+        box3.prop(props, "event_window")
+        box3.prop(props, "create_event_markers")
+        box_telemetry = box3.box()
+        box_telemetry.label(text="Telemetry Channels")
+        for index, channel in enumerate(props.telemetry_channels):
+            row = box_telemetry.row(align=True)
+            row.prop(channel, "enabled", text="")
+            row.prop(channel, "column", text="")
+            row.prop(channel, "property_name", text="")
+            row.prop(channel, "tolerance", text="")
+            row.operator("object.ora_telemetry_remove_channel", text="", icon='X').index = index
+        box_telemetry.operator("object.ora_telemetry_add_channel", text="Add Channel")
+
         box3.operator("object.ora_animate_csv", text="Animate from CSV")
+        box3.operator("object.ora_animate_csv_modal", text="Animate in Background")
         box3.operator("object.ora_convert_to_linear", text="Linear Animation")
 
+        row_live = box3.row(align=True)
+        row_live.operator("object.ora_live_playback_start", text="Live Preview")
+        row_live.operator("object.ora_live_playback_stop", text="Stop")
+        row_live.operator("object.ora_live_playback_bake", text="Bake")
+
+        box_lod = layout.box()
+        box_lod.label(text="Level of Detail")
+        box_lod.prop(props, "lod_levels")
+        box_lod.prop(props, "lod_distance")
+        row_lod = box_lod.row(align=True)
+        row_lod.operator("object.ora_generate_lods", text="Generate LODs")
+        row_lod.operator("object.ora_key_lod_switching", text="Key Switching")
+
+        box_path = layout.box()
+        box_path.label(text="Flight Path")
+        box_path.prop(props, "flight_path_type")
+        box_path.prop(props, "flight_path_tolerance")
+        box_path.operator("object.ora_create_flight_path", text="Create Flight Path")
+
+        box_batch = layout.box()
+        box_batch.label(text="Batch Animation")
+        for index, item in enumerate(props.batch_items):
+            row = box_batch.row(align=True)
+            row.prop(item, "target_object", text="")
+            row.prop(item, "csv_filepath", text="")
+            row.operator("object.ora_batch_remove_item", text="", icon='X').index = index
+        box_batch.prop(props, "batch_use_processes")
+        row_batch = box_batch.row(align=True)
+        row_batch.operator("object.ora_batch_add_item", text="Add Selected")
+        row_batch.operator("object.ora_batch_animate", text="Batch Animate")
+
         box4 = layout.box()
         box4.label(text="4. Camera Tools")
         box4.prop(props, "rocket_object")
@@ -46,6 +104,7 @@ class ORA_PT_Panel(bpy.types.Panel):
 
         box_rocket_camera = box4.box()
         box_rocket_camera.label(text="Rocket Camera")
+        box_rocket_camera.prop(props, "camera_mount_point")
         box_rocket_camera.prop(props, "set_top_camera_active")
         box_rocket_camera.prop(props, "offset_z_camera")
         box_rocket_camera.prop(props, "offset_x_camera")
@@ -55,7 +114,30 @@ class ORA_PT_Panel(bpy.types.Panel):
 
         row = box_rocket_camera.row(align=True)
         row.operator("object.ora_add_rocket_camera", text="Add Rocket Camera")
-        #row.operator("object.ora_update_rocket_camera", text="Update Camera")
+        row.operator("object.ora_update_rocket_camera", text="Update Cameras")
+
+        box_rig = box4.box()
+        box_rig.label(text="Camera Rig (baked)")
+        for index, item in enumerate(props.camera_rig):
+            col = box_rig.column(align=True)
+            row = col.row(align=True)
+            row.prop(item, "rig_type", text="")
+            row.prop(item, "camera_object", text="")
+            row.operator("object.ora_rig_remove_camera", text="", icon='X').index = index
+            if item.rig_type in {'GROUND', 'PAD'}:
+                col.prop(item, "location")
+            elif item.rig_type == 'CHASE':
+                col.prop(item, "distance")
+                col.prop(item, "height")
+            else:
+                col.prop(item, "mount_point")
+            row = col.row(align=True)
+            row.prop(item, "lens")
+            if item.rig_type != 'ONBOARD':
+                row.prop(item, "framing")
+        row_rig = box_rig.row(align=True)
+        row_rig.operator_menu_enum("object.ora_rig_add_camera", "rig_type", text="Add Camera")
+        row_rig.operator("object.ora_bake_camera_rig", text="Bake Rig")
 
         box_camera_noise = box4.box()
         box_camera_noise.label(text="Camera Shake (Noise)")
@@ -0,0 +1,124 @@
+import os
+import sys
+import timeit
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+sys.path.insert(0, TESTS_DIR)
+
+import fake_bpy  # noqa: E402
+
+# Installed before any test module imports the add-on, so operators and panels load.
+bpy = fake_bpy.install()
+
+from csv_factory import write_flight_csv  # noqa: E402
+from open_rocket_animator.core import csv_utils  # noqa: E402
+
+
+def pytest_addoption(parser):
+    parser.addoption("--benchmarks", action="store_true", default=False, help="run the slow benchmark tests")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: slow timing/memory comparison, run with --benchmarks")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark; run with --benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+BENCHMARK_RESULTS = []
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not BENCHMARK_RESULTS:
+        return
+    terminalreporter.section("benchmarks")
+    for name, best in BENCHMARK_RESULTS:
+        terminalreporter.write_line(f"{name:<60} {best:10.4f}")
+
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    # Minimal stand-in for the pytest-benchmark fixture: best wall time over a few runs.
+
+    class _TimeitBenchmark:
+        def __init__(self, name, rounds=3):
+            self.name = name
+            self.rounds = rounds
+            self.best = None
+
+        def __call__(self, func, *args, **kwargs):
+            result = None
+
+            def run():
+                nonlocal result
+                result = func(*args, **kwargs)
+
+            self.best = min(timeit.repeat(run, number=1, repeat=self.rounds))
+            BENCHMARK_RESULTS.append((f"{self.name}, best seconds", self.best))
+            return result
+
+        def pedantic(self, func, args=(), kwargs=None, setup=None, rounds=1, iterations=1):
+            kwargs = kwargs or {}
+            best = None
+            result = None
+            for _round in range(rounds):
+                if setup is not None:
+                    args, kwargs = setup() or (args, kwargs)
+                started = timeit.default_timer()
+                result = func(*args, **kwargs)
+                elapsed = timeit.default_timer() - started
+                best = elapsed if best is None else min(best, elapsed)
+            self.best = best
+            BENCHMARK_RESULTS.append((f"{self.name}, best seconds", best))
+            return result
+
+    @pytest.fixture
+    def benchmark(request):
+        return _TimeitBenchmark(request.node.name)
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    csv_utils.clear_parse_cache()
+    yield
+    csv_utils.clear_parse_cache()
+
+
+@pytest.fixture
+def flight_csv(tmp_path):
+    # 1k-row export with events, attitude and roll columns.
+    return write_flight_csv(tmp_path / "flight.csv", rows=1000)
+
+
+@pytest.fixture(scope="session")
+def flight_csv_100k(tmp_path_factory):
+    return write_flight_csv(tmp_path_factory.mktemp("csv") / "flight_100k.csv", rows=100_000)
+
+
+@pytest.fixture(scope="session")
+def flight_csv_1m(tmp_path_factory):
+    return write_flight_csv(tmp_path_factory.mktemp("csv") / "flight_1m.csv", rows=1_000_000)
+
+
+@pytest.fixture
+def rocket():
+    return fake_bpy.Object("Rocket")
+
+
+@pytest.fixture
+def target():
+    # A rocket registered in bpy.data.objects, for operators that look objects up by name.
+    obj = fake_bpy.Object("ModalRocket")
+    bpy.data.objects[obj.name] = obj
+    yield obj
+    bpy.data.objects.pop(obj.name, None)
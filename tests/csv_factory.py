@@ -0,0 +1,77 @@
+"""Synthetic OpenRocket exports of any length, shaped like the real thing.
+
+A boost/coast/descent profile is sampled at a fixed rate and written with the
+OpenRocket comment header, event comments between data rows and the degree-sign
+units OpenRocket uses, in latin-1.
+"""
+
+import numpy as np
+
+HEADER = (
+    "Time (s)",
+    "Altitude (m)",
+    "Vertical velocity (m/s)",
+    "Total velocity (m/s)",
+    "Position East of launch (m)",
+    "Position North of launch (m)",
+    "Vertical orientation (zenith) (°)",
+    "Lateral orientation (azimuth) (°)",
+    "Roll rate (°/s)",
+)
+# (event name, fraction of the rows at which it is written)
+EVENTS = (("LAUNCH", 0.0), ("BURNOUT", 0.1), ("APOGEE", 0.5), ("RECOVERY_DEVICE_DEPLOYMENT", 0.52), ("GROUND_HIT", 1.0))
+CHUNK_ROWS = 100_000
+
+
+def flight_columns(rows, dt=0.01):
+    # Column-major float64 block in HEADER order.
+    t = np.arange(rows, dtype=np.float64) * dt
+    duration = max(t[-1], dt)
+    phase = t / duration
+    altitude = 1000.0 * np.sin(np.pi * phase)
+    vertical_velocity = np.gradient(altitude, dt) if rows > 1 else np.zeros(rows)
+    east = 50.0 * phase ** 2
+    north = 20.0 * phase
+    total_velocity = np.hypot(vertical_velocity, np.gradient(east, dt) if rows > 1 else 0.0)
+    zenith = 5.0 + 80.0 * phase
+    # Azimuth crosses the 360 degree seam halfway through.
+    azimuth = (350.0 + 20.0 * phase) % 360.0
+    roll_rate = 90.0 * np.ones(rows)
+    return np.vstack((t, altitude, vertical_velocity, total_velocity, east, north, zenith, azimuth, roll_rate))
+
+
+def event_rows(rows):
+    return [(name, min(int(fraction * rows), rows - 1)) for name, fraction in EVENTS]
+
+
+def write_flight_csv(path, rows=1000, dt=0.01, events=True, blank_leading_attitude=0):
+    # blank_leading_attitude leaves the orientation and roll cells of the first rows
+    # empty, as OpenRocket does before the rocket leaves the rail.
+    block = flight_columns(rows, dt)
+    markers = {}
+    if events:
+        for name, row in event_rows(rows):
+            markers.setdefault(row, []).append(f"# Event {name} occurred at t={block[0, row]:.4f} seconds\n")
+
+    with open(path, 'w', encoding='latin-1', newline='') as handle:
+        handle.write("# Simulation 1 (Rocket)\n")
+        handle.write("# " + ",".join(HEADER) + "\n")
+        boundaries = sorted(set(markers) | set(range(0, rows, CHUNK_ROWS)) | {rows})
+        for start, end in zip(boundaries[:-1], boundaries[1:]):
+            handle.writelines(markers.get(start, ()))
+            lines = _format_rows(block[:, start:end].T)
+            if start < blank_leading_attitude:
+                blank = min(end, blank_leading_attitude) - start
+                lines[:blank] = [_blank_attitude(line) for line in lines[:blank]]
+            handle.writelines(lines)
+    return path
+
+
+def _format_rows(rows):
+    return [",".join(f"{value:.6f}" for value in row) + "\n" for row in rows.tolist()]
+
+
+def _blank_attitude(line):
+    cells = line.rstrip("\n").split(",")
+    cells[6:] = [""] * (len(cells) - 6)
+    return ",".join(cells) + "\n"
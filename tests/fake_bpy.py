@@ -0,0 +1,319 @@
+"""Lightweight stand-in for ``bpy``/``mathutils`` so the add-on imports on plain CPython.
+
+Only what the add-on touches at import time is provided, plus an in-memory slotted
+action model (action -> slot -> channelbag -> F-curves) with ``foreach_get``/
+``foreach_set`` keyframe storage, enough to run the keyframe writers and to time
+them against the legacy per-row ``keyframe_insert`` loop.
+"""
+
+import sys
+import types
+
+import numpy as np
+
+# Per-attribute (components, dtype) of FCurveKeyframePoints as seen by foreach_set.
+KEYFRAME_ATTRIBUTES = {
+    "co": (2, np.float32),
+    "handle_left": (2, np.float32),
+    "handle_right": (2, np.float32),
+    "interpolation": (1, np.int32),
+    "handle_left_type": (1, np.int32),
+    "handle_right_type": (1, np.int32),
+}
+# Blender's defaults for a freshly inserted key: BEZIER, AUTO_CLAMPED handles.
+KEYFRAME_DEFAULTS = {"interpolation": 2, "handle_left_type": 4, "handle_right_type": 4}
+
+
+class KeyframePoints:
+    # Column buffers grow by doubling, so appending keys one at a time stays amortized
+    # O(1) like Blender's own array, and keyframe_insert timings are not dominated by copies.
+
+    def __init__(self):
+        self._count = 0
+        self._buffers = {name: np.zeros((0, size), dtype=dtype) for name, (size, dtype) in KEYFRAME_ATTRIBUTES.items()}
+
+    def __len__(self):
+        return self._count
+
+    def add(self, count):
+        needed = self._count + count
+        for name, (size, dtype) in KEYFRAME_ATTRIBUTES.items():
+            buffer = self._buffers[name]
+            if len(buffer) < needed:
+                grown = np.zeros((max(needed, 2 * len(buffer)), size), dtype=dtype)
+                grown[:self._count] = buffer[:self._count]
+                self._buffers[name] = buffer = grown
+            buffer[self._count:needed] = KEYFRAME_DEFAULTS.get(name, 0)
+        self._count = needed
+
+    def clear(self):
+        self._count = 0
+
+    def foreach_set(self, attribute, values):
+        size, _dtype = KEYFRAME_ATTRIBUTES[attribute]
+        values = np.asarray(values)
+        if values.size != self._count * size:
+            raise ValueError(f"foreach_set('{attribute}') got {values.size} items for {self._count} points")
+        self._buffers[attribute][:self._count] = values.reshape(-1, size)
+
+    def foreach_get(self, attribute, buffer):
+        buffer[:] = self._buffers[attribute][:self._count].ravel()
+
+    def insert(self, frame, value):
+        # keyframe_insert semantics: replace a key on the same frame, else add in order.
+        co = self._buffers["co"]
+        frame = np.float32(frame)
+        position = int(np.searchsorted(co[:self._count, 0], frame))
+        if position < self._count and co[position, 0] == frame:
+            co[position, 1] = value
+            return
+        self.add(1)
+        if position < self._count - 1:
+            for buffer in self._buffers.values():
+                buffer[position + 1:self._count] = buffer[position:self._count - 1].copy()
+            for name, buffer in self._buffers.items():
+                buffer[position] = KEYFRAME_DEFAULTS.get(name, 0)
+        self._buffers["co"][position] = (frame, value)
+
+    def sort(self):
+        order = np.argsort(self._buffers["co"][:self._count, 0], kind="stable")
+        for buffer in self._buffers.values():
+            buffer[:self._count] = buffer[:self._count][order]
+
+    def array(self, attribute="co"):
+        return self._buffers[attribute][:self._count].copy()
+
+
+class FCurve:
+    def __init__(self, data_path, array_index):
+        self.data_path = data_path
+        self.array_index = array_index
+        self.keyframe_points = KeyframePoints()
+        self.modifiers = []
+        self.mute = False
+        self.update_calls = 0
+
+    def update(self):
+        self.update_calls += 1
+        self.keyframe_points.sort()
+
+    def evaluate(self, frame):
+        co = self.keyframe_points.array("co")
+        return float(np.interp(frame, co[:, 0], co[:, 1]))
+
+
+class FCurves(list):
+    def remove(self, fcurve):
+        list.remove(self, fcurve)
+
+
+class Channelbag:
+    def __init__(self):
+        self.fcurves = FCurves()
+
+
+class Slot:
+    def __init__(self, id_type, name):
+        self.id_type = id_type
+        self.name = name
+        self.identifier = id_type[:2] + name
+
+
+class Slots(list):
+    def new(self, id_type, name):
+        slot = Slot(id_type, name)
+        self.append(slot)
+        return slot
+
+
+class Strip:
+    type = "KEYFRAME"
+
+    def __init__(self):
+        self._channelbags = {}
+
+    def channelbag(self, slot, ensure=False):
+        if ensure and slot.identifier not in self._channelbags:
+            self._channelbags[slot.identifier] = Channelbag()
+        return self._channelbags.get(slot.identifier)
+
+
+class Layer:
+    def __init__(self):
+        self.strips = [Strip()]
+
+
+class Action:
+    def __init__(self, name):
+        self.name = name
+        self.users = 0
+        self.slots = Slots()
+        self.layers = [Layer()]
+
+    def fcurve_ensure_for_datablock(self, datablock, data_path, index=0):
+        channelbag = self.layers[0].strips[0].channelbag(datablock.animation_data.action_slot, ensure=True)
+        for fcurve in channelbag.fcurves:
+            if fcurve.data_path == data_path and fcurve.array_index == index:
+                return fcurve
+        fcurve = FCurve(data_path, index)
+        channelbag.fcurves.append(fcurve)
+        return fcurve
+
+
+class AnimData:
+    def __init__(self):
+        self._action = None
+        self.action_slot = None
+
+    @property
+    def action(self):
+        return self._action
+
+    @action.setter
+    def action(self, action):
+        # Assigning an action moves its user count, as ID pointers do in Blender.
+        if self._action is not None:
+            self._action.users -= 1
+        if action is not None:
+            action.users += 1
+        else:
+            self.action_slot = None
+        self._action = action
+
+
+class Actions(list):
+    def new(self, name):
+        action = Action(name)
+        self.append(action)
+        return action
+
+    def remove(self, action):
+        list.remove(self, action)
+
+
+class IDCollection(dict):
+    # bpy.data collections: looked up by name, iterated as datablocks.
+    def __iter__(self):
+        return iter(list(self.values()))
+
+
+class Object:
+    id_type = "OBJECT"
+    type = "MESH"
+
+    def __init__(self, name="Rocket"):
+        self.name = name
+        self.animation_data = None
+        self.location = [0.0, 0.0, 0.0]
+        self.rotation_euler = [0.0, 0.0, 0.0]
+        self.rotation_quaternion = [1.0, 0.0, 0.0, 0.0]
+        self.rotation_mode = "XYZ"
+        self._properties = {}
+
+    def animation_data_create(self):
+        if self.animation_data is None:
+            self.animation_data = AnimData()
+        return self.animation_data
+
+    def animation_data_clear(self):
+        if self.animation_data is not None:
+            self.animation_data.action = None
+        self.animation_data = None
+
+    def as_pointer(self):
+        return id(self)
+
+    def keys(self):
+        return self._properties.keys()
+
+    def __getitem__(self, key):
+        return self._properties[key]
+
+    def __setitem__(self, key, value):
+        self._properties[key] = value
+
+    def fcurves(self):
+        action = self.animation_data.action
+        channelbag = action.layers[0].strips[0].channelbag(self.animation_data.action_slot)
+        return list(channelbag.fcurves) if channelbag else []
+
+    def keyframe_insert(self, data_path, frame):
+        # Legacy path: one key per array index from the current property value.
+        from open_rocket_animator.core.animation_utils import ensure_action_and_slot
+
+        action, _slot = ensure_action_and_slot(self)
+        for index, value in enumerate(getattr(self, data_path)):
+            fcurve = action.fcurve_ensure_for_datablock(self, data_path, index)
+            fcurve.keyframe_points.insert(frame, value)
+        return True
+
+
+def _make_class(name):
+    return type(name, (), {})
+
+
+class _TypesModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        cls = _make_class(name)
+        setattr(self, name, cls)
+        return cls
+
+
+class _PropsModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        def prop(**kwargs):
+            return (name, kwargs)
+
+        return prop
+
+
+def _build_bpy():
+    bpy = types.ModuleType("bpy")
+    bpy.types = _TypesModule("bpy.types")
+    bpy.props = _PropsModule("bpy.props")
+    bpy.utils = types.SimpleNamespace(register_class=lambda cls: None, unregister_class=lambda cls: None)
+    bpy.path = types.SimpleNamespace(abspath=lambda path: path)
+    bpy.data = types.SimpleNamespace(actions=Actions(), objects=IDCollection(), scenes=IDCollection())
+    bpy.context = types.SimpleNamespace()
+    bpy.app = types.SimpleNamespace(
+        handlers=types.SimpleNamespace(
+            persistent=lambda func: func,
+            frame_change_pre=[],
+            load_pre=[],
+            save_pre=[],
+            save_post=[],
+        ),
+        timers=types.SimpleNamespace(
+            register=lambda func, first_interval=0.0: None,
+            unregister=lambda func: None,
+            is_registered=lambda func: False,
+        ),
+    )
+    bpy.ops = types.SimpleNamespace()
+    return bpy
+
+
+def _build_mathutils():
+    mathutils = types.ModuleType("mathutils")
+
+    class Matrix(list):
+        @classmethod
+        def Diagonal(cls, values):
+            return cls(np.diag(values).tolist())
+
+    mathutils.Matrix = Matrix
+    mathutils.Vector = tuple
+    return mathutils
+
+
+def install():
+    # Idempotent; returns the fake bpy module.
+    if "bpy" not in sys.modules:
+        sys.modules["bpy"] = _build_bpy()
+        sys.modules["mathutils"] = _build_mathutils()
+    return sys.modules["bpy"]
@@ -0,0 +1,50 @@
+"""The pre-NumPy reading path, kept as the reference for regression and benchmark tests.
+
+Mirrors the original operator loop: readlines(), csv.reader over every data row and
+safe_float per cell, dropping rows whose time or position is unreadable.
+"""
+
+from open_rocket_animator.core.csv_utils import (
+    detect_header_and_data_start,
+    find_header_index,
+    iter_csv_rows,
+    read_openrocket_csv_lines,
+    safe_float,
+)
+
+POSITION_QUERIES = (("time", "Time"), ("x", "Position East"), ("y", "Position North"), ("z", "Altitude"))
+
+
+def legacy_read_rows(csv_path):
+    # Returns {role: [float, ...]} over the rows the legacy loop would have keyed.
+    lines = read_openrocket_csv_lines(csv_path)
+    header, data_start = detect_header_and_data_start(lines)
+    indices = {role: find_header_index(header, query) for role, query in POSITION_QUERIES}
+    rows = {role: [] for role in indices}
+    for row in iter_csv_rows(lines, data_start):
+        if not row or row[0].strip().startswith('#'):
+            continue
+        values = {role: safe_float(row[idx]) for role, idx in indices.items()}
+        if None in values.values():
+            continue
+        for role, value in values.items():
+            rows[role].append(value)
+    return rows
+
+
+def legacy_parse_columns(lines, header, data_start):
+    # Every header column over every non-comment row, with None for unreadable cells.
+    columns = {name: [] for name in header}
+    for row in iter_csv_rows(lines, data_start):
+        if not row or row[0].strip().startswith('#'):
+            continue
+        for idx, name in enumerate(header):
+            columns[name].append(safe_float(row[idx]) if idx < len(row) else None)
+    return columns
+
+
+def legacy_key_rows(obj, frames, locations):
+    # One keyframe_insert per row and axis set, as the original operator did.
+    for frame, location in zip(frames.tolist(), locations.tolist()):
+        obj.location = location
+        obj.keyframe_insert(data_path="location", frame=frame)
@@ -0,0 +1,69 @@
+"""Stand-ins for the Blender context operators receive, for driving them in tests."""
+
+from types import SimpleNamespace
+
+import bpy
+import numpy as np
+
+from open_rocket_animator.core import animation_utils
+
+
+def make_context(csv_path, obj, update_existing_curves=True, **overrides):
+    props = SimpleNamespace(
+        csv_filepath=str(csv_path),
+        animate_rotation=True,
+        animate_attitude=False,
+        use_csv_sidecar=False,
+        frame_offset=0,
+        samples_per_frame=1,
+        keyframe_mode='STEP',
+        keyframe_step=1,
+        location_tolerance=0.0,
+        rotation_tolerance=0.0,
+        rotation_output='EULER',
+        event_window=0.0,
+        create_event_markers=False,
+        telemetry_channels=[],
+        update_existing_curves=update_existing_curves,
+    )
+    vars(props).update(overrides)
+    window_manager = SimpleNamespace(
+        event_timer_add=lambda interval, window=None: object(),
+        event_timer_remove=lambda timer: None,
+        progress_begin=lambda low, high: None,
+        progress_update=lambda value: None,
+        progress_end=lambda: None,
+        modal_handler_add=lambda operator: None,
+    )
+    scene = SimpleNamespace(
+        ora_props=props,
+        render=SimpleNamespace(fps=24),
+        frame_start=1,
+        frame_end=250,
+        frame_current=0,
+        frame_subframe=0.0,
+        objects=bpy.data.objects,
+    )
+    return SimpleNamespace(
+        scene=scene,
+        view_layer=SimpleNamespace(objects=SimpleNamespace(active=obj)),
+        window_manager=window_manager,
+        window=None,
+        workspace=None,
+        area=None,
+    )
+
+
+def existing_animation(obj):
+    # Hand-keyed location plus a custom channel that must survive the flight write.
+    frames = np.array([0.0, 100.0])
+    animation_utils.write_channel_keyframe_sets(obj, "location", [(frames, np.array([5.0, 6.0]))] * 3)
+    animation_utils.write_channel_keyframe_sets(obj, "scale", [(frames, np.array([1.0, 2.0]))])
+    return obj.animation_data.action
+
+
+def curve_keys(obj, data_path, index):
+    for fcurve in obj.fcurves():
+        if fcurve.data_path == data_path and fcurve.array_index == index:
+            return fcurve.keyframe_points.array("co")
+    return None
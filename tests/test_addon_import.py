@@ -0,0 +1,29 @@
+import importlib
+
+import open_rocket_animator
+
+
+def test_addon_loads_every_module_under_bpy():
+    assert open_rocket_animator.bl_info["blender"] >= (5, 0, 0)
+    names = {module.__name__.rsplit(".", 1)[-1] for module in open_rocket_animator.MODULES}
+    assert {"properties", "animation", "live", "camera", "ui"} <= names
+
+
+def test_register_round_trip():
+    open_rocket_animator.register()
+    open_rocket_animator.unregister()
+
+
+def test_core_and_headless_import():
+    core = importlib.import_module("open_rocket_animator.core")
+    for name in core.__all__:
+        assert hasattr(core, name)
+    headless = importlib.import_module("open_rocket_animator.headless")
+    args = headless.build_arg_parser().parse_args(["--csv", "flight.csv", "--output", "shot.blend"])
+    assert args.keyframe_mode == 'STEP'
+
+
+def test_headless_main_reports_failure_status(tmp_path):
+    headless = importlib.import_module("open_rocket_animator.headless")
+    missing = str(tmp_path / "missing.csv")
+    assert headless.main(["--csv", missing, "--output", str(tmp_path / "shot.blend")]) == 1
@@ -0,0 +1,67 @@
+import numpy as np
+
+from open_rocket_animator.core import animation_utils
+from open_rocket_animator.core.keyframe_utils import plan_flight_keyframes
+
+
+def _samples(count=50):
+    frames = np.arange(count, dtype=np.float64)
+    return {
+        "frames": frames,
+        "location": [frames * 0.1, np.sin(frames), frames ** 2],
+        "rotation": None,
+        "telemetry": {"speed": frames * 2.0},
+    }
+
+
+def _curve_values(rocket, data_path, index):
+    for fcurve in rocket.fcurves():
+        if fcurve.data_path == data_path and fcurve.array_index == index:
+            return fcurve.keyframe_points.array("co")
+    return None
+
+
+def test_bulk_write_matches_keyframe_insert(rocket):
+    import fake_bpy
+
+    samples = _samples()
+    plan = plan_flight_keyframes(samples)
+    written, sampled = animation_utils.write_keyframe_plan(rocket, plan)
+    assert written == sampled == 50 * 4
+
+    legacy = fake_bpy.Object("Legacy")
+    for frame, x, y, z in zip(samples["frames"], *samples["location"]):
+        legacy.location = [x, y, z]
+        legacy.keyframe_insert("location", frame)
+    for index in range(3):
+        np.testing.assert_array_equal(_curve_values(rocket, "location", index), _curve_values(legacy, "location", index))
+
+
+def test_rewrite_reuses_unchanged_curves(rocket):
+    plan = plan_flight_keyframes(_samples())
+    animation_utils.write_keyframe_plan(rocket, plan)
+    updates = [fcurve.update_calls for fcurve in rocket.fcurves()]
+    animation_utils.write_keyframe_plan(rocket, plan)
+    assert [fcurve.update_calls for fcurve in rocket.fcurves()] == updates
+
+
+def test_reset_keeps_telemetry_curves(rocket):
+    plan = plan_flight_keyframes(_samples())
+    animation_utils.write_keyframe_plan(rocket, plan)
+    animation_utils.reset_flight_animation(rocket, [entry for entry in plan if entry[0] != "location"])
+    assert {fcurve.data_path for fcurve in rocket.fcurves()} == {'["speed"]'}
+
+
+def test_enum_values_follow_blender_order():
+    # rna_enum_keyframe_handle_type_items / beztriple_interpolation_mode_items.
+    assert animation_utils.HANDLE_TYPES == {'FREE': 0, 'AUTO': 1, 'VECTOR': 2, 'ALIGNED': 3, 'AUTO_CLAMPED': 4}
+    assert animation_utils.INTERPOLATION_MODES == {'CONSTANT': 0, 'LINEAR': 1, 'BEZIER': 2}
+
+
+def test_fitted_handles_are_written_as_free(rocket):
+    frames = np.array([0.0, 10.0])
+    keyframe_set = (frames, np.array([0.0, 1.0]), [[-3.0, 0.0], [7.0, 1.0]], [[3.0, 0.0], [13.0, 1.0]])
+    animation_utils.write_channel_keyframe_sets(rocket, "location", [keyframe_set])
+    points = rocket.fcurves()[0].keyframe_points
+    assert points.array("handle_left_type").ravel().tolist() == [0, 0]
+    np.testing.assert_array_equal(points.array("handle_right"), [[3.0, 0.0], [13.0, 1.0]])
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from csv_factory import write_flight_csv
+from open_rocket_animator.core import batch_utils, trajectory_utils
+
+
+def batch_settings(**overrides):
+    settings = {
+        "animate_roll": True,
+        "animate_attitude": True,
+        "use_sidecar": False,
+        "fps": 24,
+        "frame_offset": 0,
+        "subframes": 1,
+        "base_euler": (0.0, 0.0, 0.0),
+        "rotation_mode": 'EULER',
+        "keyframe_mode": 'ADAPTIVE',
+        "keyframe_step": 1,
+        "location_tolerance": 0.01,
+        "rotation_tolerance": 0.001,
+        "event_window": 0.5,
+    }
+    settings.update(overrides)
+    return settings
+
+
+def _assert_same_plan(plan, expected):
+    assert [entry[0] for entry in plan] == [entry[0] for entry in expected]
+    for entry, expected_entry in zip(plan, expected):
+        for keyframe_set, expected_set in zip(entry[1], expected_entry[1]):
+            np.testing.assert_array_equal(keyframe_set[0], expected_set[0])
+            np.testing.assert_array_equal(keyframe_set[1], expected_set[1])
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_batch_plans_match_the_single_file_plan(tmp_path, use_processes):
+    paths = [str(write_flight_csv(tmp_path / f"flight_{index}.csv", rows=500 + 100 * index)) for index in range(3)]
+    jobs = [(path, {"base_euler": (0.0, 0.0, 0.1 * index)}) for index, path in enumerate(paths)]
+    jobs.append((str(tmp_path / "missing.csv"), None))
+    results = batch_utils.compute_batch_plans(jobs, batch_settings(), max_workers=2, use_processes=use_processes)
+
+    assert [result["csv_path"] for result in results] == [job[0] for job in jobs]
+    assert results[-1]["error"] is not None
+    for (path, overrides), result in zip(jobs[:-1], results):
+        assert result["error"] is None
+        expected, max_frame, _warnings = trajectory_utils.compute_animation_plan(
+            batch_settings(csv_path=path, **overrides)
+        )
+        assert result["max_frame"] == max_frame
+        _assert_same_plan(result["plan"], expected)
@@ -0,0 +1,180 @@
+"""Timing and memory comparisons against the legacy path; skipped unless pytest runs with --benchmarks.
+
+Uses pytest-benchmark when installed, otherwise the timeit fallback from conftest.
+"""
+
+import os
+import subprocess
+import sys
+
+import fake_bpy
+import numpy as np
+import pytest
+
+from conftest import BENCHMARK_RESULTS
+from csv_factory import write_flight_csv
+from legacy_pipeline import legacy_key_rows, legacy_read_rows
+from open_rocket_animator.core import animation_utils, batch_utils, csv_utils, trajectory_utils
+from open_rocket_animator.core.keyframe_utils import plan_flight_keyframes
+from test_batch_utils import batch_settings
+
+pytestmark = pytest.mark.benchmark
+
+SIZES = {"1k": "flight_csv", "100k": "flight_csv_100k", "1m": "flight_csv_1m"}
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+POSITION_COLUMNS = ["Time (s)", "Position East of launch (m)", "Position North of launch (m)", "Altitude (m)"]
+
+
+@pytest.fixture(params=sorted(SIZES))
+def sized_csv(request):
+    return request.getfixturevalue(SIZES[request.param])
+
+
+def test_parse_streaming(benchmark, sized_csv):
+    _header, columns = benchmark(csv_utils.read_openrocket_columns, sized_csv, POSITION_COLUMNS)
+    assert len(columns["Time (s)"])
+
+
+def test_parse_legacy(benchmark, sized_csv):
+    rows = benchmark(legacy_read_rows, sized_csv)
+    assert len(rows["time"])
+
+
+def test_load_from_cache(benchmark, flight_csv_100k):
+    csv_utils.load_openrocket_columns(flight_csv_100k, POSITION_COLUMNS, use_sidecar=False)
+    benchmark(csv_utils.load_openrocket_columns, flight_csv_100k, POSITION_COLUMNS, use_sidecar=False)
+    assert csv_utils.parse_cache_stats()["hits"] >= 1
+
+
+def test_load_from_sidecar(benchmark, flight_csv_100k):
+    csv_utils.load_openrocket_columns(flight_csv_100k, POSITION_COLUMNS, cache=csv_utils.ParsedColumnCache())
+    _header, columns = benchmark(csv_utils.read_sidecar, flight_csv_100k, POSITION_COLUMNS)
+    assert len(columns["Time (s)"]) == 100_000
+
+
+@pytest.mark.parametrize("mode", ['STEP', 'ADAPTIVE', 'BEZIER_FIT'])
+def test_sample_and_plan_100k(benchmark, flight_csv_100k, mode):
+    flight, _warnings = trajectory_utils.load_flight_data(
+        flight_csv_100k, animate_roll=True, animate_attitude=True, use_sidecar=False
+    )
+
+    def sample_and_plan():
+        samples = trajectory_utils.sample_flight(flight, 24, rotation_mode='EULER_UNWRAPPED')
+        return plan_flight_keyframes(samples, mode, 1, 0.01, 0.001)
+
+    plan = benchmark(sample_and_plan)
+    assert np.isfinite(plan[0][1][0][1]).all()
+
+
+@pytest.fixture(scope="module")
+def location_rows_100k(flight_csv_100k):
+    # 100k position rows on one key per row, the legacy operator's STEP=1 workload.
+    _header, columns = csv_utils.read_openrocket_columns(flight_csv_100k, POSITION_COLUMNS)
+    frames = np.arange(len(columns["Time (s)"]), dtype=np.float64)
+    locations = np.stack([columns[name] for name in POSITION_COLUMNS[1:]], axis=1)
+    return frames, locations
+
+
+def test_write_keys_bulk_100k(benchmark, location_rows_100k):
+    frames, locations = location_rows_100k
+    plan = [("location", [(frames, locations[:, axis]) for axis in range(3)], 'BEZIER', len(frames) * 3)]
+
+    def write():
+        return animation_utils.write_keyframe_plan(fake_bpy.Object("Bulk"), plan)
+
+    written, _sampled = benchmark(write)
+    assert written == 300_000
+
+
+def test_write_keys_legacy_100k(benchmark, location_rows_100k):
+    frames, locations = location_rows_100k
+
+    def write():
+        obj = fake_bpy.Object("Legacy")
+        legacy_key_rows(obj, frames, locations)
+        return obj
+
+    obj = benchmark.pedantic(write, rounds=1)
+    assert sum(len(fcurve.keyframe_points) for fcurve in obj.fcurves()) == 300_000
+
+
+BATCH_WORKERS = min(4, os.cpu_count() or 1)
+
+
+@pytest.fixture(scope="module")
+def batch_csvs(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("batch")
+    return [str(write_flight_csv(directory / f"flight_{index}.csv", rows=100_000)) for index in range(BATCH_WORKERS)]
+
+
+@pytest.mark.parametrize("pool", ["serial", "threads", "processes"])
+def test_batch_plans_100k(benchmark, batch_csvs, pool):
+    # One 100k-row file per core (up to 4); the parse cache is cleared so every round parses.
+    jobs = [(path, None) for path in batch_csvs]
+
+    def run():
+        csv_utils.clear_parse_cache()
+        return batch_utils.compute_batch_plans(
+            jobs,
+            batch_settings(),
+            max_workers=1 if pool == "serial" else BATCH_WORKERS,
+            use_processes=pool == "processes",
+        )
+
+    results = benchmark.pedantic(run, rounds=3)
+    assert all(result["error"] is None for result in results)
+
+
+RSS_SCRIPTS = {
+    "baseline": "",
+    "streaming": "csv_utils.read_openrocket_columns(path, columns)",
+    "readlines": (
+        "lines = csv_utils.read_openrocket_csv_lines(path)\n"
+        "header, data_start = csv_utils.detect_header_and_data_start(lines)\n"
+        "csv_utils.parse_openrocket_columns(lines, header, data_start, columns)"
+    ),
+}
+
+
+def _peak_rss_kib(csv_path, body):
+    # Peak resident set of a fresh interpreter that imports csv_utils and runs body. Read
+    # from VmHWM: ru_maxrss of a forked child starts at the (large) pytest parent's peak.
+    script = "\n".join(
+        (
+            "import sys",
+            f"sys.path.insert(0, {REPO_ROOT!r})",
+            "from open_rocket_animator.core import csv_utils",
+            f"path, columns = {str(csv_path)!r}, {POSITION_COLUMNS!r}",
+            body,
+            "print(next(line for line in open('/proc/self/status') if line.startswith('VmHWM')))",
+        )
+    )
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    return int(output.split()[1])
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="needs /proc/self/status")
+def test_peak_rss_1m(flight_csv_1m):
+    peaks = {name: _peak_rss_kib(flight_csv_1m, body) for name, body in RSS_SCRIPTS.items()}
+    streaming = peaks["streaming"] - peaks["baseline"]
+    readlines = peaks["readlines"] - peaks["baseline"]
+    BENCHMARK_RESULTS.append(("peak RSS over import, streaming 1M rows, MiB", streaming / 1024.0))
+    BENCHMARK_RESULTS.append(("peak RSS over import, readlines 1M rows, MiB", readlines / 1024.0))
+    # Four float64 columns of 1M rows are 32 MiB; readlines also holds every text line.
+    assert streaming < readlines
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="needs /proc/self/status")
+def test_streaming_overhead_stays_flat(flight_csv_100k, flight_csv_1m):
+    # Peak RSS beyond the returned columns themselves: one chunk of text and its parse
+    # temporaries for streaming, the whole file's lines for readlines.
+    overheads = {}
+    for label, path, rows in (("100k", flight_csv_100k, 100_000), ("1M", flight_csv_1m, 1_000_000)):
+        baseline = _peak_rss_kib(path, RSS_SCRIPTS["baseline"])
+        result_kib = rows * len(POSITION_COLUMNS) * 8 / 1024.0
+        for name in ("streaming", "readlines"):
+            overhead = (_peak_rss_kib(path, RSS_SCRIPTS[name]) - baseline - result_kib) / 1024.0
+            overheads[name, label] = overhead
+            BENCHMARK_RESULTS.append((f"peak RSS beyond result, {name} {label} rows, MiB", overhead))
+    assert overheads["streaming", "1M"] < overheads["streaming", "100k"] + 8.0
+    assert overheads["readlines", "1M"] > overheads["readlines", "100k"] + 64.0
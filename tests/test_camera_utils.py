@@ -0,0 +1,128 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from open_rocket_animator.core import camera_utils
+
+
+class _Vertices:
+    def __init__(self, co):
+        self.co = np.asarray(co, dtype=np.float32)
+        self.reads = 0
+
+    def __len__(self):
+        return len(self.co)
+
+    def foreach_get(self, attribute, buffer):
+        self.reads += 1
+        buffer[:] = self.co.ravel()
+
+
+class _Mesh:
+    def __init__(self, co):
+        self.vertices = _Vertices(co)
+
+    def as_pointer(self):
+        return id(self)
+
+
+def _mesh_object(name, co, children=()):
+    co = np.asarray(co, dtype=np.float64)
+    mins, maxs = co.min(axis=0), co.max(axis=0)
+    corners = [(x, y, z) for x in (mins[0], maxs[0]) for y in (mins[1], maxs[1]) for z in (mins[2], maxs[2])]
+    return SimpleNamespace(
+        name=name,
+        type='MESH',
+        data=_Mesh(co),
+        bound_box=corners,
+        matrix_world=np.eye(4),
+        children=list(children),
+    )
+
+
+def _ring(radius, z, count=16):
+    angles = np.linspace(0.0, 2.0 * np.pi, count, endpoint=False)
+    return np.c_[radius * np.cos(angles), radius * np.sin(angles), np.full(count, z)]
+
+
+@pytest.fixture(autouse=True)
+def clear_mount_cache():
+    camera_utils.clear_mount_cache()
+    yield
+    camera_utils.clear_mount_cache()
+
+
+@pytest.fixture
+def rocket():
+    body = np.vstack([_ring(0.05, 0.0), _ring(0.05, 0.5), _ring(0.05, 1.0), _ring(0.01, 1.28), [[0.0, 0.0, 1.3]]])
+    antenna = _mesh_object("Rocket_Antenna", _ring(0.01, 1.6) + [0.2, 0.0, 0.0])
+    return _mesh_object("Rocket", body, children=[antenna])
+
+
+def test_cache_hit_reads_no_vertices(rocket):
+    first = camera_utils.get_mount_points(rocket)
+    sources = [rocket, *rocket.children]
+    assert [obj.data.vertices.reads for obj in sources] == [1, 1]
+    assert camera_utils.get_mount_points(rocket) is first
+    assert [obj.data.vertices.reads for obj in sources] == [1, 1]
+
+
+def test_moving_a_child_misses_the_cache(rocket):
+    first = camera_utils.get_mount_points(rocket)
+    child = rocket.children[0]
+    child.matrix_world = np.eye(4)
+    child.matrix_world[2, 3] = 1.0
+    assert camera_utils.get_mount_points(rocket) is not first
+    assert child.data.vertices.reads == 2
+
+
+def test_clear_mount_cache_forces_a_fresh_read(rocket):
+    camera_utils.get_mount_points(rocket)
+    camera_utils.clear_mount_cache(rocket)
+    camera_utils.get_mount_points(rocket)
+    assert rocket.data.vertices.reads == 2
+
+
+def test_top_stays_on_the_rockets_own_bounds(rocket):
+    points = camera_utils.get_mount_points(rocket)
+    # The antenna child sticks out above and to the side; TOP ignores it.
+    assert points['TOP'] == pytest.approx((0.0, 0.0, 1.3))
+    assert points['NOSE'][2] == pytest.approx(1.6)
+
+
+class _CameraData:
+    # Stores clip_start as float32, like Blender does, and counts the writes.
+    def __init__(self):
+        self._clip_start = np.float32(0.1)
+        self.writes = 0
+
+    @property
+    def clip_start(self):
+        return float(self._clip_start)
+
+    @clip_start.setter
+    def clip_start(self, value):
+        self.writes += 1
+        self._clip_start = np.float32(value)
+
+
+@pytest.mark.parametrize("adjust_clip_start, offset_z", [(False, 0.0), (True, 0.0), (True, 0.25)])
+def test_live_offsets_do_not_rewrite_an_unchanged_clip_start(adjust_clip_start, offset_z):
+    camera = SimpleNamespace(
+        delta_location=(0.0, 0.0, 0.0),
+        rotation_mode='XYZ',
+        delta_rotation_euler=SimpleNamespace(z=0.0),
+        data=_CameraData(),
+    )
+    props = SimpleNamespace(
+        offset_x_camera=0.0,
+        offset_y_camera=0.0,
+        offset_z_camera=offset_z,
+        rotation_z_camera=0.0,
+        adjust_clip_start=adjust_clip_start,
+    )
+    camera_utils.apply_live_camera_offsets(camera, props)
+    writes = camera.data.writes
+    camera_utils.apply_live_camera_offsets(camera, props)
+    assert camera.data.writes == writes
@@ -0,0 +1,188 @@
+import numpy as np
+import pytest
+
+from csv_factory import HEADER, event_rows, flight_columns, write_flight_csv
+from legacy_pipeline import legacy_parse_columns
+from open_rocket_animator.core import csv_utils
+
+
+def test_read_columns_matches_generated_block(flight_csv):
+    header, columns = csv_utils.read_openrocket_columns(flight_csv)
+    assert header == list(HEADER)
+    block = flight_columns(1000)
+    for pos, name in enumerate(HEADER):
+        np.testing.assert_allclose(columns[name], block[pos], atol=5e-7)
+
+
+def test_chunked_read_equals_single_chunk(flight_csv):
+    names = ["Time (s)", "Altitude (m)"]
+    _header, whole = csv_utils.read_openrocket_columns(flight_csv, names)
+    _header, chunked = csv_utils.read_openrocket_columns(flight_csv, names, chunk_rows=97)
+    for name in names:
+        np.testing.assert_array_equal(whole[name], chunked[name])
+
+
+def test_columns_are_trimmed_views_of_one_preallocated_block(flight_csv):
+    _header, columns = csv_utils.read_openrocket_columns(flight_csv, ["Time (s)"], chunk_rows=97)
+    time = columns["Time (s)"]
+    assert len(time) == 1000
+    assert time.base is not None and len(time.base) == csv_utils.count_openrocket_lines(flight_csv)
+
+
+def test_lone_cr_line_endings_grow_the_columns(flight_csv, tmp_path):
+    # Newline counting sees one line here, so the preallocated columns must grow.
+    path = tmp_path / "cr.csv"
+    path.write_bytes(open(flight_csv, 'rb').read().replace(b'\n', b'\r'))
+    assert csv_utils.count_openrocket_lines(path) == 1
+    _header, expected = csv_utils.read_openrocket_columns(flight_csv)
+    _header, columns = csv_utils.read_openrocket_columns(path, chunk_rows=97)
+    for name in HEADER:
+        np.testing.assert_array_equal(columns[name], expected[name])
+
+
+def test_blank_cells_parse_as_nan(tmp_path):
+    path = write_flight_csv(tmp_path / "blank.csv", rows=200, blank_leading_attitude=10)
+    _header, columns = csv_utils.read_openrocket_columns(path)
+    roll = columns["Roll rate (°/s)"]
+    assert np.isnan(roll[:10]).all()
+    assert not np.isnan(roll[10:]).any()
+    assert not np.isnan(columns["Time (s)"]).any()
+
+
+def test_events_are_collected_during_the_column_pass(flight_csv):
+    events = []
+    csv_utils.read_openrocket_columns(flight_csv, ["Time (s)"], events=events)
+    assert [name for name, _time in events] == [name for name, _row in event_rows(1000)]
+    assert events == csv_utils.read_openrocket_events(flight_csv)
+    assert csv_utils.load_openrocket_events(flight_csv, use_sidecar=False)[2][0] == "APOGEE"
+
+
+@pytest.mark.parametrize(
+    "header, role, expected, factor",
+    [
+        (["Time (s)", "Altitude (ft)"], "z", "Altitude (ft)", 0.3048),
+        (["Time (ms)", "Altitude (m)"], "time", "Time (ms)", 0.001),
+        (["Tiempo (s)", "Altitud (m)"], "z", "Altitud (m)", 1.0),
+        (["Time to apogee (s)", "Time (s)"], "time", "Time (s)", 1.0),
+        (["Roll rate (rad/s)"], "roll_rate", "Roll rate (rad/s)", 180.0 / np.pi),
+    ],
+)
+def test_header_index_resolution(header, role, expected, factor):
+    index = csv_utils.build_header_index(header)
+    assert index.name(role) == expected
+    assert index.factor(role) == pytest.approx(factor)
+
+
+def test_cache_serves_column_subsets(flight_csv):
+    cache = csv_utils.ParsedColumnCache()
+    everything = csv_utils.load_openrocket_columns(flight_csv, cache=cache, use_sidecar=False)
+    subset = csv_utils.load_openrocket_columns(flight_csv, ["Time (s)"], cache=cache, use_sidecar=False)
+    assert cache.stats()["hits"] == 1
+    assert list(subset[1]) == ["Time (s)"]
+    assert subset[1]["Time (s)"] is everything[1]["Time (s)"]
+    assert not subset[1]["Time (s)"].flags.writeable
+
+
+def test_sidecar_round_trip(flight_csv):
+    names = ["Time (s)", "Altitude (m)"]
+    _header, parsed = csv_utils.load_openrocket_columns(flight_csv, names, cache=csv_utils.ParsedColumnCache())
+    assert csv_utils.find_sidecar(flight_csv)[0] is not None
+    header, loaded = csv_utils.read_sidecar(flight_csv, names)
+    assert header == list(HEADER)
+    for name in names:
+        np.testing.assert_array_equal(loaded[name], parsed[name])
+    events = csv_utils.load_openrocket_events(flight_csv, cache=csv_utils.ParsedColumnCache())
+    assert [name for name, _time in events][0] == "LAUNCH"
+
+
+def _assert_matches_legacy(columns, legacy):
+    assert set(columns) == set(legacy)
+    for name, expected in legacy.items():
+        expected = np.array([np.nan if value is None else value for value in expected])
+        np.testing.assert_array_equal(columns[name], expected)
+
+
+@pytest.mark.parametrize("blank_rows", [0, 25])
+def test_parse_matches_legacy_row_loop(tmp_path, blank_rows):
+    path = write_flight_csv(tmp_path / "flight.csv", rows=500, blank_leading_attitude=blank_rows)
+    lines = csv_utils.read_openrocket_csv_lines(path)
+    header, data_start = csv_utils.detect_header_and_data_start(lines)
+    legacy = legacy_parse_columns(lines, header, data_start)
+
+    _assert_matches_legacy(csv_utils.parse_openrocket_columns(lines, header, data_start), legacy)
+    _assert_matches_legacy(csv_utils.read_openrocket_columns(path, chunk_rows=64)[1], legacy)
+
+
+def test_parse_matches_legacy_on_malformed_rows(tmp_path):
+    path = tmp_path / "ragged.csv"
+    path.write_text(
+        "# Time (s),Altitude (m),Roll rate (°/s)\n"
+        "0.0,1.0,2.0\n"
+        "0.1,NaN,\n"
+        "# Event APOGEE occurred at t=0.1 seconds\n"
+        "0.2,abc,4.0\n"
+        "0.3,5.0\n",
+        encoding='latin-1',
+    )
+    lines = csv_utils.read_openrocket_csv_lines(path)
+    header, data_start = csv_utils.detect_header_and_data_start(lines)
+    legacy = legacy_parse_columns(lines, header, data_start)
+
+    _assert_matches_legacy(csv_utils.parse_openrocket_columns(lines, header, data_start), legacy)
+    _assert_matches_legacy(csv_utils.read_openrocket_columns(path)[1], legacy)
+
+
+def test_partial_sidecar_does_not_serve_all_columns(flight_csv):
+    names = ["Time (s)", "Altitude (m)"]
+    csv_utils.load_openrocket_columns(flight_csv, names, cache=csv_utils.ParsedColumnCache())
+    assert csv_utils.read_sidecar(flight_csv, names) is not None
+    assert csv_utils.read_sidecar(flight_csv) is None
+
+    cache = csv_utils.ParsedColumnCache()
+    header, columns = csv_utils.load_openrocket_columns(flight_csv, cache=cache)
+    assert set(columns) == set(HEADER)
+    assert set(cache.get(csv_utils.file_signature(flight_csv), None)[1]) == set(HEADER)
+    # The full parse widened the sidecar, which now serves every column.
+    assert set(csv_utils.read_sidecar(flight_csv)[1]) == set(HEADER)
+
+
+def test_concurrent_loads_share_cache_and_sidecar(flight_csv):
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = csv_utils.ParsedColumnCache(max_entries=2)
+    column_sets = [None, ["Time (s)"], ["Altitude (m)", "Time (s)"], ["Roll rate (°/s)"]] * 8
+
+    def load(names):
+        return csv_utils.load_openrocket_columns(flight_csv, names, cache=cache)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(load, column_sets))
+    for names, (header, columns) in zip(column_sets, results):
+        assert set(columns) == set(names or header)
+
+    assert not [path for path in flight_csv.parent.iterdir() if path.name.endswith(".tmp")]
+    header, columns = csv_utils.read_sidecar(flight_csv, ["Time (s)"])
+    assert len(columns["Time (s)"]) == 1000
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("velocity", "Total velocity (m/s)"),
+        ("Vertical velocity", "Vertical velocity (m/s)"),
+        ("vertical velocity (m/s)", "Vertical velocity (m/s)"),
+        ("Position", "Position East of launch (m)"),
+        ("north", "Position North of launch (m)"),
+        ("mach", None),
+    ],
+)
+def test_header_index_find_priority(query, expected):
+    index = csv_utils.build_header_index(list(HEADER))
+    idx = index.find(query)
+    assert (HEADER[idx] if idx >= 0 else None) == expected
+
+
+def test_header_index_find_prefers_exact_column():
+    index = csv_utils.build_header_index(["Time (s)", "Vertical velocity (m/s)", "Velocity (m/s)", "Total velocity (m/s)"])
+    assert index.find("velocity") == 2
+    assert index.find("Time") == 0
@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from open_rocket_animator.core import lod_utils
+from open_rocket_animator.operators import import_obj
+
+
+class _Part:
+    type = 'MESH'
+
+    def __init__(self, name):
+        self.name = name
+        self.selected = False
+
+    def select_set(self, state):
+        self.selected = state
+
+
+class _ViewLayerObjects(list):
+    active = None
+
+
+def _import_context(tmp_path, merge_parts, lod_levels=2):
+    obj_path = tmp_path / "rocket.obj"
+    obj_path.write_text("")
+    props = SimpleNamespace(
+        obj_filepath=str(obj_path),
+        import_apply_scale=True,
+        default_scale_factor=0.001,
+        import_merge_parts=merge_parts,
+        import_instance_parts=False,
+        import_decimate_ratio=1.0,
+        lod_levels=lod_levels,
+    )
+    return SimpleNamespace(
+        scene=SimpleNamespace(ora_props=props),
+        view_layer=SimpleNamespace(objects=_ViewLayerObjects()),
+        evaluated_depsgraph_get=lambda: None,
+    )
+
+
+@pytest.fixture
+def imported(monkeypatch):
+    # import_rocket_model returns two loose parts, or one merged body; LOD calls are recorded.
+    calls = []
+
+    def import_rocket_model(scene, path, scale, merge_parts, instance_parts, decimate_ratio):
+        parts = [_Part("Body")] if merge_parts else [_Part("Body"), _Part("Fins")]
+        report = {"parts": len(parts), "instanced": 0, "vertices_before": 8, "vertices_after": 8, "seconds": 0.0}
+        return parts[0], parts, report
+
+    monkeypatch.setattr(import_obj, "import_rocket_model", import_rocket_model)
+    monkeypatch.setattr(import_obj, "create_lod_objects", lambda obj, levels, depsgraph: calls.append(obj) or [])
+    return calls
+
+
+def _execute(context):
+    operator = import_obj.ORA_OT_ImportOBJ()
+    reports = []
+    operator.report = lambda level, message: reports.append((level, message))
+    return operator.execute(context), reports
+
+
+def test_lods_are_skipped_for_loose_parts(tmp_path, imported):
+    state, reports = _execute(_import_context(tmp_path, merge_parts=False))
+    assert state == {'FINISHED'}
+    assert imported == []
+    assert any(level == {'WARNING'} and "Merge Parts" in message for level, message in reports)
+
+
+def test_lods_are_built_on_the_merged_model(tmp_path, imported):
+    state, reports = _execute(_import_context(tmp_path, merge_parts=True))
+    assert state == {'FINISHED'}
+    assert [obj.name for obj in imported] == ["Body"]
+    assert all(level == {'INFO'} for level, _message in reports)
+
+
+class _ParentInverse:
+    def __init__(self, matrix):
+        self.matrix = np.asarray(matrix, dtype=np.float64)
+
+    def identity(self):
+        self.matrix = np.identity(4)
+
+
+class _LODMesh:
+    def __init__(self):
+        self.matrix = np.identity(4)
+
+    def transform(self, matrix):
+        self.matrix = np.asarray(matrix, dtype=np.float64) @ self.matrix
+
+
+def test_scale_lod_objects_bakes_the_factor_into_every_level():
+    lods = []
+    for level in (1, 2):
+        # transform_apply may have left its compensation in the parent inverse.
+        lod = SimpleNamespace(name=lod_utils.lod_object_name("Rocket", level), data=_LODMesh())
+        lod.matrix_parent_inverse = _ParentInverse(np.diag((1000.0, 1000.0, 1000.0, 1.0)))
+        lods.append(lod)
+    rocket = SimpleNamespace(name="Rocket", children=lods + [SimpleNamespace(name="Rocket_Fin")])
+    lod_utils.scale_lod_objects(rocket, 0.001)
+    for lod in lods:
+        np.testing.assert_allclose(lod.data.matrix, np.diag((0.001, 0.001, 0.001, 1.0)))
+        np.testing.assert_array_equal(lod.matrix_parent_inverse.matrix, np.identity(4))
@@ -0,0 +1,114 @@
+import bpy
+import fake_bpy
+import numpy as np
+import pytest
+
+from operator_context import curve_keys, existing_animation, make_context
+from open_rocket_animator.core import trajectory_utils
+from open_rocket_animator.operators import live
+from open_rocket_animator.operators.animation import read_animation_settings
+
+
+def _execute(operator_type, context):
+    operator = operator_type()
+    operator.report = lambda level, message: None
+    return operator.execute(context)
+
+
+def _muted(obj):
+    return {(fcurve.data_path, fcurve.array_index) for fcurve in obj.fcurves() if fcurve.mute}
+
+
+def _run_file_handlers(event):
+    for handler in list(getattr(bpy.app.handlers, event)):
+        handler("/tmp/flight.blend")
+
+
+@pytest.fixture(autouse=True)
+def stop_live_preview():
+    live.register()
+    yield
+    live.unregister()
+
+
+def test_start_mutes_flight_curves_and_stop_restores_them(flight_csv, target):
+    existing_animation(target)
+    context = make_context(flight_csv, target)
+    assert _execute(live.ORA_OT_LivePlaybackStart, context) == {'FINISHED'}
+    assert live.ora_live_playback_handler in bpy.app.handlers.frame_change_pre
+    assert _muted(target) == {("location", 0), ("location", 1), ("location", 2)}
+
+    context.scene.frame_current = 120
+    live.ora_live_playback_handler(context.scene)
+    assert target.location[2] == pytest.approx(1000.0 * np.sin(np.pi * 5.0 / 9.99), abs=2e-3)
+
+    assert _execute(live.ORA_OT_LivePlaybackStop, context) == {'FINISHED'}
+    assert not _muted(target)
+    assert target.rotation_mode == 'XYZ'
+    assert live.ora_live_playback_handler not in bpy.app.handlers.frame_change_pre
+
+
+def test_start_leaves_curves_muted_by_the_user(flight_csv, target):
+    existing_animation(target)
+    target.fcurves()[0].mute = True
+    context = make_context(flight_csv, target)
+    _execute(live.ORA_OT_LivePlaybackStart, context)
+    _execute(live.ORA_OT_LivePlaybackStart, context)
+    _execute(live.ORA_OT_LivePlaybackStop, context)
+    assert _muted(target) == {("location", 0)}
+
+
+def test_bake_matches_animate_from_csv(flight_csv, target):
+    existing_animation(target)
+    context = make_context(flight_csv, target, keyframe_mode='ADAPTIVE', location_tolerance=0.05, event_window=0.5)
+    _execute(live.ORA_OT_LivePlaybackStart, context)
+    assert _execute(live.ORA_OT_LivePlaybackBake, context) == {'FINISHED'}
+    assert not _muted(target)
+    assert target.name not in live._live_tracks
+
+    settings = read_animation_settings(context.scene, context.scene.ora_props, target)
+    plan, max_frame, _warnings = trajectory_utils.compute_animation_plan(settings)
+    assert context.scene.frame_end == max_frame
+    for data_path, keyframe_sets, _interpolation, _sampled in plan:
+        for index, keyframe_set in enumerate(keyframe_sets):
+            expected = np.stack(keyframe_set[:2], axis=1).astype(np.float32)
+            np.testing.assert_array_equal(curve_keys(target, data_path, index), expected)
+
+
+def test_loading_a_file_stops_every_preview(flight_csv, target):
+    existing_animation(target)
+    context = make_context(flight_csv, target)
+    _execute(live.ORA_OT_LivePlaybackStart, context)
+    _run_file_handlers("load_pre")
+    assert not live._live_tracks
+    assert not _muted(target)
+    assert live.ora_live_playback_handler not in bpy.app.handlers.frame_change_pre
+
+    # An object of the same name in the newly loaded file is left alone.
+    loaded = fake_bpy.Object(target.name)
+    bpy.data.objects[target.name] = loaded
+    context.scene.frame_current = 120
+    live.ora_live_playback_handler(context.scene)
+    assert loaded.location == [0.0, 0.0, 0.0]
+
+
+def test_saving_writes_the_curves_unmuted(flight_csv, target):
+    existing_animation(target)
+    _execute(live.ORA_OT_LivePlaybackStart, make_context(flight_csv, target))
+    _run_file_handlers("save_pre")
+    assert not _muted(target)
+    _run_file_handlers("save_post")
+    assert _muted(target) == {("location", 0), ("location", 1), ("location", 2)}
+
+
+def test_preview_follows_a_renamed_object(flight_csv, target):
+    context = make_context(flight_csv, target)
+    _execute(live.ORA_OT_LivePlaybackStart, context)
+    del bpy.data.objects[target.name]
+    target.name = "RenamedRocket"
+    bpy.data.objects[target.name] = target
+    context.scene.frame_current = 120
+    live.ora_live_playback_handler(context.scene)
+    assert target.location[2] == pytest.approx(1000.0 * np.sin(np.pi * 5.0 / 9.99), abs=2e-3)
+    assert _execute(live.ORA_OT_LivePlaybackStop, context) == {'FINISHED'}
+    assert not live._live_tracks
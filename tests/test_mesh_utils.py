@@ -0,0 +1,133 @@
+import contextlib
+from types import SimpleNamespace
+
+import bpy
+import fake_bpy
+import numpy as np
+import pytest
+
+from open_rocket_animator.core import mesh_utils
+
+
+class _Array:
+    def __init__(self, values):
+        self.values = np.asarray(values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def foreach_get(self, attribute, buffer):
+        buffer[:] = self.values.ravel()
+
+
+class _Mesh:
+    def __init__(self, name, co, faces):
+        self.name = name
+        self.vertices = _Array(np.asarray(co, dtype=np.float32))
+        self.polygons = _Array([len(face) for face in faces])
+        self.loops = _Array([index for face in faces for index in face])
+
+    @property
+    def users(self):
+        return sum(obj.data is self for obj in bpy.data.objects)
+
+    def copy(self):
+        return _Mesh(self.name + ".001", self.vertices.values, [])
+
+
+class _Matrix(np.ndarray):
+    def inverted(self):
+        return np.linalg.inv(self).view(_Matrix)
+
+
+class _MeshObject:
+    type = 'MESH'
+
+    def __init__(self, name, mesh):
+        self.name = name
+        self.data = mesh
+        self.scale = (1.0, 1.0, 1.0)
+        self.matrix_world = np.identity(4).view(_Matrix)
+        self.parent = None
+
+
+def _fin(angle):
+    # A triangular fin rotated about the body axis; every fin is a rigid copy.
+    co = np.array([[0.05, 0.0, 0.0], [0.15, 0.0, 0.0], [0.05, 0.0, 0.2], [0.06, 0.01, 0.1]])
+    cos, sin = np.cos(angle), np.sin(angle)
+    rotation = np.array([[cos, -sin, 0.0], [sin, cos, 0.0], [0.0, 0.0, 1.0]])
+    return co @ rotation.T, [(0, 1, 2), (0, 2, 3), (1, 2, 3)]
+
+
+def _nose(offset):
+    co = np.array([[0.0, 0.0, 1.3], [0.05, 0.0, 1.0], [0.0, 0.05, 1.0], [-0.05, 0.0, 1.0], [0.0, -0.05, 1.0]])
+    return co + (offset, 0.0, 0.0), [(0, 1, 2), (0, 2, 3), (0, 3, 4), (0, 4, 1)]
+
+
+def _body():
+    angles = np.linspace(0.0, 2.0 * np.pi, 6, endpoint=False)
+    ring = np.c_[0.05 * np.cos(angles), 0.05 * np.sin(angles), np.zeros(6)]
+    return np.vstack([ring, ring + (0.0, 0.0, 1.0)]), [(0, 1, 7, 6), (1, 2, 8, 7)]
+
+
+@pytest.fixture
+def fake_scene(monkeypatch):
+    # Just enough of bpy.data, bpy.ops and bpy.context for import_rocket_model.
+    objects = fake_bpy.IDCollection()
+    joins = []
+
+    def obj_import(filepath, global_scale):
+        for name, (co, faces) in imported_parts.items():
+            objects[name] = _MeshObject(name, _Mesh(name, co, faces))
+
+    def join():
+        context = joins[-1]
+        target = context["active_object"]
+        blocks = [target.data.vertices.values]
+        for obj in context["selected_editable_objects"]:
+            if obj is not target:
+                blocks.append(obj.data.vertices.values)
+                del objects[obj.name]
+        target.data.vertices = _Array(np.vstack(blocks))
+
+    @contextlib.contextmanager
+    def temp_override(**context):
+        joins.append(context)
+        yield
+
+    imported_parts = {}
+    monkeypatch.setattr(bpy.data, "objects", objects)
+    monkeypatch.setattr(bpy.data, "meshes", SimpleNamespace(remove=lambda mesh: None), raising=False)
+    monkeypatch.setattr(bpy.context, "temp_override", temp_override, raising=False)
+    monkeypatch.setattr(bpy.ops, "wm", SimpleNamespace(obj_import=obj_import), raising=False)
+    monkeypatch.setattr(bpy.ops, "object", SimpleNamespace(join=join), raising=False)
+    return imported_parts
+
+
+def test_merging_instanced_fins_keeps_the_instances_intact(fake_scene):
+    # The reference fin is imported first, so it heads the list of parts to join.
+    for index in range(3):
+        fake_scene[f"Fin{index}"] = _fin(index * 2.0 * np.pi / 3.0)
+    fake_scene["Body"] = _body()
+    main, parts, report = mesh_utils.import_rocket_model(None, "rocket.obj", merge_parts=True, instance_parts=True)
+
+    assert report["instanced"] == 2
+    assert main.name == "Body"
+    assert len(main.data.vertices) == 12 + 4
+    assert parts[1].data is parts[2].data
+    for obj in parts[1:]:
+        assert obj.parent is main
+        assert len(obj.data.vertices) == 4
+
+
+def test_merging_only_shared_parts_joins_into_a_copy(fake_scene):
+    for index in range(2):
+        fake_scene[f"Fin{index}"] = _fin(index * np.pi)
+        fake_scene[f"Nose{index}"] = _nose(index * 0.5)
+    main, parts, report = mesh_utils.import_rocket_model(None, "rocket.obj", merge_parts=True, instance_parts=True)
+
+    assert report["instanced"] == 2
+    assert len(main.data.vertices) == 4 + 5
+    for obj in parts[1:]:
+        assert obj.data is not main.data
+        assert len(obj.data.vertices) in (4, 5)
@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import bpy
+import numpy as np
+
+from operator_context import curve_keys, existing_animation, make_context
+from open_rocket_animator.operators.animation import ORA_OT_AnimateFromCSVModal
+
+
+def _run(operator, context, cancel_after_ticks=None):
+    operator.report = lambda level, message: None
+    assert operator.invoke(context, None) == {'RUNNING_MODAL'}
+    operator._thread.join()
+    ticks = 0
+    while True:
+        if cancel_after_ticks is not None and ticks == cancel_after_ticks:
+            return operator.modal(context, SimpleNamespace(type='ESC'))
+        state = operator.modal(context, SimpleNamespace(type='TIMER'))
+        ticks += 1
+        if state != {'RUNNING_MODAL'} and state != {'PASS_THROUGH'}:
+            return state
+
+
+def test_update_mode_writes_into_the_existing_action(flight_csv, target):
+    action = existing_animation(target)
+    assert _run(ORA_OT_AnimateFromCSVModal(), make_context(flight_csv, target, True)) == {'FINISHED'}
+    assert target.animation_data.action is action
+    assert len(curve_keys(target, "location", 2)) == 240
+    assert curve_keys(target, "scale", 0) is not None
+    assert curve_keys(target, "rotation_euler", 2) is not None
+
+
+def test_update_mode_cancel_restores_curve_keys(flight_csv, target, monkeypatch):
+    action = existing_animation(target)
+    before = curve_keys(target, "location", 0)
+    monkeypatch.setattr("open_rocket_animator.operators.animation.MODAL_TICK_BUDGET", 0.0)
+    operator = ORA_OT_AnimateFromCSVModal()
+    # Two ticks: the plan is picked up and two curves (one per tick) are written.
+    assert _run(operator, make_context(flight_csv, target, True), cancel_after_ticks=2) == {'CANCELLED'}
+    assert operator._written == 2 * 240
+    assert target.animation_data.action is action
+    np.testing.assert_array_equal(curve_keys(target, "location", 0), before)
+    assert curve_keys(target, "rotation_euler", 2) is None
+    assert curve_keys(target, "scale", 0) is not None
+
+
+def test_clear_mode_replaces_and_drops_the_old_action(flight_csv, target):
+    action = existing_animation(target)
+    assert _run(ORA_OT_AnimateFromCSVModal(), make_context(flight_csv, target, False)) == {'FINISHED'}
+    assert target.animation_data.action is not action
+    assert action not in bpy.data.actions
+    assert curve_keys(target, "scale", 0) is None
+
+
+def test_clear_mode_cancel_reattaches_the_old_action(flight_csv, target, monkeypatch):
+    action = existing_animation(target)
+    actions_before = len(bpy.data.actions)
+    monkeypatch.setattr("open_rocket_animator.operators.animation.MODAL_TICK_BUDGET", 0.0)
+    operator = ORA_OT_AnimateFromCSVModal()
+    assert _run(operator, make_context(flight_csv, target, False), cancel_after_ticks=2) == {'CANCELLED'}
+    assert operator._written == 2 * 240
+    assert len(bpy.data.actions) == actions_before
+    assert target.animation_data.action is action
+    assert action.users == 1
+    assert len(curve_keys(target, "location", 0)) == 2
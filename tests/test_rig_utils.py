@@ -0,0 +1,24 @@
+import numpy as np
+
+from open_rocket_animator.core import rig_utils
+
+
+def test_chase_camera_on_the_pad_uses_the_first_heading():
+    # Five frames on the pad, then a climb along +Y+Z; no jump at liftoff.
+    steps = np.concatenate((np.zeros(5), np.arange(1.0, 11.0)))
+    rocket = np.stack((np.zeros_like(steps), steps, steps), axis=1)
+    positions = rig_utils.chase_positions(rocket, distance=20.0, height=2.0)
+    launch = rocket[4] - np.array((0.0, 1.0, 1.0)) / np.sqrt(2.0) * 20.0 + (0.0, 0.0, 2.0)
+    np.testing.assert_allclose(positions[:5], np.tile(launch, (5, 1)))
+
+
+def test_chase_camera_holds_the_last_heading_after_landing():
+    rocket = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0], [2.0, 0.0, 0.0], [2.0, 0.0, 0.0]])
+    positions = rig_utils.chase_positions(rocket, distance=10.0, height=1.0)
+    np.testing.assert_allclose(positions[-1], (-8.0, 0.0, 1.0))
+
+
+def test_chase_camera_of_a_rocket_that_never_moves_stays_above_ground():
+    rocket = np.zeros((4, 3))
+    positions = rig_utils.chase_positions(rocket, distance=10.0, height=2.0)
+    np.testing.assert_allclose(positions, np.tile((0.0, -10.0, 2.0), (4, 1)))
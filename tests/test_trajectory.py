@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from open_rocket_animator.core import attitude_utils, csv_utils, trajectory_utils
+
+FPS = 24
+
+
+def _flight(flight_csv, **kwargs):
+    flight, _warnings = trajectory_utils.load_flight_data(flight_csv, use_sidecar=False, **kwargs)
+    return flight
+
+
+def test_frame_grid_covers_time_range():
+    frames, times = trajectory_utils.frame_grid(0.0, 9.99, FPS, frame_offset=10)
+    assert frames[0] == 10.0 and frames[-1] == 10.0 + 239
+    np.testing.assert_allclose(times, (frames - 10.0) / FPS)
+    frames, _times = trajectory_utils.frame_grid(0.0, 1.0, FPS, subframes=4)
+    assert len(frames) == FPS * 4 + 1
+
+
+def test_resample_is_exact_on_linear_data_and_skips_nan():
+    times = np.array([0.0, 1.0, np.nan, 2.0, 2.0, 3.0])
+    values = np.array([0.0, 10.0, 99.0, 15.0, 20.0, 30.0])
+    result = trajectory_utils.resample_channel(times, values, np.array([0.5, 2.0, 2.5, 4.0]))
+    np.testing.assert_allclose(result[:3], [5.0, 20.0, 25.0])
+    assert np.isnan(result[3])
+
+
+def test_resample_unwraps_angles_across_the_seam():
+    result = trajectory_utils.resample_channel([0.0, 1.0], [350.0, 10.0], np.array([0.5]), period=360.0)
+    np.testing.assert_allclose(result, [360.0])
+
+
+def test_integrated_roll_matches_constant_rate(flight_csv):
+    flight = _flight(flight_csv, animate_roll=True)
+    samples = trajectory_utils.sample_flight(flight, FPS)
+    np.testing.assert_allclose(samples["rotation"][2], np.radians(90.0) * samples["sample_times"], atol=1e-9)
+
+
+def test_location_samples_follow_the_csv(flight_csv):
+    flight = _flight(flight_csv)
+    samples = trajectory_utils.sample_flight(flight, FPS)
+    expected = 1000.0 * np.sin(np.pi * samples["sample_times"] / 9.99)
+    # Linear interpolation between 0.01 s rows is off by at most ~dt^2 * |z''| / 8.
+    np.testing.assert_allclose(samples["location"][2], expected, atol=2e-3)
+    assert len(samples["frames"]) == 240
+
+
+def test_attitude_modes_agree_without_roll(flight_csv):
+    flight = _flight(flight_csv, animate_attitude=True)
+    legacy = trajectory_utils.sample_flight(flight, FPS, rotation_mode='EULER')["rotation"]
+    quaternion = trajectory_utils.sample_flight(flight, FPS, rotation_mode='QUATERNION')["rotation"]
+    unwrapped = trajectory_utils.sample_flight(flight, FPS, rotation_mode='EULER_UNWRAPPED')["rotation"]
+
+    expected = attitude_utils.euler_to_quaternions(legacy[0], legacy[1], legacy[2])
+    dots = np.abs(np.einsum('ij,ij->i', np.stack(quaternion, axis=1), expected))
+    np.testing.assert_allclose(dots, 1.0, atol=1e-9)
+    # The azimuth crosses 360 degrees; the unwrapped curves must not jump.
+    for channel in unwrapped:
+        assert np.abs(np.diff(channel)).max() < 0.1
+
+
+@pytest.mark.parametrize("mode", ['STEP', 'ADAPTIVE', 'BEZIER_FIT'])
+def test_animation_plan_key_arrays(flight_csv, mode):
+    settings = {
+        "csv_path": flight_csv,
+        "animate_roll": True,
+        "animate_attitude": False,
+        "use_sidecar": False,
+        "fps": FPS,
+        "frame_offset": 0,
+        "subframes": 1,
+        "base_euler": (0.0, 0.0, 0.0),
+        "rotation_mode": 'EULER',
+        "keyframe_mode": mode,
+        "keyframe_step": 1,
+        "location_tolerance": 0.01,
+        "rotation_tolerance": 0.001,
+        "event_window": 0.5,
+    }
+    plan, max_frame, _warnings = trajectory_utils.compute_animation_plan(settings)
+    assert max_frame == 239
+    assert [entry[0] for entry in plan] == ["location", "rotation_euler"]
+    location_sets = plan[0][1]
+    assert len(location_sets) == 3
+    for keyframe_set in location_sets:
+        frames, values = keyframe_set[0], keyframe_set[1]
+        assert frames[0] == 0.0 and frames[-1] == 239.0
+        assert np.all(np.diff(frames) > 0.0)
+        assert len(frames) == len(values)
+    if mode == 'STEP':
+        assert len(location_sets[2][0]) == 240
+    else:
+        assert len(location_sets[2][0]) < 240
+
+
+def test_quaternions_to_euler_keeps_nan_samples_local():
+    angles = np.linspace(0.0, 4.0 * np.pi, 50)
+    quats = attitude_utils.euler_to_quaternions(np.zeros(50), np.zeros(50), angles)
+    quats[:5] = np.nan
+    euler_z = attitude_utils.quaternions_to_euler(quats)[2]
+    assert np.isnan(euler_z[:5]).all()
+    np.testing.assert_allclose(euler_z[5:] - euler_z[5], angles[5:] - angles[5], atol=1e-9)
+
+
+def test_attitude_with_blank_leading_rows(tmp_path):
+    from csv_factory import write_flight_csv
+
+    path = write_flight_csv(tmp_path / "blank.csv", rows=1000, blank_leading_attitude=100)
+    flight = _flight(path, animate_attitude=True)
+    rotation = trajectory_utils.sample_flight(flight, FPS, rotation_mode='EULER_UNWRAPPED')["rotation"]
+    for channel in rotation:
+        assert np.isnan(channel[:24]).all()
+        assert np.isfinite(channel[25:]).all()
+        assert np.abs(np.diff(channel[25:])).max() < 0.1
+
+
+def test_telemetry_columns_resolve_by_priority(flight_csv):
+    flight, warnings = trajectory_utils.load_flight_data(
+        flight_csv, use_sidecar=False, telemetry=[("velocity", "speed"), ("Vertical velocity", "climb"), ("mach", "mach")]
+    )
+    _header, columns = csv_utils.read_openrocket_columns(flight_csv)
+    np.testing.assert_array_equal(flight["telemetry:speed"], columns["Total velocity (m/s)"])
+    np.testing.assert_array_equal(flight["telemetry:climb"], columns["Vertical velocity (m/s)"])
+    assert "telemetry:mach" not in flight
+    assert warnings == ["Telemetry column 'mach' not found. Skipping 'mach'."]